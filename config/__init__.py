@@ -1 +1,5 @@
-# Django configuration package
\ No newline at end of file
+# Django configuration package
+
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -0,0 +1,41 @@
+"""
+Logging handlers for fwords-backend project.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+
+class QueuedStreamHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to a queue; a QueueListener thread formats and writes them to the stream.
+    The listener is started lazily per process so it survives uWSGI forking workers.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self._listener = None
+        self._listener_pid = None
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread, not in the request
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        return record
+
+    def emit(self, record):
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self):
+        self._listener = logging.handlers.QueueListener(self.queue, self.target)
+        self._listener.start()
+        self._listener_pid = os.getpid()
+        atexit.register(self._listener.stop)
@@ -0,0 +1,22 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    Types orjson does not know (lazy strings, Decimal, UUID, ...) fall back to DRF's encoder
+    """
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        # Indented output is only requested by hand, the stdlib path handles it
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # OPT_UTC_Z: UTC datetimes end in 'Z' like DRF's encoder, not '+00:00'
+        return orjson.dumps(data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
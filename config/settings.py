@@ -8,6 +8,8 @@ import os
 from pathlib import Path
 from datetime import timedelta
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -55,6 +57,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'users.middleware.ProgressAccessLogMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -86,6 +89,46 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', 'postgres'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Keep connections open between requests so each uWSGI worker reuses
+        # its session (and the statements psycopg has prepared on it) instead
+        # of reconnecting per request. Set DB_CONN_MAX_AGE=0 behind a
+        # transaction-pooling PgBouncer.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # psycopg 3 only prepares statements for server-side bound queries;
+            # repeated ORM queries are then planned once per connection.
+            'server_side_binding': True,
+        },
+        # Build the test database straight from the current models instead of
+        # replaying every migration. Data migrations are not run, so tests must
+        # create any seed rows they rely on themselves.
+        'TEST': {
+            'MIGRATE': False,
+        },
+    }
+}
+
+# Cache
+# Cached profiles, word stats and language ids are invalidated from whichever
+# uWSGI worker handled the write, so outside of DEBUG the cache must be shared
+# between processes. Redis is already required by Celery.
+LOCMEM_CACHE_BACKEND = 'django.core.cache.backends.locmem.LocMemCache'
+CACHE_BACKEND = os.environ.get(
+    'CACHE_BACKEND',
+    LOCMEM_CACHE_BACKEND if DEBUG else 'django.core.cache.backends.redis.RedisCache',
+)
+if CACHE_BACKEND == LOCMEM_CACHE_BACKEND and not DEBUG:
+    raise ImproperlyConfigured(
+        'LocMemCache is per-process; set CACHE_BACKEND to a shared cache when DEBUG is off.'
+    )
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.environ.get(
+            'CACHE_LOCATION',
+            '' if CACHE_BACKEND == LOCMEM_CACHE_BACKEND else 'redis://localhost:6379/1',
+        ),
     }
 }
 
@@ -134,7 +177,12 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'config.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'config.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
@@ -174,15 +222,26 @@ SIMPLE_JWT = {
 }
 
 # Email Configuration
-#EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+# Set EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend to send real mail
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
 EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
 EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', '10'))
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@fwords.com')
 
+# Celery
+# Tasks go through the broker to a worker (celery -A config worker, started by
+# uWSGI, see uwsgi.ini). CELERY_TASK_ALWAYS_EAGER=True runs them in-process
+# instead, inside the request that queued them.
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = os.environ.get('CELERY_TASK_ALWAYS_EAGER', 'False').lower() == 'true'
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TIMEZONE = TIME_ZONE
+
 # CORS Settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:8081",
@@ -196,5 +255,39 @@ SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
 X_FRAME_OPTIONS = 'DENY'
 
+# Logging
+# Records are queued by the request thread and formatted/written by a
+# background listener thread (see config.log_handlers).
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '[%(asctime)s] %(levelname)s - %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S',
+        },
+    },
+    'handlers': {
+        'console': {
+            '()': 'config.log_handlers.QueuedStreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        # One handler for the whole app; child loggers only tune their level
+        'users': {
+            'handlers': ['console'],
+            'level': os.environ.get('USERS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+        'users.profile': {
+            'level': os.environ.get('PROFILE_LOG_LEVEL', 'INFO'),
+        },
+        'users.progress': {
+            'level': os.environ.get('PROGRESS_LOG_LEVEL', 'INFO'),
+        },
+    },
+}
+
 # Activation token expiry (in hours)
 ACTIVATION_TOKEN_EXPIRY_HOURS = 24
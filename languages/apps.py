@@ -5,3 +5,6 @@ class LanguagesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'languages'
     verbose_name = 'Языки'
+
+    def ready(self):
+        import languages.signals
@@ -0,0 +1,23 @@
+"""Cache helpers for language lookups"""
+from django.core.cache import cache
+
+# Receivers drop the key on every Language change. With a per-process cache
+# (LocMemCache under DEBUG) other workers only see it once the entry expires.
+LANGUAGE_IDS_TTL = 300
+LANGUAGE_IDS_KEY = 'languages:ids_by_code'
+
+
+def get_language_ids():
+    """Return a {code: id} mapping of all languages, loading it on a miss"""
+    from .models import Language
+
+    language_ids = cache.get(LANGUAGE_IDS_KEY)
+    if language_ids is None:
+        language_ids = dict(Language.objects.values_list('code', 'id'))
+        cache.set(LANGUAGE_IDS_KEY, language_ids, LANGUAGE_IDS_TTL)
+    return language_ids
+
+
+def invalidate_language_ids():
+    """Drop the cached code to id mapping"""
+    cache.delete(LANGUAGE_IDS_KEY)
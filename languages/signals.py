@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import invalidate_language_ids
+from .models import Language
+
+
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+def language_changed(sender, **kwargs):
+    """
+    Drop the cached code to id mapping when a language is added, renamed or removed
+    """
+    invalidate_language_ids()
@@ -0,0 +1,78 @@
+"""Cache helpers for user profile and statistics reads"""
+from django.core.cache import cache
+
+PROFILE_CACHE_TTL = 300
+
+
+def _profile_key(user_id):
+    return f'user:{user_id}:profile'
+
+
+def get_profile(user_id):
+    """Return cached serialized profile data or None on a miss"""
+    return cache.get(_profile_key(user_id))
+
+
+def set_profile(user_id, data, ttl=PROFILE_CACHE_TTL):
+    """Store serialized profile data for a user"""
+    cache.set(_profile_key(user_id), data, ttl)
+
+
+def invalidate_profile(user_id):
+    """Drop cached profile data for a user"""
+    cache.delete(_profile_key(user_id))
+
+
+# Only bad tokens are cached. A valid token is used by its first request and
+# turns invalid right away, so caching its row would not save a query.
+INVALID_ACTIVATION_TOKEN_TTL = 300
+INVALID_ACTIVATION_TOKEN = 'INVALID'
+
+
+def _activation_token_key(token):
+    return f'activation:{token}'
+
+
+def get_activation_token(token):
+    """Return INVALID_ACTIVATION_TOKEN for a known-bad token, or None"""
+    return cache.get(_activation_token_key(token))
+
+
+def mark_activation_token_invalid(token):
+    """Remember that a token is unknown or already used"""
+    cache.set(_activation_token_key(token), INVALID_ACTIVATION_TOKEN, INVALID_ACTIVATION_TOKEN_TTL)
+
+
+WORDS_STATS_TTL = 300
+WORDS_STATS_PERIOD_TTL = {'today': 60, 'all': 3600}
+
+
+def _words_stats_version_key(user_id):
+    return f'user:{user_id}:words_stats:version'
+
+
+def _words_stats_key(user_id, period, language, include, day):
+    # The version is bumped on every change, which retires all of the user's entries at once
+    version = cache.get(_words_stats_version_key(user_id), 0)
+    breakdowns = ','.join(sorted(include))
+    return f'user:{user_id}:words_stats:{version}:{period}:{language or "all"}:{breakdowns}:{day.isoformat()}'
+
+
+def get_words_stats(user_id, period, language, include, day):
+    """Return cached words statistics response data or None on a miss"""
+    return cache.get(_words_stats_key(user_id, period, language, include, day))
+
+
+def set_words_stats(user_id, period, language, include, day, data):
+    """Store words statistics response data, longer for slower-moving periods"""
+    ttl = WORDS_STATS_PERIOD_TTL.get(period, WORDS_STATS_TTL)
+    cache.set(_words_stats_key(user_id, period, language, include, day), data, ttl)
+
+
+def invalidate_words_stats(user_id):
+    """Retire every cached words statistics entry for a user"""
+    key = _words_stats_version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
@@ -0,0 +1,40 @@
+import logging
+import time
+
+from django.utils.deprecation import MiddlewareMixin
+
+progress_logger = logging.getLogger('users.progress')
+
+
+class ProgressAccessLogMiddleware(MiddlewareMixin):
+    """Log a single access record, with timing, for every progress API request"""
+    PATH_PREFIX = '/api/v1/progress/'
+
+    def process_request(self, request):
+        if request.path.startswith(self.PATH_PREFIX):
+            request._progress_start = time.perf_counter_ns()
+
+    def process_response(self, request, response):
+        start = getattr(request, '_progress_start', None)
+        if start is None:
+            return response
+
+        level = logging.ERROR if response.status_code >= 500 else logging.INFO
+        if progress_logger.isEnabledFor(level):
+            duration_ms = (time.perf_counter_ns() - start) / 1_000_000
+            user = getattr(request, 'user', None)
+            user_info = f"{user.email} (ID: {user.id})" if user and user.is_authenticated else "Anonymous"
+            progress_logger.log(
+                level,
+                "PROGRESS %s %s | Status: %s | User: %s | IP: %s | Query: %s | Duration: %.1f ms",
+                request.method, request.path, response.status_code, user_info,
+                self.get_client_ip(request), request.META.get('QUERY_STRING') or 'None', duration_ms
+            )
+        return response
+
+    def get_client_ip(self, request):
+        """Get client IP address from request"""
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            return x_forwarded_for.split(',')[0].strip()
+        return request.META.get('REMOTE_ADDR', 'Unknown')
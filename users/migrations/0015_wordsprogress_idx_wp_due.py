@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('users', '0014_alter_quizprogress_options_and_more'),
+        ('words', '0005_alter_word_audio_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wordsprogress',
+            index=models.Index(condition=models.Q(('status__in', ['new', 'learning'])), fields=['user', 'next_review'], name='idx_wp_due'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('users', '0015_wordsprogress_idx_wp_due'),
+        ('words', '0005_alter_word_audio_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wordsprogress',
+            index=models.Index(fields=['user', 'date_learned', 'status'], name='idx_wp_user_date_status'),
+        ),
+    ]
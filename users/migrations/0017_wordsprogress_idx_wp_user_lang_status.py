@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('users', '0016_wordsprogress_idx_wp_user_date_status'),
+        ('words', '0005_alter_word_audio_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wordsprogress',
+            index=models.Index(fields=['user', 'target_language', 'status'], name='idx_wp_user_lang_status'),
+        ),
+    ]
@@ -97,6 +97,11 @@ class EmailActivationToken(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_used = models.BooleanField(default=False)
 
+    @staticmethod
+    def expiry_cutoff():
+        """Tokens created before this moment are expired"""
+        return timezone.now() - timedelta(hours=getattr(settings, 'ACTIVATION_TOKEN_EXPIRY_HOURS', 24))
+
     def is_expired(self):
         """Check if token is expired"""
         expiry_time = self.created_at + timedelta(hours=getattr(settings, 'ACTIVATION_TOKEN_EXPIRY_HOURS', 24))
@@ -171,6 +176,18 @@ class WordsProgress(models.Model):
     class Meta:
         unique_together = ('user', 'word', 'target_language')
         ordering = ['-updated_at']
+        indexes = [
+            # Words due for review: filtered by user and status, walked by next_review
+            models.Index(
+                fields=['user', 'next_review'],
+                name='idx_wp_due',
+                condition=models.Q(status__in=['new', 'learning']),
+            ),
+            # Words learned on a given day: one range scan per user and date
+            models.Index(fields=['user', 'date_learned', 'status'], name='idx_wp_user_date_status'),
+            # Per-language status counts: stats breakdowns and language progress totals
+            models.Index(fields=['user', 'target_language', 'status'], name='idx_wp_user_lang_status'),
+        ]
         verbose_name='Прогресс изучения слов'
         verbose_name_plural='Прогресс изучения слов'
 
@@ -0,0 +1,19 @@
+from rest_framework.pagination import CursorPagination
+
+
+class WordsProgressCursorPagination(CursorPagination):
+    """
+    Keyset pagination for words progress.
+    Due-for-review lists walk next_review (never NULL there) so they can use the
+    partial (user, next_review) index; other lists walk the immutable created_at.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-created_at', '-id')
+    due_ordering = ('next_review', 'id')
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get('due_for_review', '').lower() == 'true':
+            return self.due_ordering
+        return self.ordering
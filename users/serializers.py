@@ -1,3 +1,5 @@
+import logging
+
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
@@ -5,6 +7,8 @@ from django.core.exceptions import ValidationError
 from .models import User, LanguageProgress, WordsProgress, QuizProgress
 from languages.serializers import LanguageSerializer
 
+profile_logger = logging.getLogger('users.profile')
+
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
@@ -71,6 +75,15 @@ class UserLoginSerializer(serializers.Serializer):
         return attrs
 
 
+class LoginUserSerializer(serializers.ModelSerializer):
+    """Minimal user representation returned with login tokens"""
+
+    class Meta:
+        model = User
+        fields = ('id', 'email', 'name')
+        read_only_fields = fields
+
+
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for user profile with language preferences"""
 
@@ -129,7 +142,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         """Custom update method with language field mapping and logging"""
-        print(f"[SERIALIZER DEBUG] Update called with validated_data: {validated_data}")
+        profile_logger.debug("Profile serializer update for user %s, fields: %s", instance.pk, list(validated_data))
 
         # If username is provided, use it as name
         if 'username' in validated_data and validated_data['username']:
@@ -151,27 +164,23 @@ class UserProfileSerializer(serializers.ModelSerializer):
                     try:
                         language = Language.objects.get(id=language_id, enabled=True)
                         setattr(instance, language_field, language)
-                        print(f"[SERIALIZER DEBUG] Setting {language_field} = {language}")
                     except Language.DoesNotExist:
-                        print(f"[SERIALIZER ERROR] Language with ID {language_id} not found")
+                        profile_logger.warning("Language with ID %s not found for %s", language_id, language_field)
                 else:
                     setattr(instance, language_field, None)
-                    print(f"[SERIALIZER DEBUG] Setting {language_field} = None")
 
         # Update other fields
         for field_name, value in validated_data.items():
-            print(f"[SERIALIZER DEBUG] Setting {field_name} = {value}")
             setattr(instance, field_name, value)
 
         # Save the instance
         instance.save()
-        print(f"[SERIALIZER DEBUG] Instance saved successfully")
 
-        # Log final state
-        print(f"[SERIALIZER DEBUG] Final language states:")
-        print(f"  - interface_language: {getattr(instance, 'interface_language', 'NOT_SET')}")
-        print(f"  - native_language: {getattr(instance, 'native_language', 'NOT_SET')}")
-        print(f"  - active_language: {getattr(instance, 'active_language', 'NOT_SET')}")
+        # Log final state; *_id attributes need no queries
+        profile_logger.debug(
+            "Profile saved for user %s: interface_language=%s, native_language=%s, active_language=%s",
+            instance.pk, instance.interface_language_id, instance.native_language_id, instance.active_language_id
+        )
 
         return instance
 
@@ -195,14 +204,16 @@ class ResendActivationSerializer(serializers.Serializer):
     """Serializer for resending activation email"""
     email = serializers.EmailField()
 
-    def validate_email(self, value):
+    def validate(self, attrs):
         try:
-            user = User.objects.get(email=value)
-            if user.is_email_verified:
-                raise serializers.ValidationError('Email is already verified')
-            return value
+            user = User.objects.get(email=attrs['email'])
         except User.DoesNotExist:
-            raise serializers.ValidationError('User with this email does not exist')
+            raise serializers.ValidationError({'email': 'User with this email does not exist'})
+        if user.is_email_verified:
+            raise serializers.ValidationError({'email': 'Email is already verified'})
+        # Hand the user to the view so it is not fetched twice
+        attrs['user'] = user
+        return attrs
 
 
 class LanguageProgressSerializer(serializers.ModelSerializer):
@@ -380,6 +391,15 @@ class WordsProgressSerializer(serializers.ModelSerializer):
         return instance
 
 
+class BulkReviewUpdateSerializer(serializers.Serializer):
+    """Serializer for a single item of a bulk review update"""
+    id = serializers.IntegerField(min_value=1)
+    correct = serializers.BooleanField(default=False)
+    status = serializers.ChoiceField(choices=WordsProgress.STATUS_CHOICES, required=False)
+    interval = serializers.IntegerField(min_value=0, required=False)
+    next_review = serializers.DateTimeField(required=False)
+
+
 class QuizProgressSerializer(serializers.ModelSerializer):
     """Serializer for quiz progress"""
     language = LanguageSerializer(read_only=True)
@@ -2,7 +2,8 @@ from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.db.models import Q, Count
 from django.utils import timezone
-from .models import WordsProgress, LanguageProgress
+from .cache import invalidate_profile, invalidate_words_stats
+from .models import User, WordsProgress, LanguageProgress
 from words.models import Word, DifficultyLevel
 import logging
 
@@ -206,4 +207,21 @@ def log_word_milestone(sender, instance, created, **kwargs):
                 )
 
     except Exception as e:
-        logger.error(f"Error in log_word_milestone signal: {str(e)}")
\ No newline at end of file
+        logger.error(f"Error in log_word_milestone signal: {str(e)}")
+
+
+@receiver(post_save, sender=User)
+def user_profile_changed(sender, instance, **kwargs):
+    """
+    Drop the cached profile so edits made outside the API (admin, shell) are not served stale
+    """
+    invalidate_profile(instance.pk)
+
+
+@receiver(post_save, sender=WordsProgress)
+@receiver(post_delete, sender=WordsProgress)
+def words_stats_changed(sender, instance, **kwargs):
+    """
+    Drop the owner's cached words statistics when a progress row changes
+    """
+    invalidate_words_stats(instance.user_id)
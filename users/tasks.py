@@ -0,0 +1,87 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from kombu.exceptions import OperationalError
+
+from .models import EmailActivationToken
+
+logger = logging.getLogger(__name__)
+progress_logger = logging.getLogger('users.progress')
+
+
+def send_activation_email(token, domain):
+    """Send activation email for a token"""
+    user = token.user
+    activation_url = f"http://{domain}/api/auth/activate/{token.token}/"
+
+    subject = 'Activate your ForeignWords account'
+    message = f"""
+    Hi {user.name or user.email},
+
+    Thank you for registering with ForeignWords!
+
+    Please click the link below to activate your account:
+    {activation_url}
+
+    This link will expire in 24 hours.
+
+    If you didn't create this account, please ignore this email.
+
+    Best regards,
+    ForeignWords Team
+    """
+
+    send_mail(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        [user.email],
+        fail_silently=False,
+    )
+
+
+@shared_task(bind=True, max_retries=3)
+def send_activation_email_task(self, user_id, token_id, domain):
+    """
+    Send activation email for the given token.
+    A worker retries SMTP failures with backoff; when the task runs eagerly,
+    inside the request, the email gets a single attempt and failures are logged.
+    """
+    token = EmailActivationToken.objects.select_related('user').get(id=token_id, user_id=user_id)
+    try:
+        send_activation_email(token, domain)
+    except OSError as exc:  # SMTPException, refused connections and timeouts
+        if self.request.is_eager:
+            logger.warning("Failed to send activation email for token %s: %s", token_id, exc)
+            return
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+def queue_activation_email(token, domain):
+    """
+    Queue the activation email for a token.
+    The user and token are already committed, so an unreachable broker is logged
+    instead of failing the request; the user can ask for the email again.
+    """
+    try:
+        send_activation_email_task.delay(token.user_id, token.id, domain)
+    except OperationalError as e:
+        logger.error("Could not queue activation email for token %s: %s", token.id, e)
+
+
+@shared_task
+def log_bulk_review_stats(user_id, stats):
+    """Log the statistics and milestones of one bulk review session"""
+    for milestone in stats['milestones']:
+        progress_logger.info(
+            "PROGRESS BULK_UPDATE_MILESTONE | User ID: %s | Word '%s' (ID: %s) advanced to %s",
+            user_id, milestone['word'], milestone['id'], milestone['status']
+        )
+
+    status_changes = ", ".join(f"{change}: {count}" for change, count in stats['status_changes'].items()) or "None"
+    progress_logger.info(
+        "PROGRESS BULK_UPDATE_STATS | User ID: %s | Correct answers: %s, Incorrect: %s, Status changes: %s",
+        user_id, stats['correct_answers'], stats['incorrect_answers'], status_changes
+    )
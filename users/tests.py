@@ -1,37 +1,96 @@
-from django.test import TestCase
+import functools
+import importlib
+import inspect
+import json
+import logging
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.apps import apps
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
 from django.core import mail
-from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 from rest_framework import status
 from django.contrib.auth import get_user_model
-from .models import EmailActivationToken
+from languages.models import Language
+from parts_of_speech.models import PartOfSpeech
+from words.models import Word
+from .models import EmailActivationToken, LanguageProgress, WordsProgress
+from .tasks import log_bulk_review_stats
+from .views import UserProfileView, WordsProgressBulkUpdateView
+
+# Run Celery tasks in-process so the tests need neither a broker nor a worker
+eager_celery = override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+
+
+def setUpModule():
+    eager_celery.enable()
+
+
+def tearDownModule():
+    eager_celery.disable()
 
-User = get_user_model()
 
+class UserModelMixin:
+    """Resolve the user model lazily, once per test class"""
 
-class UserRegistrationTestCase(APITestCase):
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _user_model(cls):
+        return get_user_model()
+
+
+class UserRegistrationTestCase(UserModelMixin, APITestCase):
     """Test cases for user registration"""
 
-    def setUp(self):
-        self.registration_url = reverse('user-register')
-        self.valid_user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.registration_url = reverse('user-register')
+        cls.valid_user_data = {
             'email': 'test@example.com',
             'username': 'testuser',
             'password': 'testpassword123',
             'password_confirm': 'testpassword123'
         }
+        # The valid payload never changes, so encode it once for the whole class
+        cls.valid_body = json.dumps(cls.valid_user_data).encode()
 
     def test_user_registration_success(self):
         """Test successful user registration"""
-        response = self.client.post(self.registration_url, self.valid_user_data)
+        response = self.client.post(self.registration_url, self.valid_body, content_type='application/json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(User.objects.filter(email='test@example.com').exists())
+        self.assertTrue(self._user_model().objects.filter(email='test@example.com').exists())
 
         # Check if activation email was sent
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn('Activate your ForeignWords account', mail.outbox[0].subject)
 
+    def test_user_registration_survives_smtp_failure(self):
+        """Test an eagerly run activation email is tried once and does not fail registration"""
+        with mock.patch('users.tasks.send_mail', side_effect=smtplib.SMTPException('down')) as send_mail:
+            response = self.client.post(self.registration_url, self.valid_body, content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(send_mail.call_count, 1)
+
+    def test_user_registration_survives_unreachable_broker(self):
+        """Test a failed email enqueue is logged and registration still succeeds"""
+        with mock.patch('users.tasks.send_activation_email_task.delay', side_effect=OperationalError('broker down')), \
+                self.assertLogs('users.tasks', 'ERROR'):
+            response = self.client.post(self.registration_url, self.valid_body, content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(EmailActivationToken.objects.filter(user__email='test@example.com').exists())
+
     def test_user_registration_password_mismatch(self):
         """Test registration with password mismatch"""
         data = self.valid_user_data.copy()
@@ -42,23 +101,23 @@ class UserRegistrationTestCase(APITestCase):
 
     def test_user_registration_duplicate_email(self):
         """Test registration with duplicate email"""
-        User.objects.create_user(
+        # Plain create() skips set_password; the request is rejected on the unique email anyway
+        self._user_model().objects.create(
             email='test@example.com',
-            username='existinguser',
-            password='password123'
+            name='existinguser',
+            password='!unusable'
         )
 
-        response = self.client.post(self.registration_url, self.valid_user_data)
+        response = self.client.post(self.registration_url, self.valid_body, content_type='application/json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
-class EmailActivationTestCase(APITestCase):
+class EmailActivationTestCase(UserModelMixin, APITestCase):
     """Test cases for email activation"""
 
     def setUp(self):
-        self.user = User.objects.create_user(
+        self.user = self._user_model().objects.create_user(
             email='test@example.com',
-            username='testuser',
             password='password123',
             is_active=False
         )
@@ -87,14 +146,85 @@ class EmailActivationTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_email_activation_expired_token(self):
+        """Test an expired token neither activates the user nor is consumed"""
+        EmailActivationToken.objects.filter(pk=self.activation_token.pk).update(
+            created_at=EmailActivationToken.expiry_cutoff() - timedelta(minutes=1)
+        )
+        url = reverse('activate-email', kwargs={'token': self.activation_token.token})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('expired', response.data['error'])
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+
+    def test_email_activation_reused_token_skips_database(self):
+        """A used token is remembered as invalid and rejected without querying"""
+        url = reverse('activate-email', kwargs={'token': self.activation_token.token})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ResendActivationTestCase(UserModelMixin, APITestCase):
+    """Test cases for resending the activation email"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._user_model().objects.create_user(
+            email='test@example.com',
+            password='password123',
+            is_active=False
+        )
+        cls.resend_url = reverse('resend-activation')
+
+    def test_resend_activation_issues_new_token(self):
+        """Test resending creates a token and mails it"""
+        response = self.client.post(self.resend_url, {'email': 'test@example.com'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user.activation_tokens.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_resend_activation_survives_unreachable_broker(self):
+        """Test a failed email enqueue is logged and resend still answers 200"""
+        with mock.patch('users.tasks.send_activation_email_task.delay', side_effect=OperationalError('broker down')), \
+                self.assertLogs('users.tasks', 'ERROR'):
+            response = self.client.post(self.resend_url, {'email': 'test@example.com'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user.activation_tokens.count(), 1)
+
+    def test_resend_activation_retires_previous_tokens(self):
+        """Only the newest token stays usable after a resend"""
+        old_token = EmailActivationToken.objects.create(user=self.user)
+
+        self.client.post(self.resend_url, {'email': 'test@example.com'}, format='json')
 
-class UserLoginTestCase(APITestCase):
+        old_token.refresh_from_db()
+        self.assertTrue(old_token.is_used)
+        self.assertEqual(self.user.activation_tokens.filter(is_used=False).count(), 1)
+
+    def test_resend_activation_verified_email(self):
+        """Test resending for an already verified email"""
+        self.user.is_email_verified = True
+        self.user.save()
+
+        response = self.client.post(self.resend_url, {'email': 'test@example.com'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
+
+
+class UserLoginTestCase(UserModelMixin, APITestCase):
     """Test cases for user login"""
 
     def setUp(self):
-        self.user = User.objects.create_user(
+        self.user = self._user_model().objects.create_user(
             email='test@example.com',
-            username='testuser',
             password='password123',
             is_active=True,
             is_email_verified=True
@@ -136,3 +266,395 @@ class UserLoginTestCase(APITestCase):
 
         response = self.client.post(self.login_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class UserProfileTestCase(UserModelMixin, APITestCase):
+    """Test cases for the user profile"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._user_model().objects.create_user(
+            email='test@example.com',
+            password='password123',
+            name='Before',
+            is_active=True,
+            is_email_verified=True
+        )
+        cls.profile_url = reverse('user-profile')
+
+    def test_profile_update_is_visible_on_next_read(self):
+        """A PATCH must not leave a stale cached profile behind"""
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(self.profile_url).data['name'], 'Before')
+
+        response = self.client.patch(self.profile_url, {'name': 'After'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.client.get(self.profile_url).data['name'], 'After')
+
+    def test_profile_update_skips_sanitizing_when_info_is_off(self):
+        """Update data is only sanitized for the log when INFO records are kept"""
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.object(UserProfileView, 'sanitize_update_data') as sanitize, \
+                mock.patch.object(logging.getLogger('users.profile'), 'isEnabledFor', return_value=False):
+            response = self.client.patch(self.profile_url, {'name': 'After'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sanitize.assert_not_called()
+
+
+class LanguageProgressListTestCase(UserModelMixin, APITestCase):
+    """Test cases for the language progress list"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._user_model().objects.create_user(
+            email='test@example.com',
+            password='password123',
+            is_active=True,
+            is_email_verified=True
+        )
+        cls.list_url = reverse('language-progress-list')
+
+    def _add_progress(self, codes):
+        for code in codes:
+            language = Language.objects.create(code=code, name_english=code, name_native=code)
+            LanguageProgress.objects.create(user=self.user, language=language)
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        """Nested language data must not cost one query per progress row"""
+        self.client.force_authenticate(user=self.user)
+
+        self._add_progress(['en'])
+        single_row_queries = self._count_list_queries()
+
+        self._add_progress(['de', 'fr', 'es', 'it'])
+        self.assertEqual(self._count_list_queries(), single_row_queries)
+
+
+class WordsProgressListTestCase(UserModelMixin, APITestCase):
+    """Test cases for the words progress list"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._user_model().objects.create_user(
+            email='test@example.com',
+            password='password123',
+            is_active=True,
+            is_email_verified=True
+        )
+        cls.source_language = Language.objects.create(code='en', name_english='English', name_native='English')
+        cls.target_language = Language.objects.create(code='ru', name_english='Russian', name_native='Русский')
+        cls.part_of_speech = PartOfSpeech.objects.create(code='noun')
+        cls.list_url = reverse('words-progress-list')
+
+    def _add_progress(self, words):
+        for text in words:
+            word = Word.objects.create(
+                word=text, language=self.source_language, part_of_speech=self.part_of_speech
+            )
+            WordsProgress.objects.create(user=self.user, word=word, target_language=self.target_language)
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_does_not_load_deferred_columns_per_row(self):
+        """Every field the serializer reads must come from the list query itself"""
+        self.client.force_authenticate(user=self.user)
+
+        self._add_progress(['cat'])
+        single_row_queries = self._count_list_queries()
+
+        self._add_progress(['dog', 'house', 'tree'])
+        self.assertEqual(self._count_list_queries(), single_row_queries)
+
+        word = self.client.get(self.list_url).data['results'][0]['word']
+        self.assertEqual(word['language']['code'], 'en')
+        self.assertEqual(word['part_of_speech'], 'noun')
+
+    def test_due_for_review_pages_by_next_review(self):
+        """Due words come back soonest first, one cursor page at a time"""
+        self.client.force_authenticate(user=self.user)
+        self._add_progress(['cat', 'dog', 'tree'])
+        now = timezone.now()
+        for offset, text in enumerate(['tree', 'cat', 'dog'], start=1):
+            WordsProgress.objects.filter(word__word=text).update(next_review=now - timedelta(days=10 - offset))
+
+        seen = []
+        url = f'{self.list_url}?due_for_review=true&page_size=2'
+        while url:
+            page = self.client.get(url).data
+            seen.extend(item['word']['word'] for item in page['results'])
+            url = page['next']
+
+        self.assertEqual(seen, ['tree', 'cat', 'dog'])
+
+    def test_delete_removes_own_progress_only(self):
+        """Deleting a row that is already gone is a 404, not a server error"""
+        self.client.force_authenticate(user=self.user)
+        self._add_progress(['cat'])
+        progress = WordsProgress.objects.get(user=self.user)
+        detail_url = reverse('words-progress-detail', args=[progress.id])
+
+        response = self.client.delete(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(WordsProgress.objects.filter(id=progress.id).exists())
+
+        response = self.client.delete(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class WordsProgressTestBase(UserModelMixin, APITestCase):
+    """Shared fixture: a user learning four English nouns into Russian"""
+    # Statuses to give the four words, all learned today; None leaves them new
+    STATUSES = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls._user_model().objects.create_user(
+            email='test@example.com',
+            password='password123',
+            is_active=True,
+            is_email_verified=True
+        )
+        cls.source_language = Language.objects.create(code='en', name_english='English', name_native='English')
+        cls.target_language = Language.objects.create(code='ru', name_english='Russian', name_native='Русский')
+        cls.part_of_speech = PartOfSpeech.objects.create(code='noun')
+        cls.progress = [
+            WordsProgress.objects.create(
+                user=cls.user,
+                word=Word.objects.create(word=text, language=cls.source_language, part_of_speech=cls.part_of_speech),
+                target_language=cls.target_language
+            )
+            for text in ['cat', 'dog', 'house', 'tree']
+        ]
+        if cls.STATUSES:
+            today = timezone.now().date()
+            for progress, word_status in zip(cls.progress, cls.STATUSES):
+                WordsProgress.objects.filter(id=progress.id).update(status=word_status, date_learned=today)
+
+
+class WordsProgressBulkUpdateTestCase(WordsProgressTestBase):
+    """Test cases for bulk review updates"""
+
+    def _post(self, updates):
+        # The bulk update route is not mounted, so call the view directly
+        request = APIRequestFactory().post('/api/v1/progress/words/bulk-update/', {'updates': updates}, format='json')
+        force_authenticate(request, user=self.user)
+        return WordsProgressBulkUpdateView.as_view()(request)
+
+    def test_bulk_update_applies_changes_and_reports_missing_ids(self):
+        """Known rows are updated, unknown ids are reported"""
+        cat, dog = self.progress[:2]
+        response = self._post([
+            {'id': cat.id, 'correct': True, 'status': 'learned', 'interval': 3},
+            {'id': dog.id, 'correct': False},
+            {'id': 999999, 'correct': True},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertEqual(len(response.data['errors']), 1)
+
+        cat.refresh_from_db()
+        self.assertEqual((cat.status, cat.interval, cat.review_count, cat.correct_count), ('learned', 3, 1, 1))
+        dog.refresh_from_db()
+        self.assertEqual((dog.review_count, dog.correct_count), (1, 0))
+
+        language_progress = LanguageProgress.objects.get(user=self.user, language=self.target_language)
+        self.assertEqual(language_progress.learned_words_count, 1)
+
+    def test_bulk_update_logs_milestones_in_stats_task(self):
+        """Milestones are handed to the stats task instead of being logged inline"""
+        cat = self.progress[0]
+        with mock.patch('users.views.log_bulk_review_stats.delay', wraps=log_bulk_review_stats) as delay, \
+                self.assertLogs('users.progress', 'INFO') as logs:
+            self._post([{'id': cat.id, 'correct': True, 'status': 'learned'}])
+
+        self.assertTrue(any("Word 'cat'" in line and 'advanced to learned' in line for line in logs.output))
+        self.assertTrue(any('new->learned: 1' in line for line in logs.output))
+        delay.assert_called_once()
+
+    def test_bulk_update_survives_unreachable_broker(self):
+        """A failed stats enqueue is logged, the review is still answered with 200 and applied once"""
+        cat = self.progress[0]
+        with mock.patch('users.views.log_bulk_review_stats.delay', side_effect=OperationalError('broker down')), \
+                self.assertLogs('users.progress', 'INFO') as logs:
+            response = self._post([{'id': cat.id, 'correct': True, 'status': 'learned'}])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(any('Could not queue bulk review stats' in line for line in logs.output))
+        cat.refresh_from_db()
+        self.assertEqual((cat.status, cat.review_count, cat.correct_count), ('learned', 1, 1))
+
+    def test_answer_only_updates_skip_loading_rows(self):
+        """Payloads with only id and correct are applied without a SELECT"""
+        cat, dog = self.progress[:2]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post([{'id': cat.id, 'correct': True}, {'id': dog.id, 'correct': False}])
+
+        self.assertEqual(response.data['updated_count'], 2)
+        self.assertFalse([query for query in ctx.captured_queries if query['sql'].startswith('SELECT')])
+        cat.refresh_from_db()
+        self.assertEqual((cat.review_count, cat.correct_count, cat.date_learned), (1, 1, timezone.now().date()))
+        dog.refresh_from_db()
+        self.assertEqual((dog.review_count, dog.correct_count), (1, 0))
+
+    def test_answer_only_updates_report_missing_ids_like_full_updates(self):
+        """Both paths report each unknown id with the same error"""
+        cat = self.progress[0]
+        answer_only = self._post([{'id': cat.id, 'correct': True}, {'id': 999999, 'correct': False}])
+        full = self._post([{'id': cat.id, 'correct': True, 'interval': 2}, {'id': 999999, 'correct': False}])
+
+        expected = [{'error': 'Words progress with id 999999 not found'}]
+        self.assertEqual(answer_only.data['errors'], expected)
+        self.assertEqual(full.data['errors'], expected)
+
+    def test_bulk_update_rejects_invalid_payload_before_writing(self):
+        """One invalid item fails the whole request and nothing is written"""
+        cat, dog = self.progress[:2]
+        response = self._post([
+            {'id': cat.id, 'correct': True, 'status': 'learned'},
+            {'id': dog.id, 'correct': True, 'status': 'forgotten'},
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        cat.refresh_from_db()
+        self.assertEqual((cat.status, cat.review_count), ('new', 0))
+
+    def test_bulk_update_rejects_ids_of_other_users(self):
+        """Nothing is written when none of the ids belong to the user"""
+        other_user = self._user_model().objects.create_user(email='other@example.com', password='password123')
+        request = APIRequestFactory().post(
+            '/api/v1/progress/words/bulk-update/',
+            {'updates': [{'id': self.progress[0].id, 'correct': True}]},
+            format='json'
+        )
+        force_authenticate(request, user=other_user)
+        response = WordsProgressBulkUpdateView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.progress[0].refresh_from_db()
+        self.assertEqual(self.progress[0].review_count, 0)
+
+    def test_bulk_update_query_count_does_not_grow_with_updates(self):
+        """Rows are fetched and written in bulk, not one by one"""
+        with CaptureQueriesContext(connection) as single:
+            self._post([{'id': self.progress[0].id, 'correct': True, 'interval': 2}])
+        with CaptureQueriesContext(connection) as many:
+            self._post([{'id': progress.id, 'correct': True, 'interval': 2} for progress in self.progress])
+
+        self.assertEqual(len(many.captured_queries), len(single.captured_queries))
+
+
+class WordsLearnedTodayTestCase(WordsProgressTestBase):
+    """Test cases for today's learned words statistics"""
+
+    STATUSES = ('new', 'learning', 'learned', 'mastered')
+
+    def _get(self):
+        self.client.force_authenticate(self.user)
+        return self.client.get(reverse('words-learned-today'))
+
+    def test_counts_only_learned_and_mastered_words(self):
+        """Words that are still new or learning are not reported as learned"""
+        response = self._get()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['words_learned_today'], 1)
+        self.assertEqual(response.data['words_mastered_today'], 1)
+        self.assertEqual(response.data['total_learned_today'], 2)
+        self.assertEqual(response.data['breakdown_by_language'][0]['total_count'], 2)
+
+
+class WordsLearnedStatsTestCase(WordsProgressTestBase):
+    """Test cases for learned words statistics over a period"""
+
+    STATUSES = ('new', 'learning', 'learned', 'mastered')
+
+    def setUp(self):
+        # Cached responses would otherwise leak between tests
+        cache.clear()
+
+    def _get(self, query=''):
+        self.client.force_authenticate(self.user)
+        return self.client.get(reverse('words-learned-stats') + query)
+
+    def test_counts_each_status_for_the_period(self):
+        """Every status is counted once and the breakdowns add up"""
+        response = self._get('?period=month')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            (response.data['words_new'], response.data['words_learning'],
+             response.data['words_learned'], response.data['words_mastered'], response.data['total_words']),
+            (1, 1, 1, 1, 2)
+        )
+        self.assertEqual(response.data['language_breakdown'][0]['total_count'], 4)
+        self.assertEqual(response.data['daily_breakdown'][0]['total'], 4)
+
+    def test_include_limits_breakdowns(self):
+        """Only the requested breakdowns are computed"""
+        with CaptureQueriesContext(connection) as both:
+            self._get('?period=month')
+        with CaptureQueriesContext(connection) as daily_only:
+            response = self._get('?period=month&include=daily')
+
+        self.assertEqual(response.data['language_breakdown'], [])
+        self.assertEqual(len(response.data['daily_breakdown']), 1)
+        self.assertEqual(len(daily_only.captured_queries), len(both.captured_queries) - 1)
+
+    def test_empty_period_skips_breakdown_queries(self):
+        """Without any progress in range only the status counts are queried"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get('?period=year&language=de')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['daily_breakdown'], response.data['language_breakdown']), ([], []))
+        self.assertEqual(len(queries.captured_queries), 1)
+
+    def test_repeated_request_served_from_cache_until_progress_changes(self):
+        """A second identical request skips the database; saving progress retires the entry"""
+        self._get('?period=month')
+        with CaptureQueriesContext(connection) as cached:
+            response = self._get('?period=month')
+        self.assertEqual(len(cached.captured_queries), 0)
+        self.assertEqual(response.data['words_mastered'], 1)
+
+        progress = WordsProgress.objects.get(user=self.user, status='learned')
+        progress.status = 'mastered'
+        progress.save()
+
+        response = self._get('?period=month')
+        self.assertEqual(response.data['words_mastered'], 2)
+
+
+class TestCaseInheritanceTestCase(SimpleTestCase):
+    """Guard against test classes that truncate tables between tests"""
+
+    def test_database_test_cases_use_transaction_rollback(self):
+        """Every database test case must roll back via TestCase, not TransactionTestCase"""
+        offenders = []
+        for app_config in apps.get_app_configs():
+            if not app_config.path.startswith(str(settings.BASE_DIR)):
+                continue
+            try:
+                module = importlib.import_module(f'{app_config.name}.tests')
+            except ModuleNotFoundError:
+                continue
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__:
+                    continue
+                if issubclass(cls, TransactionTestCase) and not issubclass(cls, TestCase):
+                    offenders.append(f'{module.__name__}.{name}')
+
+        self.assertEqual(offenders, [], 'Use django.test.TestCase (or APITestCase) instead of TransactionTestCase')
@@ -1,46 +1,53 @@
 import logging
+from datetime import timedelta
+
 from django.conf import settings
-from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
 from drf_yasg import openapi
+from kombu.exceptions import OperationalError
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
-
+from languages.models import Language
+from languages.serializers import LanguageSerializer
+
+from .cache import (
+    INVALID_ACTIVATION_TOKEN,
+    get_activation_token,
+    get_profile,
+    get_words_stats,
+    invalidate_profile,
+    invalidate_words_stats,
+    mark_activation_token_invalid,
+    set_profile,
+    set_words_stats,
+)
 from .models import User, EmailActivationToken, LanguageProgress, WordsProgress, QuizProgress
+from .tasks import log_bulk_review_stats, queue_activation_email
+from .pagination import WordsProgressCursorPagination
+from .signals import update_language_progress
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
+    LoginUserSerializer,
     UserProfileSerializer,
     ResendActivationSerializer,
     LanguageProgressSerializer,
     WordsProgressSerializer,
+    BulkReviewUpdateSerializer,
     QuizProgressSerializer,
 )
 
-# Configure logger for profile access
 profile_logger = logging.getLogger('users.profile')
-
-# Configure logger for progress endpoints
 progress_logger = logging.getLogger('users.progress')
 
-# Configure console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-formatter = logging.Formatter('[%(asctime)s] %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-console_handler.setFormatter(formatter)
-
-# Add console handler to profile logger if not already present
-if not any(isinstance(handler, logging.StreamHandler) for handler in profile_logger.handlers):
-    profile_logger.addHandler(console_handler)
-    profile_logger.setLevel(logging.INFO)
-
-# Add console handler to progress logger if not already present
-if not any(isinstance(handler, logging.StreamHandler) for handler in progress_logger.handlers):
-    progress_logger.addHandler(console_handler)
-    progress_logger.setLevel(logging.INFO)
+_COMPLETED_STATUSES = frozenset({'learned', 'mastered'})
+_ANSWER_ONLY_KEYS = frozenset({'id', 'correct'})
 
 
 class UserRegistrationView(generics.CreateAPIView):
@@ -64,8 +71,8 @@ class UserRegistrationView(generics.CreateAPIView):
             # Create activation token
             activation_token = EmailActivationToken.objects.create(user=user)
 
-            # Send activation email
-            self.send_activation_email(user, activation_token, request)
+            # Send activation email in the background
+            queue_activation_email(activation_token, request.get_host())
 
             return Response({
                 'message': 'User registered successfully. Please check your email to activate your account.',
@@ -74,39 +81,6 @@ class UserRegistrationView(generics.CreateAPIView):
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    def send_activation_email(self, user, token, request):
-        """Send activation email to user"""
-        current_site = get_current_site(request)
-        activation_url = f"http://{current_site.domain}/api/auth/activate/{token.token}/"
-
-        subject = 'Activate your ForeignWords account'
-        message = f"""
-        Hi {user.name or user.email},
-        
-        Thank you for registering with ForeignWords!
-        
-        Please click the link below to activate your account:
-        {activation_url}
-        
-        This link will expire in 24 hours.
-        
-        If you didn't create this account, please ignore this email.
-        
-        Best regards,
-        ForeignWords Team
-        """
-
-        try:
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            print(f"Failed to send activation email: {e}")
-
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
@@ -119,33 +93,38 @@ class UserRegistrationView(generics.CreateAPIView):
 )
 def activate_email(request, token):
     """Activate user email with token"""
-    try:
-        activation_token = EmailActivationToken.objects.get(token=token, is_used=False)
-
-        if activation_token.is_expired():
-            return Response({
-                'error': 'Activation token has expired'
-            }, status=status.HTTP_400_BAD_REQUEST)
+    if get_activation_token(token) == INVALID_ACTIVATION_TOKEN:
+        return Response({
+            'error': 'Invalid or expired activation token'
+        }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Activate user
-        user = activation_token.user
-        user.is_active = True
-        user.is_email_verified = True
-        user.save()
+    # Claim the token with a single conditional UPDATE so concurrent clicks cannot both succeed
+    with transaction.atomic():
+        claimed = EmailActivationToken.objects.filter(
+            token=token, is_used=False, created_at__gt=EmailActivationToken.expiry_cutoff()
+        ).update(is_used=True)
+        if claimed:
+            User.objects.filter(
+                pk__in=EmailActivationToken.objects.filter(token=token).values('user_id')
+            ).update(is_active=True, is_email_verified=True)
 
-        # Mark token as used
-        activation_token.is_used = True
-        activation_token.save()
+    # Whatever happened, this token cannot be used again
+    mark_activation_token_invalid(token)
 
+    if claimed:
         return Response({
             'message': 'Email activated successfully. You can now login.'
         }, status=status.HTTP_200_OK)
 
-    except EmailActivationToken.DoesNotExist:
+    if EmailActivationToken.objects.filter(token=token, is_used=False).exists():
         return Response({
-            'error': 'Invalid or expired activation token'
+            'error': 'Activation token has expired'
         }, status=status.HTTP_400_BAD_REQUEST)
 
+    return Response({
+        'error': 'Invalid or expired activation token'
+    }, status=status.HTTP_400_BAD_REQUEST)
+
 
 class UserLoginView(generics.GenericAPIView):
     """User login endpoint"""
@@ -164,15 +143,16 @@ class UserLoginView(generics.GenericAPIView):
         if serializer.is_valid():
             user = serializer.validated_data['user']
 
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            # Generate JWT tokens; access_token builds a new token on every access
+            refresh = TokenObtainPairSerializer.get_token(user)
+            access = refresh.access_token
 
             return Response({
                 'message': 'Login successful',
-                'user': UserProfileSerializer(user).data,
+                'user': LoginUserSerializer(user).data,
                 'tokens': {
                     'refresh': str(refresh),
-                    'access': str(refresh.access_token),
+                    'access': str(access),
                 }
             }, status=status.HTTP_200_OK)
 
@@ -192,6 +172,9 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
 
     def log_profile_access(self, request, action, response_status=None):
         """Log profile access with detailed information"""
+        if not profile_logger.isEnabledFor(logging.INFO):
+            return
+
         user = request.user
         client_ip = self.get_client_ip(request)
         user_agent = request.META.get('HTTP_USER_AGENT', 'Unknown')
@@ -202,12 +185,8 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
             f"User-Agent: {user_agent[:100]}..."
         )
 
-        # Log to configured logger
         profile_logger.info(log_message)
 
-        # Also print to console for immediate visibility
-        print(f"[PROFILE ACCESS] {log_message}")
-
     def get_client_ip(self, request):
         """Get client IP address from request"""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -228,17 +207,12 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
 
         return value
 
-    def format_update_data(self, data):
-        """Format update data for logging with field names and values"""
-        if not data:
-            return "No data"
-
-        formatted_fields = []
-        for field_name, value in data.items():
-            sanitized_value = self.sanitize_field_value(field_name, value)
-            formatted_fields.append(f"{field_name}: '{sanitized_value}'")
-
-        return "{" + ", ".join(formatted_fields) + "}"
+    def sanitize_update_data(self, data):
+        """Return update data with sensitive values hidden and long values truncated"""
+        return {
+            field_name: self.sanitize_field_value(field_name, value)
+            for field_name, value in data.items()
+        }
 
     @swagger_auto_schema(
         operation_description="Get user profile",
@@ -249,7 +223,12 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         self.log_profile_access(request, 'GET_ATTEMPT')
 
         try:
-            response = super().get(request, *args, **kwargs)
+            cached_profile = get_profile(request.user.id)
+            if cached_profile is not None:
+                response = Response(cached_profile)
+            else:
+                response = super().get(request, *args, **kwargs)
+                set_profile(request.user.id, response.data)
             # Log successful profile retrieval
             self.log_profile_access(request, 'GET_SUCCESS', response.status_code)
             return response
@@ -260,7 +239,6 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
                 f"IP: {self.get_client_ip(request)}, Error: {str(e)}"
             )
             profile_logger.error(error_message)
-            print(f"[PROFILE ERROR] {error_message}")
             self.log_profile_access(request, 'GET_ERROR', 500)
             raise
 
@@ -272,52 +250,38 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         # Log profile update attempt
         self.log_profile_access(request, 'UPDATE_ATTEMPT')
 
-        # Log the fields being updated with their values
-        update_data = request.data if hasattr(request, 'data') else {}
-        formatted_data = self.format_update_data(update_data)
-
-        fields_message = (
-            f"Profile UPDATE data - User: {request.user.email} (ID: {request.user.id}), "
-            f"IP: {self.get_client_ip(request)}, Data: {formatted_data}"
-        )
-        profile_logger.info(fields_message)
-        print(f"[PROFILE UPDATE] {fields_message}")
-
-        # Also log just field names for quick overview
-        field_names = list(update_data.keys()) if update_data else []
-        overview_message = (
-            f"Profile UPDATE fields overview - User: {request.user.email} (ID: {request.user.id}), "
-            f"Fields: {field_names}, Count: {len(field_names)}"
-        )
-        profile_logger.info(overview_message)
-        print(f"[PROFILE UPDATE OVERVIEW] {overview_message}")
+        # Log the fields being updated with their values; sanitizing is skipped when INFO is off
+        update_data = request.data
+        if profile_logger.isEnabledFor(logging.INFO):
+            sanitized_data = self.sanitize_update_data(update_data)
+            profile_logger.info(
+                "Profile UPDATE data - User: %s (ID: %s), IP: %s, Data: %s",
+                request.user.email, request.user.id, self.get_client_ip(request), sanitized_data,
+                extra={'fields': sanitized_data}
+            )
 
         # Log current user state before update
         user = self.get_object()
-        current_native_language = getattr(user, 'native_language', 'NOT_SET')
-        print(f"[PROFILE DEBUG] Current native_language before update: '{current_native_language}'")
+        current_native_language = user.native_language_id
 
         try:
             # Get serializer and validate
-            print(f"[PROFILE DEBUG] Getting serializer with data: {update_data}")
             serializer = self.get_serializer(user, data=update_data, partial=True)
 
-            print(f"[PROFILE DEBUG] Validating serializer...")
             if serializer.is_valid():
-                print(f"[PROFILE DEBUG] Serializer is valid. Validated data: {serializer.validated_data}")
-
                 # Save the instance
-                print(f"[PROFILE DEBUG] Saving serializer...")
                 updated_user = serializer.save()
 
-                # Check if the field was actually updated
-                new_native_language = getattr(updated_user, 'native_language', 'NOT_SET')
-                print(f"[PROFILE DEBUG] native_language after save: '{new_native_language}'")
+                profile_logger.debug(
+                    "native_language_id before update: %r, after save: %r",
+                    current_native_language, updated_user.native_language_id
+                )
 
-                # Refresh from database to double-check
-                updated_user.refresh_from_db()
-                db_native_language = getattr(updated_user, 'native_language', 'NOT_SET')
-                print(f"[PROFILE DEBUG] native_language from DB after refresh: '{db_native_language}'")
+                # Re-read from the database to double-check, only while debugging
+                if settings.DEBUG:
+                    updated_user.refresh_from_db()
+                    profile_logger.debug("native_language_id from DB after refresh: %r", updated_user.native_language_id)
+                invalidate_profile(request.user.id)
 
                 # Create response
                 response_data = serializer.data
@@ -327,36 +291,32 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
                 self.log_profile_access(request, 'UPDATE_SUCCESS', response.status_code)
 
                 # Log successful update summary
-                success_message = (
-                    f"Profile UPDATE completed successfully - User: {request.user.email} (ID: {request.user.id}), "
-                    f"Updated fields: {len(field_names)}, IP: {self.get_client_ip(request)}"
+                profile_logger.info(
+                    "Profile UPDATE completed successfully - User: %s (ID: %s), Updated fields: %s, IP: %s",
+                    request.user.email, request.user.id, len(update_data), self.get_client_ip(request)
                 )
-                profile_logger.info(success_message)
-                print(f"[PROFILE UPDATE SUCCESS] {success_message}")
 
                 return response
             else:
                 # Log serializer validation errors
                 validation_errors = serializer.errors
-                error_message = (
-                    f"Profile UPDATE validation failed - User: {request.user.email} (ID: {request.user.id}), "
-                    f"IP: {self.get_client_ip(request)}, Errors: {validation_errors}, "
-                    f"Attempted data: {formatted_data}"
+                sanitized_data = self.sanitize_update_data(update_data)
+                profile_logger.error(
+                    "Profile UPDATE validation failed - User: %s (ID: %s), IP: %s, Errors: %s, Attempted data: %s",
+                    request.user.email, request.user.id, self.get_client_ip(request), validation_errors, sanitized_data,
+                    extra={'fields': sanitized_data}
                 )
-                profile_logger.error(error_message)
-                print(f"[PROFILE VALIDATION ERROR] {error_message}")
 
                 return Response(validation_errors, status=status.HTTP_400_BAD_REQUEST)
 
         except Exception as e:
             # Log failed profile update
-            error_message = (
-                f"Profile UPDATE failed - User: {request.user.email} (ID: {request.user.id}), "
-                f"IP: {self.get_client_ip(request)}, Error: {str(e)}, "
-                f"Attempted data: {formatted_data}"
+            sanitized_data = self.sanitize_update_data(update_data)
+            profile_logger.error(
+                "Profile UPDATE failed - User: %s (ID: %s), IP: %s, Error: %s, Attempted data: %s",
+                request.user.email, request.user.id, self.get_client_ip(request), e, sanitized_data,
+                extra={'fields': sanitized_data}
             )
-            profile_logger.error(error_message)
-            print(f"[PROFILE ERROR] {error_message}")
             self.log_profile_access(request, 'UPDATE_ERROR', 500)
             raise
 
@@ -376,14 +336,15 @@ class ResendActivationView(generics.GenericAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            email = serializer.validated_data['email']
-            user = User.objects.get(email=email)
+            user = serializer.validated_data['user']
 
-            # Create new activation token
-            activation_token = EmailActivationToken.objects.create(user=user)
+            # Retire earlier unused tokens and issue a new one
+            with transaction.atomic():
+                EmailActivationToken.objects.filter(user=user, is_used=False).update(is_used=True)
+                activation_token = EmailActivationToken.objects.create(user=user)
 
-            # Send activation email
-            UserRegistrationView().send_activation_email(user, activation_token, request)
+            # Send activation email in the background
+            queue_activation_email(activation_token, request.get_host())
 
             return Response({
                 'message': 'Activation email sent successfully'
@@ -427,6 +388,13 @@ def logout_view(request):
 class ProgressLoggingMixin:
     """Mixin to add detailed logging to progress endpoints"""
 
+    # drf_yasg sets this on the view instance while generating the schema
+    swagger_fake_view = False
+
+    def _is_schema_gen(self):
+        """Whether the view is being introspected by drf_yasg rather than serving a request"""
+        return self.swagger_fake_view
+
     def get_client_ip(self, request):
         """Get client IP address from request"""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -459,7 +427,7 @@ class ProgressLoggingMixin:
 
     def format_request_data(self, request):
         """Format request data for logging"""
-        if not hasattr(request, 'data') or not request.data:
+        if not request.data:
             return "None"
 
         # For bulk operations, show summary instead of full data
@@ -476,26 +444,43 @@ class ProgressLoggingMixin:
 
         return "{" + ", ".join(formatted_fields) + "}"
 
+    def _should_log(self, error=None):
+        """Whether a progress record of this severity would be emitted"""
+        return progress_logger.isEnabledFor(logging.ERROR if error else logging.INFO)
+
+    def get_log_context(self, request):
+        """Build the request-level part of the log message once per request"""
+        log_context = getattr(request, '_progress_log_context', None)
+        if log_context is None:
+            user = getattr(request, 'user', None)
+            user_info = f"{user.email} (ID: {user.id})" if user and user.is_authenticated else "Anonymous"
+            log_context = {
+                'user': user_info,
+                'ip': self.get_client_ip(request),
+                'query': self.format_query_params(request),
+                'data': self.format_request_data(request),
+                'user_agent': self.get_user_agent(request),
+            }
+            request._progress_log_context = log_context
+        return log_context
+
     def log_progress_request(self, request, action, endpoint, additional_info="", response_status=None, error=None):
         """Log progress request with detailed information"""
-        user = getattr(request, 'user', None)
-        user_info = f"{user.email} (ID: {user.id})" if user and user.is_authenticated else "Anonymous"
+        if not self._should_log(error):
+            return
 
-        client_ip = self.get_client_ip(request)
-        user_agent = self.get_user_agent(request)
-        query_params = self.format_query_params(request)
-        request_data = self.format_request_data(request)
+        log_context = self.get_log_context(request)
 
         # Build log message
         log_parts = [
             f"PROGRESS {action}",
             f"Endpoint: {endpoint}",
-            f"User: {user_info}",
-            f"IP: {client_ip}",
+            f"User: {log_context['user']}",
+            f"IP: {log_context['ip']}",
             f"Status: {response_status or 'N/A'}",
-            f"Query: {query_params}",
-            f"Data: {request_data}",
-            f"User-Agent: {user_agent}"
+            f"Query: {log_context['query']}",
+            f"Data: {log_context['data']}",
+            f"User-Agent: {log_context['user_agent']}"
         ]
 
         if additional_info:
@@ -506,64 +491,11 @@ class ProgressLoggingMixin:
 
         log_message = " | ".join(log_parts)
 
-        # Log to configured logger
         if error:
             progress_logger.error(log_message)
         else:
             progress_logger.info(log_message)
 
-        # Also print to console for immediate visibility
-        log_prefix = "[PROGRESS ERROR]" if error else "[PROGRESS]"
-        print(f"{log_prefix} {log_message}")
-
-    def log_queryset_info(self, request, queryset, endpoint):
-        """Log information about the queryset being returned"""
-        try:
-            count = queryset.count() if hasattr(queryset, 'count') else len(queryset)
-            user = getattr(request, 'user', None)
-            user_info = f"{user.email} (ID: {user.id})" if user and user.is_authenticated else "Anonymous"
-
-            info_message = f"Queryset info - User: {user_info}, Endpoint: {endpoint}, Results: {count} items"
-            progress_logger.info(info_message)
-            print(f"[PROGRESS QUERYSET] {info_message}")
-        except Exception as e:
-            error_message = f"Failed to log queryset info for {endpoint}: {str(e)}"
-            progress_logger.error(error_message)
-            print(f"[PROGRESS ERROR] {error_message}")
-
-    def dispatch(self, request, *args, **kwargs):
-        """Override dispatch to log all requests"""
-        endpoint = f"{request.path}"
-        method = request.method
-
-        # Log request attempt
-        self.log_progress_request(request, f"{method}_ATTEMPT", endpoint)
-
-        try:
-            # Call the parent dispatch method
-            response = super().dispatch(request, *args, **kwargs)
-
-            # Log successful response
-            self.log_progress_request(
-                request,
-                f"{method}_SUCCESS",
-                endpoint,
-                response_status=response.status_code
-            )
-
-            return response
-
-        except Exception as e:
-            # Log error
-            self.log_progress_request(
-                request,
-                f"{method}_ERROR",
-                endpoint,
-                error=e,
-                response_status=500
-            )
-            raise
-
 
 class LanguageProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIView):
     """List and create language progress for authenticated user"""
@@ -572,34 +504,17 @@ class LanguageProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAP
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return LanguageProgress.objects.none()
 
-        queryset = LanguageProgress.objects.filter(user=self.request.user)
-
-        # Log queryset info
-        if hasattr(self, 'request'):
-            self.log_queryset_info(self.request, queryset, 'language-progress-list')
-
-        return queryset
+        return LanguageProgress.objects.filter(user=self.request.user).select_related('language')
 
     @swagger_auto_schema(
         operation_description="Get user's language learning progress",
         responses={200: LanguageProgressSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-
-        # Log additional info about the response
-        result_count = len(response.data) if hasattr(response, 'data') and response.data else 0
-        self.log_progress_request(
-            request,
-            'GET_RESULT',
-            request.path,
-            additional_info=f"Returned {result_count} language progress entries"
-        )
-
-        return response
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Create new language progress entry",
@@ -609,20 +524,11 @@ class LanguageProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAP
         }
     )
     def post(self, request, *args, **kwargs):
-        # Log creation attempt details
-        language_id = request.data.get('language') if hasattr(request, 'data') else None
-        self.log_progress_request(
-            request,
-            'CREATE_ATTEMPT',
-            request.path,
-            additional_info=f"Creating progress for language_id: {language_id}"
-        )
-
         response = super().post(request, *args, **kwargs)
 
-        # Log creation result
+        # The access log has the request; record which row it created
         if response.status_code == 201:
-            created_id = response.data.get('id') if hasattr(response, 'data') else None
+            created_id = response.data.get('id')
             self.log_progress_request(
                 request,
                 'CREATE_SUCCESS',
@@ -640,95 +546,51 @@ class LanguageProgressDetailView(ProgressLoggingMixin, generics.RetrieveUpdateDe
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return LanguageProgress.objects.none()
-        return LanguageProgress.objects.filter(user=self.request.user)
+        return LanguageProgress.objects.filter(user=self.request.user).select_related('language')
 
     @swagger_auto_schema(
         operation_description="Get specific language progress",
         responses={200: LanguageProgressSerializer}
     )
     def get(self, request, *args, **kwargs):
-        progress_id = kwargs.get('pk')
-        self.log_progress_request(
-            request,
-            'GET_DETAIL_ATTEMPT',
-            request.path,
-            additional_info=f"Retrieving language progress ID: {progress_id}"
-        )
-
-        response = super().get(request, *args, **kwargs)
-
-        if response.status_code == 200:
-            language_name = response.data.get('language_name') if hasattr(response, 'data') else 'Unknown'
-            self.log_progress_request(
-                request,
-                'GET_DETAIL_SUCCESS',
-                request.path,
-                additional_info=f"Retrieved progress for language: {language_name}"
-            )
-
-        return response
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Update language progress",
         responses={200: LanguageProgressSerializer}
     )
     def patch(self, request, *args, **kwargs):
-        progress_id = kwargs.get('pk')
-        self.log_progress_request(
-            request,
-            'UPDATE_DETAIL_ATTEMPT',
-            request.path,
-            additional_info=f"Updating language progress ID: {progress_id}"
-        )
-
-        response = super().patch(request, *args, **kwargs)
-
-        if response.status_code == 200:
-            self.log_progress_request(
-                request,
-                'UPDATE_DETAIL_SUCCESS',
-                request.path,
-                additional_info=f"Updated language progress ID: {progress_id}"
-            )
-
-        return response
+        return super().patch(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Delete language progress",
         responses={204: 'No Content'}
     )
     def delete(self, request, *args, **kwargs):
-        progress_id = kwargs.get('pk')
-        self.log_progress_request(
-            request,
-            'DELETE_ATTEMPT',
-            request.path,
-            additional_info=f"Deleting language progress ID: {progress_id}"
-        )
-
-        response = super().delete(request, *args, **kwargs)
-
-        if response.status_code == 204:
-            self.log_progress_request(
-                request,
-                'DELETE_SUCCESS',
-                request.path,
-                additional_info=f"Deleted language progress ID: {progress_id}"
-            )
-
-        return response
+        return super().delete(request, *args, **kwargs)
 
 
 class WordsProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIView):
     """List and create words progress for authenticated user"""
     serializer_class = WordsProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WordsProgressCursorPagination
+
+    # Columns read by WordsProgressSerializer; target_language is serialized in full
+    LIST_FIELDS = (
+        'id', 'status', 'interval', 'next_review', 'review_count', 'correct_count',
+        'date_learned', 'created_at', 'updated_at',
+        'word__id', 'word__word', 'word__transcription', 'word__difficulty_level',
+        'word__language__id', 'word__language__code', 'word__language__name_english',
+        'word__part_of_speech__id', 'word__part_of_speech__code',
+        'target_language',
+    )
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return WordsProgress.objects.none()
 
         queryset = WordsProgress.objects.filter(user=self.request.user)
@@ -751,17 +613,16 @@ class WordsProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVi
         # Filter words due for review
         due_for_review = self.request.query_params.get('due_for_review', None)
         if due_for_review and due_for_review.lower() == 'true':
-            from django.utils import timezone
             queryset = queryset.filter(
                 next_review__lte=timezone.now(),
                 status__in=['new', 'learning']
             )
 
-        # Log queryset info
-        if hasattr(self, 'request'):
-            self.log_queryset_info(self.request, queryset, 'words-progress-list')
-
-        return queryset.select_related('word', 'word__language', 'target_language', 'word__part_of_speech')
+        # The serializer reads no reverse relations of word (translations, examples),
+        # so the JOINs below cover every row without any prefetch queries
+        return queryset.select_related(
+            'word', 'word__language', 'target_language', 'word__part_of_speech'
+        ).only(*self.LIST_FIELDS)
 
     @swagger_auto_schema(
         operation_description="Get user's words learning progress",
@@ -774,27 +635,7 @@ class WordsProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVi
         responses={200: WordsProgressSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-
-        # Log additional info about the response
-        result_count = len(response.data) if hasattr(response, 'data') and response.data else 0
-
-        # Log filter information
-        filters_applied = []
-        for param in ['status', 'target_language', 'word_language', 'due_for_review']:
-            if request.query_params.get(param):
-                filters_applied.append(f"{param}={request.query_params.get(param)}")
-
-        filter_info = f"Filters: {', '.join(filters_applied)}" if filters_applied else "No filters"
-
-        self.log_progress_request(
-            request,
-            'GET_RESULT',
-            request.path,
-            additional_info=f"Returned {result_count} words progress entries. {filter_info}"
-        )
-
-        return response
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Create new words progress entry",
@@ -804,23 +645,12 @@ class WordsProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVi
         }
     )
     def post(self, request, *args, **kwargs):
-        # Log creation attempt details
-        word_id = request.data.get('word') if hasattr(request, 'data') else None
-        target_language_id = request.data.get('target_language') if hasattr(request, 'data') else None
-
-        self.log_progress_request(
-            request,
-            'CREATE_ATTEMPT',
-            request.path,
-            additional_info=f"Creating words progress for word_id: {word_id}, target_language_id: {target_language_id}"
-        )
-
         response = super().post(request, *args, **kwargs)
 
-        # Log creation result
+        # The access log has the request; record which row it created
         if response.status_code == 201:
-            created_id = response.data.get('id') if hasattr(response, 'data') else None
-            word_text = response.data.get('word_text') if hasattr(response, 'data') else 'Unknown'
+            created_id = response.data.get('id')
+            word_text = response.data.get('word_text')
             self.log_progress_request(
                 request,
                 'CREATE_SUCCESS',
@@ -835,41 +665,21 @@ class WordsProgressDetailView(ProgressLoggingMixin, generics.RetrieveUpdateDestr
     """Retrieve, update, or delete specific words progress"""
     serializer_class = WordsProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Relations the serializer reads, joined into the single detail query
+    _SELECT_RELATED = ('word', 'word__language', 'target_language', 'word__part_of_speech')
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return WordsProgress.objects.none()
-        return WordsProgress.objects.filter(user=self.request.user).select_related(
-            'word', 'word__language', 'target_language', 'word__part_of_speech'
-        )
+        return WordsProgress.objects.filter(user=self.request.user).select_related(*self._SELECT_RELATED)
 
     @swagger_auto_schema(
         operation_description="Get specific words progress",
         responses={200: WordsProgressSerializer}
     )
     def get(self, request, *args, **kwargs):
-        progress_id = kwargs.get('pk')
-        self.log_progress_request(
-            request,
-            'GET_DETAIL_ATTEMPT',
-            request.path,
-            additional_info=f"Retrieving words progress ID: {progress_id}"
-        )
-
-        response = super().get(request, *args, **kwargs)
-
-        if response.status_code == 200:
-            word_text = response.data.get('word_text') if hasattr(response, 'data') else 'Unknown'
-            status = response.data.get('status') if hasattr(response, 'data') else 'Unknown'
-            self.log_progress_request(
-                request,
-                'GET_DETAIL_SUCCESS',
-                request.path,
-                additional_info=f"Retrieved progress for word: '{word_text}', status: {status}"
-            )
-
-        return response
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Update words progress",
@@ -877,22 +687,12 @@ class WordsProgressDetailView(ProgressLoggingMixin, generics.RetrieveUpdateDestr
     )
     def patch(self, request, *args, **kwargs):
         progress_id = kwargs.get('pk')
-
-        # Log what fields are being updated
-        update_fields = list(request.data.keys()) if hasattr(request, 'data') else []
-
-        self.log_progress_request(
-            request,
-            'UPDATE_DETAIL_ATTEMPT',
-            request.path,
-            additional_info=f"Updating words progress ID: {progress_id}, fields: {update_fields}"
-        )
-
         response = super().patch(request, *args, **kwargs)
 
+        # Record the learning status the word ended up in
         if response.status_code == 200:
-            word_text = response.data.get('word_text') if hasattr(response, 'data') else 'Unknown'
-            new_status = response.data.get('status') if hasattr(response, 'data') else 'Unknown'
+            word_text = response.data.get('word_text')
+            new_status = response.data.get('status')
             self.log_progress_request(
                 request,
                 'UPDATE_DETAIL_SUCCESS',
@@ -907,33 +707,7 @@ class WordsProgressDetailView(ProgressLoggingMixin, generics.RetrieveUpdateDestr
         responses={204: 'No Content'}
     )
     def delete(self, request, *args, **kwargs):
-        progress_id = kwargs.get('pk')
-
-        # Try to get word info before deletion
-        try:
-            progress = self.get_object()
-            word_text = progress.word.text if progress and progress.word else 'Unknown'
-        except:
-            word_text = 'Unknown'
-
-        self.log_progress_request(
-            request,
-            'DELETE_ATTEMPT',
-            request.path,
-            additional_info=f"Deleting words progress ID: {progress_id} for word: '{word_text}'"
-        )
-
-        response = super().delete(request, *args, **kwargs)
-
-        if response.status_code == 204:
-            self.log_progress_request(
-                request,
-                'DELETE_SUCCESS',
-                request.path,
-                additional_info=f"Deleted words progress ID: {progress_id} for word: '{word_text}'"
-            )
-
-        return response
+        return super().delete(request, *args, **kwargs)
 
 
 class WordsProgressBulkUpdateView(ProgressLoggingMixin, generics.GenericAPIView):
@@ -970,14 +744,8 @@ class WordsProgressBulkUpdateView(ProgressLoggingMixin, generics.GenericAPIView)
     def post(self, request, *args, **kwargs):
         """Bulk update words progress after review session"""
         updates = request.data.get('updates', [])
-
-        # Log bulk update attempt
-        self.log_progress_request(
-            request,
-            'BULK_UPDATE_ATTEMPT',
-            request.path,
-            additional_info=f"Processing {len(updates)} bulk updates"
-        )
+        # Checked once so the info messages below are not formatted when they would be dropped
+        log_info = self._should_log()
 
         if not updates:
             self.log_progress_request(
@@ -989,87 +757,113 @@ class WordsProgressBulkUpdateView(ProgressLoggingMixin, generics.GenericAPIView)
             )
             return Response({'error': 'No updates provided'}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Validate the whole payload up front so nothing is written for a bad request
+        serializer = BulkReviewUpdateSerializer(data=updates, many=True)
+        if not serializer.is_valid():
+            self.log_progress_request(
+                request,
+                'BULK_UPDATE_ERROR',
+                request.path,
+                additional_info="Invalid update data",
+                error=serializer.errors
+            )
+            return Response(
+                {'error': 'Invalid update data', 'errors': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        updates = serializer.validated_data
+
+        now = timezone.now()
+        today = now.date()
+
+        if self._is_answer_only(updates):
+            return self._record_answers(request, updates, now, today, log_info)
+
         updated_count = 0
         errors = []
         correct_answers = 0
         incorrect_answers = 0
         status_changes = {}
+        milestones = []
+
+        # Fetch every requested row in one query instead of one per update
+        ids = [update_data['id'] for update_data in updates]
+        progress_by_id = WordsProgress.objects.filter(
+            user=request.user
+        ).select_related('word', 'target_language').in_bulk(ids)
+        if not progress_by_id:
+            self.log_progress_request(
+                request,
+                'BULK_UPDATE_ERROR',
+                request.path,
+                additional_info="None of the requested ids belong to the user",
+                error="No words progress found"
+            )
+            return Response({'error': 'No words progress found'}, status=status.HTTP_400_BAD_REQUEST)
 
-        for update_data in updates:
-            try:
-                progress_id = update_data.get('id')
-                if not progress_id:
-                    errors.append({'error': 'Missing id in update data', 'data': update_data})
-                    continue
-
-                # Get the progress entry
-                try:
-                    progress = WordsProgress.objects.get(id=progress_id, user=request.user)
-                    word_text = progress.word.text if progress.word else f"ID:{progress_id}"
-                except WordsProgress.DoesNotExist:
-                    errors.append({'error': f'Words progress with id {progress_id} not found'})
-                    continue
-
-                # Track old status for logging
-                old_status = progress.status
-
-                # Update review count
-                progress.review_count += 1
-
-                # Track correct/incorrect answers
-                is_correct = update_data.get('correct', False)
-                if is_correct:
-                    progress.correct_count += 1
-                    correct_answers += 1
-                else:
-                    incorrect_answers += 1
-
-                # Update other fields if provided
-                if 'status' in update_data:
-                    new_status = update_data['status']
-                    progress.status = new_status
-
-                    # Track status changes
-                    if old_status != new_status:
-                        status_key = f"{old_status}->{new_status}"
-                        status_changes[status_key] = status_changes.get(status_key, 0) + 1
-
-                if 'interval' in update_data:
-                    progress.interval = update_data['interval']
-
-                if 'next_review' in update_data:
-                    from django.utils.dateparse import parse_datetime
-                    next_review = parse_datetime(update_data['next_review'])
-                    if next_review:
-                        progress.next_review = next_review
-
-                # Set date_learned if status is learned or mastered
-                if progress.status in ['learned', 'mastered'] and not progress.date_learned:
-                    from django.utils import timezone
-                    progress.date_learned = timezone.now().date()
-
-                progress.save()
-                updated_count += 1
-
-                # Log individual update for important status changes
-                if old_status != progress.status and progress.status in ['learned', 'mastered']:
-                    self.log_progress_request(
-                        request,
-                        'BULK_UPDATE_MILESTONE',
-                        request.path,
-                        additional_info=f"Word '{word_text}' (ID: {progress_id}) advanced to {progress.status}"
-                    )
+        to_update = {}
 
-            except Exception as e:
-                error_msg = f"Failed to update progress ID {progress_id}: {str(e)}"
-                errors.append({'error': str(e), 'data': update_data})
-                self.log_progress_request(
-                    request,
-                    'BULK_UPDATE_ITEM_ERROR',
-                    request.path,
-                    additional_info=error_msg,
-                    error=str(e)
+        for update_data in updates:
+            progress_id = update_data['id']
+            progress = progress_by_id.get(progress_id)
+            if progress is None:
+                errors.append({'error': f'Words progress with id {progress_id} not found'})
+                continue
+
+            # Track old status for logging
+            old_status = progress.status
+
+            # Update review count
+            progress.review_count += 1
+
+            # Track correct/incorrect answers
+            if update_data['correct']:
+                progress.correct_count += 1
+                correct_answers += 1
+            else:
+                incorrect_answers += 1
+
+            # Update other fields if provided
+            if 'status' in update_data:
+                new_status = update_data['status']
+                progress.status = new_status
+
+                # Track status changes
+                if old_status != new_status:
+                    status_key = f"{old_status}->{new_status}"
+                    status_changes[status_key] = status_changes.get(status_key, 0) + 1
+
+            if 'interval' in update_data:
+                progress.interval = update_data['interval']
+
+            if 'next_review' in update_data:
+                progress.next_review = update_data['next_review']
+
+            # bulk_update() skips the pre_save signal that stamps date_learned
+            # on every save, and it does not fill auto_now fields either
+            progress.date_learned = today
+            progress.updated_at = now
+
+            to_update[progress.id] = progress
+            updated_count += 1
+
+            # Collect important status changes for the stats task
+            if log_info and old_status != progress.status and progress.status in _COMPLETED_STATUSES:
+                milestones.append({'id': progress_id, 'word': progress.word.word, 'status': progress.status})
+
+        if to_update:
+            # The review writes and the language totals derived from them commit together
+            with transaction.atomic():
+                # One UPDATE ... SET col = CASE id WHEN ... END, ... WHERE id IN (...) per batch
+                WordsProgress.objects.bulk_update(
+                    to_update.values(),
+                    ['review_count', 'correct_count', 'status', 'interval', 'next_review', 'date_learned', 'updated_at'],
+                    batch_size=500
                 )
+                # bulk_update() skips post_save too, so refresh each touched language once
+                for target_language in {progress.target_language for progress in to_update.values()}:
+                    update_language_progress(request.user, target_language)
+            invalidate_words_stats(request.user.id)
 
         # Prepare response data
         response_data = {
@@ -1080,28 +874,95 @@ class WordsProgressBulkUpdateView(ProgressLoggingMixin, generics.GenericAPIView)
         if errors:
             response_data['errors'] = errors
 
-        # Log bulk update completion with detailed statistics
-        status_changes_str = ", ".join([f"{k}: {v}" for k, v in status_changes.items()]) if status_changes else "None"
+        # Log bulk update completion; review statistics are logged by a worker
+        if log_info:
+            self.log_progress_request(
+                request,
+                'BULK_UPDATE_COMPLETED_WITH_ERRORS' if errors else 'BULK_UPDATE_SUCCESS',
+                request.path,
+                additional_info=f"Bulk update completed: {updated_count}/{len(updates)} successful, Errors: {len(errors)}"
+            )
+            stats = {
+                'correct_answers': correct_answers,
+                'incorrect_answers': incorrect_answers,
+                'status_changes': status_changes,
+                'milestones': milestones,
+            }
+            # The atomic block above has already committed, so the task can be queued directly.
+            # The writes are done; a broker outage must not turn them into a 500 the client retries
+            try:
+                log_bulk_review_stats.delay(request.user.id, stats)
+            except OperationalError as e:
+                progress_logger.warning("Could not queue bulk review stats for user %s: %s", request.user.id, e)
 
-        completion_info = (
-            f"Bulk update completed: {updated_count}/{len(updates)} successful, "
-            f"Correct answers: {correct_answers}, Incorrect: {incorrect_answers}, "
-            f"Status changes: {status_changes_str}, Errors: {len(errors)}"
-        )
+        return Response(response_data, status=status.HTTP_200_OK)
 
-        if errors:
+
+    @staticmethod
+    def _is_answer_only(updates):
+        """Whether every validated update only records an answer for a distinct id"""
+        ids = {update_data['id'] for update_data in updates}
+        return len(ids) == len(updates) and all(update_data.keys() <= _ANSWER_ONLY_KEYS for update_data in updates)
+
+    def _record_answers(self, request, updates, now, today, log_info):
+        """Count answers with F() expressions, without loading the rows"""
+        correct_ids = [update_data['id'] for update_data in updates if update_data['correct']]
+        incorrect_ids = [update_data['id'] for update_data in updates if not update_data['correct']]
+
+        # Same fields the pre_save signal and auto_now would have stamped on save()
+        queryset = WordsProgress.objects.filter(user=request.user)
+        updated_count = 0
+        with transaction.atomic():
+            if correct_ids:
+                updated_count += queryset.filter(id__in=correct_ids).update(
+                    review_count=F('review_count') + 1,
+                    correct_count=F('correct_count') + 1,
+                    date_learned=today,
+                    updated_at=now
+                )
+            if incorrect_ids:
+                updated_count += queryset.filter(id__in=incorrect_ids).update(
+                    review_count=F('review_count') + 1,
+                    date_learned=today,
+                    updated_at=now
+                )
+
+        if not updated_count:
             self.log_progress_request(
                 request,
-                'BULK_UPDATE_COMPLETED_WITH_ERRORS',
+                'BULK_UPDATE_ERROR',
                 request.path,
-                additional_info=completion_info
+                additional_info="None of the requested ids belong to the user",
+                error="No words progress found"
             )
-        else:
+            return Response({'error': 'No words progress found'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # update() skips post_save, which is where cached stats are dropped
+        invalidate_words_stats(request.user.id)
+
+        response_data = {
+            'updated_count': updated_count,
+            'total_requested': len(updates)
+        }
+        errors = []
+        if updated_count < len(updates):
+            # Only now look the rows up, to report missing ids the same way as the full path
+            found_ids = set(queryset.filter(id__in=correct_ids + incorrect_ids).values_list('id', flat=True))
+            errors = [
+                {'error': f'Words progress with id {update_data["id"]} not found'}
+                for update_data in updates if update_data['id'] not in found_ids
+            ]
+            response_data['errors'] = errors
+
+        if log_info:
             self.log_progress_request(
                 request,
-                'BULK_UPDATE_SUCCESS',
+                'BULK_UPDATE_COMPLETED_WITH_ERRORS' if errors else 'BULK_UPDATE_SUCCESS',
                 request.path,
-                additional_info=completion_info
+                additional_info=(
+                    f"Answers recorded: {updated_count}/{len(updates)} successful, "
+                    f"Correct answers: {len(correct_ids)}, Incorrect: {len(incorrect_ids)}"
+                )
             )
 
         return Response(response_data, status=status.HTTP_200_OK)
@@ -1145,52 +1006,33 @@ class WordsLearnedTodayView(ProgressLoggingMixin, generics.GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         """Get statistics for words learned today"""
-        from django.utils import timezone
-        from django.db.models import Count, Q
-
-        # Log request attempt
-        self.log_progress_request(
-            request,
-            'WORDS_LEARNED_TODAY_ATTEMPT',
-            request.path,
-            additional_info="Retrieving today's learned words statistics"
-        )
-
         try:
             today = timezone.now().date()
             user = request.user
 
-            # Debug: Log the date we're filtering by
-            print(f"[DEBUG] Filtering by date: {today}")
-            print(f"[DEBUG] User: {user.email} (ID: {user.id})")
-
             # Get words learned today
             words_learned_today = WordsProgress.objects.filter(
                 user=user,
                 date_learned=today,
-                status__in=['learned', 'mastered']
-            ).select_related('word', 'word__language', 'target_language')
+                status__in=_COMPLETED_STATUSES
+            )
 
-            # Debug: Check total count before status filtering
-            all_words_today = WordsProgress.objects.filter(
-                user=user,
-                date_learned=today
+            # Count by status in a single query
+            counts = WordsProgress.objects.filter(user=user, date_learned=today).aggregate(
+                new=Count('id', filter=Q(status='new')),
+                learning=Count('id', filter=Q(status='learning')),
+                learned=Count('id', filter=Q(status='learned')),
+                mastered=Count('id', filter=Q(status='mastered')),
             )
-            print(f"[DEBUG] Total words with date_learned={today}: {all_words_today.count()}")
-            print(f"[DEBUG] Words with learned/mastered status: {words_learned_today.count()}")
-
-            # Debug: Show some sample records
-            for progress in words_learned_today[:5]:
-                print(f"[DEBUG] Word: {progress.word.word}, Status: {progress.status}, Date: {progress.date_learned}")
-
-            # Count by status
-            new_count = words_learned_today.filter(status='nes').count()
-            learning_count = words_learned_today.filter(status='learning').count()
-            learned_count = words_learned_today.filter(status='learned').count()
-            mastered_count = words_learned_today.filter(status='mastered').count()
+            learned_count = counts['learned']
+            mastered_count = counts['mastered']
             total_count = learned_count + mastered_count
 
-            print(f"[DEBUG] Learned: {learned_count}, Mastered: {mastered_count}, Total: {total_count}")
+            if progress_logger.isEnabledFor(logging.DEBUG):
+                progress_logger.debug(
+                    "Words learned today for user %s on %s: %s",
+                    user.id, today, counts
+                )
 
             # Breakdown by language
             language_breakdown = []
@@ -1205,17 +1047,17 @@ class WordsLearnedTodayView(ProgressLoggingMixin, generics.GenericAPIView):
                 total_count=Count('id')
             ).order_by('-total_count')
 
+            # GROUP BY only yields languages that have rows, so every total is positive
             for lang_stat in language_stats:
-                if lang_stat['total_count'] > 0:  # Only include languages with learned words
-                    language_breakdown.append({
-                        'language_code': lang_stat['target_language__code'],
-                        'language_name': lang_stat['target_language__name_english'],
-                        'new_count': lang_stat['new_count'],
-                        'learning_count': lang_stat['learning_count'],
-                        'learned_count': lang_stat['learned_count'],
-                        'mastered_count': lang_stat['mastered_count'],
-                        'total_count': lang_stat['total_count']
-                    })
+                language_breakdown.append({
+                    'language_code': lang_stat['target_language__code'],
+                    'language_name': lang_stat['target_language__name_english'],
+                    'new_count': lang_stat['new_count'],
+                    'learning_count': lang_stat['learning_count'],
+                    'learned_count': lang_stat['learned_count'],
+                    'mastered_count': lang_stat['mastered_count'],
+                    'total_count': lang_stat['total_count']
+                })
 
             response_data = {
                 'date': today.isoformat(),
@@ -1225,21 +1067,6 @@ class WordsLearnedTodayView(ProgressLoggingMixin, generics.GenericAPIView):
                 'breakdown_by_language': language_breakdown
             }
 
-            # Log successful response with statistics
-            stats_info = (
-                f"Today's stats: {total_count} total words "
-                f"({learned_count} learned, {mastered_count} mastered), "
-                f"{len(language_breakdown)} languages involved"
-            )
-
-            self.log_progress_request(
-                request,
-                'WORDS_LEARNED_TODAY_SUCCESS',
-                request.path,
-                additional_info=stats_info,
-                response_status=200
-            )
-
             return Response(response_data, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -1263,10 +1090,11 @@ class QuizProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVie
     """List and create quiz progress for authenticated user"""
     serializer_class = QuizProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
+    _SELECT_RELATED = ('language',)
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return QuizProgress.objects.none()
 
         queryset = QuizProgress.objects.filter(user=self.request.user)
@@ -1276,11 +1104,7 @@ class QuizProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVie
         if language_filter:
             queryset = queryset.filter(language__code=language_filter)
 
-        # Log queryset info
-        if hasattr(self, 'request'):
-            self.log_queryset_info(self.request, queryset, 'quiz-progress-list')
-
-        return queryset.select_related('language')
+        return queryset.select_related(*self._SELECT_RELATED)
 
     @swagger_auto_schema(
         operation_description="Get user's quiz progress",
@@ -1290,20 +1114,7 @@ class QuizProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVie
         responses={200: QuizProgressSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
-
-        # Log additional info about the response
-        result_count = len(response.data) if hasattr(response, 'data') and response.data else 0
-        language_filter = request.query_params.get('language', 'all')
-
-        self.log_progress_request(
-            request,
-            'GET_RESULT',
-            request.path,
-            additional_info=f"Returned {result_count} quiz progress entries for language: {language_filter}"
-        )
-
-        return response
+        return super().get(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_description="Create new quiz progress entry",
@@ -1313,24 +1124,12 @@ class QuizProgressListCreateView(ProgressLoggingMixin, generics.ListCreateAPIVie
         }
     )
     def post(self, request, *args, **kwargs):
-        # Log creation attempt details
-        language_id = request.data.get('language_id') if hasattr(request, 'data') else None
-        total_questions = request.data.get('total_questions') if hasattr(request, 'data') else None
-        correct_answers = request.data.get('correct_answers') if hasattr(request, 'data') else None
-
-        self.log_progress_request(
-            request,
-            'CREATE_ATTEMPT',
-            request.path,
-            additional_info=f"Creating quiz progress for language_id: {language_id}, questions: {total_questions}, correct: {correct_answers}"
-        )
-
         response = super().post(request, *args, **kwargs)
 
-        # Log creation result
+        # The access log has the request; record which row it created
         if response.status_code == 201:
-            created_id = response.data.get('id') if hasattr(response, 'data') else None
-            accuracy = response.data.get('accuracy_percentage') if hasattr(response, 'data') else 'Unknown'
+            created_id = response.data.get('id')
+            accuracy = response.data.get('accuracy_percentage')
             self.log_progress_request(
                 request,
                 'CREATE_SUCCESS',
@@ -1378,17 +1177,8 @@ class QuizStatsView(ProgressLoggingMixin, generics.GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         """Get quiz statistics grouped by language"""
-        from django.db.models import Sum, Avg, Count
-        from languages.serializers import LanguageSerializer
 
-        # Log request attempt
         language_filter = request.query_params.get('language', None)
-        self.log_progress_request(
-            request,
-            'QUIZ_STATS_ATTEMPT',
-            request.path,
-            additional_info=f"Retrieving quiz statistics for language: {language_filter or 'all'}"
-        )
 
         try:
             user = request.user
@@ -1404,6 +1194,7 @@ class QuizStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                 total_correct=Sum('correct_answers'),
                 quiz_count=Count('id')
             ).order_by('-total_questions')
+            languages = Language.objects.in_bulk([stat['language'] for stat in stats])
 
             # Calculate average accuracy and prepare response data
             response_data = []
@@ -1413,36 +1204,14 @@ class QuizStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                 else:
                     average_accuracy = 0.0
 
-                # Get language object for serialization
-                from languages.models import Language
-                language = Language.objects.get(id=stat['language'])
-
                 response_data.append({
-                    'language': LanguageSerializer(language).data,
+                    'language': LanguageSerializer(languages[stat['language']]).data,
                     'total_questions': stat['total_questions'],
                     'average_accuracy': average_accuracy,
                     'quiz_count': stat['quiz_count']
                 })
 
             # Log successful response with statistics
-            total_languages = len(response_data)
-            total_quizzes = sum(item['quiz_count'] for item in response_data)
-            total_questions = sum(item['total_questions'] for item in response_data)
-
-            stats_info = (
-                f"Quiz stats: {total_languages} languages, "
-                f"{total_quizzes} total quizzes, "
-                f"{total_questions} total questions"
-            )
-
-            self.log_progress_request(
-                request,
-                'QUIZ_STATS_SUCCESS',
-                request.path,
-                additional_info=stats_info,
-                response_status=200
-            )
-
             return Response(response_data, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -1465,6 +1234,7 @@ class QuizStatsView(ProgressLoggingMixin, generics.GenericAPIView):
 class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
     """Get extended statistics for words learned over different periods"""
     permission_classes = [permissions.IsAuthenticated]
+    BREAKDOWNS = frozenset({'daily', 'language'})
 
     @swagger_auto_schema(
         operation_description="Get words learned statistics for different time periods",
@@ -1482,6 +1252,12 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                 description="Filter by target language code",
                 type=openapi.TYPE_STRING
             ),
+            openapi.Parameter(
+                'include',
+                openapi.IN_QUERY,
+                description="Comma-separated breakdowns to compute (daily, language); both when omitted",
+                type=openapi.TYPE_STRING
+            ),
         ],
         responses={
             200: openapi.Response(
@@ -1530,20 +1306,11 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         """Get extended statistics for words learned over different periods"""
-        from django.utils import timezone
-        from django.db.models import Count, Q
-        from datetime import timedelta
 
         period = request.query_params.get('period', 'today').lower()
         language_filter = request.query_params.get('language', None)
-
-        # Log request attempt
-        self.log_progress_request(
-            request,
-            'WORDS_STATS_ATTEMPT',
-            request.path,
-            additional_info=f"Retrieving words statistics for period: {period}, language: {language_filter or 'all'}"
-        )
+        include_param = request.query_params.get('include')
+        include = {part.strip() for part in include_param.split(',')} if include_param else self.BREAKDOWNS
 
         try:
             today = timezone.now().date()
@@ -1571,9 +1338,9 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Debug logging
-            print(f"[DEBUG] Period: {period}, Start: {start_date}, End: {end_date}")
-            print(f"[DEBUG] Language filter: {language_filter}")
+            cached = get_words_stats(user.id, period, language_filter, include, today)
+            if cached is not None:
+                return Response(cached, status=status.HTTP_200_OK)
 
             # Base queryset
             queryset = WordsProgress.objects.filter(
@@ -1581,36 +1348,41 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                 date_learned__isnull=False
             )
 
-            # Debug: Check base queryset count
-            print(f"[DEBUG] Base queryset count (all learned/mastered with date): {queryset.count()}")
-
             # Apply date filter
             if start_date:
                 queryset = queryset.filter(date_learned__gte=start_date)
             queryset = queryset.filter(date_learned__lte=end_date)
 
-            # Debug: Check after date filtering
-            print(f"[DEBUG] After date filtering: {queryset.count()}")
-
             # Apply language filter if provided
             if language_filter:
                 queryset = queryset.filter(target_language__code=language_filter)
-                print(f"[DEBUG] After language filtering: {queryset.count()}")
 
-            queryset = queryset.select_related('word', 'word__language', 'target_language')
-
-            # Count by status
-            new_count = queryset.filter(status='new').count()
-            learning_count = queryset.filter(status='learning').count()
-            learned_count = queryset.filter(status='learned').count()
-            mastered_count = queryset.filter(status='mastered').count()
+            # Count by status in a single query
+            counts = queryset.aggregate(
+                new=Count('id', filter=Q(status='new')),
+                learning=Count('id', filter=Q(status='learning')),
+                learned=Count('id', filter=Q(status='learned')),
+                mastered=Count('id', filter=Q(status='mastered')),
+            )
+            new_count = counts['new']
+            learning_count = counts['learning']
+            learned_count = counts['learned']
+            mastered_count = counts['mastered']
             total_count = learned_count + mastered_count
 
-            print(f"[DEBUG] Final counts - Learned: {learned_count}, Mastered: {mastered_count}, Total: {total_count}")
+            if progress_logger.isEnabledFor(logging.DEBUG):
+                progress_logger.debug(
+                    "Words stats for user %s, period %s (%s - %s), language %s: %s",
+                    user.id, period, start_date, end_date, language_filter or 'all', counts
+                )
+
+            # Grouped rows only exist for days and languages with progress, so an empty
+            # period needs no breakdown queries at all
+            has_activity = any(counts.values())
 
             # Daily breakdown (only for periods with reasonable number of days)
             daily_breakdown = []
-            if period in ['today', 'week', 'month'] or (period == 'year' and start_date):
+            if has_activity and 'daily' in include and (period in ['today', 'week', 'month'] or (period == 'year' and start_date)):
                 daily_stats = queryset.values('date_learned').annotate(
                     new=Count('id', filter=Q(status='new')),
                     learning=Count('id', filter=Q(status='learning')),
@@ -1633,19 +1405,20 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
 
             # Language breakdown
             language_breakdown = []
-            language_stats = queryset.values(
-                'target_language__code',
-                'target_language__name_english'
-            ).annotate(
-                new_count=Count('id', filter=Q(status='new')),
-                learning_count=Count('id', filter=Q(status='learning')),
-                learned_count=Count('id', filter=Q(status='learned')),
-                mastered_count=Count('id', filter=Q(status='mastered')),
-                total_count=Count('id')
-            ).order_by('-total_count')
-
-            for lang_stat in language_stats:
-                if lang_stat['total_count'] > 0:
+            if has_activity and 'language' in include:
+                language_stats = queryset.values(
+                    'target_language__code',
+                    'target_language__name_english'
+                ).annotate(
+                    new_count=Count('id', filter=Q(status='new')),
+                    learning_count=Count('id', filter=Q(status='learning')),
+                    learned_count=Count('id', filter=Q(status='learned')),
+                    mastered_count=Count('id', filter=Q(status='mastered')),
+                    total_count=Count('id')
+                ).order_by('-total_count')
+
+                # GROUP BY only yields languages that have rows, so every total is positive
+                for lang_stat in language_stats:
                     language_breakdown.append({
                         'language_code': lang_stat['target_language__code'],
                         'language_name': lang_stat['target_language__name_english'],
@@ -1668,22 +1441,7 @@ class WordsLearnedStatsView(ProgressLoggingMixin, generics.GenericAPIView):
                 'daily_breakdown': daily_breakdown,
                 'language_breakdown': language_breakdown
             }
-
-            # Log successful response with statistics
-            stats_info = (
-                f"Stats for {period}: {total_count} total words "
-                f"({learned_count} learned, {mastered_count} mastered), "
-                f"{len(language_breakdown)} languages, "
-                f"{len(daily_breakdown)} days with activity"
-            )
-
-            self.log_progress_request(
-                request,
-                'WORDS_STATS_SUCCESS',
-                request.path,
-                additional_info=stats_info,
-                response_status=200
-            )
+            set_words_stats(user.id, period, language_filter, include, today, response_data)
 
             return Response(response_data, status=status.HTTP_200_OK)
 
@@ -1711,7 +1469,7 @@ class QuizProgressDetailView(ProgressLoggingMixin, generics.RetrieveAPIView):
 
     def get_queryset(self):
         # Handle Swagger schema generation
-        if getattr(self, 'swagger_fake_view', False):
+        if self._is_schema_gen():
             return QuizProgress.objects.none()
         return QuizProgress.objects.filter(user=self.request.user).select_related('language')
 
@@ -1724,31 +1482,8 @@ class QuizProgressDetailView(ProgressLoggingMixin, generics.RetrieveAPIView):
     )
     def get(self, request, *args, **kwargs):
         quiz_id = kwargs.get('pk')
-        self.log_progress_request(
-            request,
-            'GET_QUIZ_DETAIL_ATTEMPT',
-            request.path,
-            additional_info=f"Retrieving quiz progress ID: {quiz_id}"
-        )
-
         try:
-            response = super().get(request, *args, **kwargs)
-
-            if response.status_code == 200:
-                quiz_data = response.data
-                language_name = quiz_data.get('language', {}).get('name_english', 'Unknown')
-                accuracy = quiz_data.get('accuracy_percentage', 'Unknown')
-                total_questions = quiz_data.get('total_questions', 'Unknown')
-                correct_answers = quiz_data.get('correct_answers', 'Unknown')
-
-                self.log_progress_request(
-                    request,
-                    'GET_QUIZ_DETAIL_SUCCESS',
-                    request.path,
-                    additional_info=f"Retrieved quiz ID: {quiz_id}, Language: {language_name}, Score: {correct_answers}/{total_questions} ({accuracy}%)"
-                )
-
-            return response
+            return super().get(request, *args, **kwargs)
 
         except Exception as e:
             self.log_progress_request(
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib import messages
+from django.db.models import F
 from django.shortcuts import render, redirect
 from django.urls import path
 
@@ -7,6 +8,9 @@ from .csv_import import WordCSVImporter, CSVImportError
 from .forms import CSVImportForm
 from .models import Word, WordTranslation, WordExample
 
+# Сколько предупреждений и ошибок импорта показывать отдельными сообщениями
+IMPORT_MESSAGES_LIMIT = 5
+
 
 class WordTranslationInline(admin.TabularInline):
     """Inline для переводов слов"""
@@ -50,6 +54,15 @@ class WordAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_formset(self, request, form, formset, change):
+        """Для новых переводов из inline создаем и обратные"""
+        super().save_formset(request, form, formset, change)
+        if formset.model is WordTranslation:
+            for translation in formset.new_objects:
+                WordTranslation.objects.create_bidirectional(
+                    translation.source_word, translation.target_word, translation.confidence, translation.notes
+                )
+
     def get_urls(self):
         """Добавляем URL для импорта CSV"""
         urls = super().get_urls()
@@ -75,13 +88,9 @@ class WordAdmin(admin.ModelAdmin):
 
                     messages.success(request, success_msg)
 
-                    # Добавляем предупреждения
-                    for warning in result['warnings']:
-                        messages.warning(request, warning)
-
-                    # Добавляем ошибки
-                    for error in result['errors']:
-                        messages.error(request, error)
+                    # Добавляем предупреждения и ошибки
+                    self._add_import_messages(request, messages.WARNING, result['warnings'], 'Предупреждений')
+                    self._add_import_messages(request, messages.ERROR, result['errors'], 'Ошибок')
 
                     return redirect('..')
 
@@ -101,6 +110,18 @@ class WordAdmin(admin.ModelAdmin):
 
         return render(request, 'admin/words/word/import_csv.html', context)
 
+    def _add_import_messages(self, request, level, items, label):
+        """Короткий список сообщениями по одному, длинный - одним сводным сообщением"""
+        if len(items) <= IMPORT_MESSAGES_LIMIT:
+            for item in items:
+                messages.add_message(request, level, item)
+            return
+        # Каждое сообщение хранится в сессии до показа, поэтому их число ограничено
+        messages.add_message(
+            request, level,
+            f"{label}: {len(items)}, первые {IMPORT_MESSAGES_LIMIT}: " + '; '.join(items[:IMPORT_MESSAGES_LIMIT])
+        )
+
     def changelist_view(self, request, extra_context=None):
         """Добавляем кнопку импорта в список"""
         extra_context = extra_context or {}
@@ -136,20 +157,31 @@ class WordTranslationAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        """Новый перевод сохраняется вместе с обратным"""
+        super().save_model(request, obj, form, change)
+        if not change:
+            WordTranslation.objects.create_bidirectional(obj.source_word, obj.target_word, obj.confidence, obj.notes)
+
     def source_language(self, obj):
         """Язык исходного слова"""
-        return obj.source_word.language.name_english
+        return obj.source_language_name
     source_language.short_description = 'Исходный язык'
+    source_language.admin_order_field = 'source_language_name'
 
     def target_language(self, obj):
         """Язык целевого слова"""
-        return obj.target_word.language.name_english
+        return obj.target_language_name
     target_language.short_description = 'Целевой язык'
+    target_language.admin_order_field = 'target_language_name'
 
     def get_queryset(self, request):
-        """Оптимизированный queryset"""
+        """Оптимизированный queryset, названия языков приходят готовыми колонками"""
         return super().get_queryset(request).select_related(
             'source_word__language', 'target_word__language'
+        ).annotate(
+            source_language_name=F('source_word__language__name_english'),
+            target_language_name=F('target_word__language__name_english'),
         )
 
 
@@ -177,8 +209,9 @@ class WordExampleAdmin(admin.ModelAdmin):
 
     def word_language(self, obj):
         """Язык слова"""
-        return obj.word.language.name_english
+        return obj.word_language_name
     word_language.short_description = 'Язык слова'
+    word_language.admin_order_field = 'word_language_name'
 
     def example_text_short(self, obj):
         """Сокращенный текст примера"""
@@ -189,4 +222,4 @@ class WordExampleAdmin(admin.ModelAdmin):
         """Оптимизированный queryset"""
         return super().get_queryset(request).select_related(
             'word__language', 'translation_language'
-        )
\ No newline at end of file
+        ).annotate(word_language_name=F('word__language__name_english'))
\ No newline at end of file
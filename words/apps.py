@@ -5,3 +5,6 @@ class WordsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'words'
     verbose_name = 'Слова'
+
+    def ready(self):
+        import words.signals
@@ -0,0 +1,28 @@
+"""Кэш статистики по словам"""
+from django.core.cache import cache
+
+WORD_STATS_TTL = 3600
+WORD_STATS_VERSION_KEY = 'words:stats:version'
+
+
+def _word_stats_key():
+    # Версия увеличивается при каждом изменении слов, старые записи просто истекают
+    return f'words:stats:v{cache.get(WORD_STATS_VERSION_KEY, 0)}'
+
+
+def get_word_stats():
+    """Данные статистики из кэша или None"""
+    return cache.get(_word_stats_key())
+
+
+def set_word_stats(data):
+    """Сохранение данных статистики"""
+    cache.set(_word_stats_key(), data, WORD_STATS_TTL)
+
+
+def invalidate_word_stats():
+    """Сброс закэшированной статистики"""
+    try:
+        cache.incr(WORD_STATS_VERSION_KEY)
+    except ValueError:
+        cache.set(WORD_STATS_VERSION_KEY, 1, None)
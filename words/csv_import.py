@@ -1,11 +1,28 @@
 ﻿import csv
+import functools
 import io
-from django.db import transaction
-from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from .cache import invalidate_word_stats
 from .models import Word, WordTranslation, DifficultyLevel
 from languages.models import Language
 from parts_of_speech.models import PartOfSpeech
 
+# Размер пакета для bulk_create/bulk_update
+BATCH_SIZE = 1000
+
+# Уровни сложности для разбора колонки level, вычисляются один раз
+LEVEL_CHOICES = dict(DifficultyLevel.choices)
+LEVEL_BY_LABEL = {label.lower(): key for key, label in LEVEL_CHOICES.items()}
+LEVEL_LABELS = tuple((key, label.lower()) for key, label in LEVEL_CHOICES.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _norm_code(value):
+    """Нормализация кода языка; коды повторяются из строки в строку"""
+    return value.strip().lower()
+
 
 class CSVImportError(Exception):
     """Исключение для ошибок импорта CSV"""
@@ -15,25 +32,36 @@ class CSVImportError(Exception):
 class WordCSVImporter:
     """Класс для импорта слов из CSV файла"""
     
-    def __init__(self):
+    def __init__(self, use_copy=False):
+        # COPY через временную таблицу вместо пакетных INSERT, только для PostgreSQL
+        self.use_copy = use_copy
         self.errors = []
         self.warnings = []
         self.created_words = 0
         self.created_translations = 0
         self.skipped_rows = 0
+        self._lang_cache = {}
+        self._pos_cache = {}
     
     def import_from_file(self, csv_file):
-        """Импорт слов из CSV файла"""
+        """Импорт слов из CSV файла с построчным декодированием"""
+        # UploadedFile оборачивает настоящий файл в .file, открытый файл передается как есть
+        stream = io.TextIOWrapper(getattr(csv_file, 'file', csv_file), encoding='utf-8', newline='')
         try:
-            content = csv_file.read().decode('utf-8')
-            csv_file.seek(0)
-            return self.import_from_content(content)
+            return self.import_from_content(stream)
         except UnicodeDecodeError:
             raise CSVImportError("Ошибка кодировки файла. Используйте UTF-8.")
+        finally:
+            # Не даем обертке закрыть исходный файл
+            stream.detach()
     
     def import_from_content(self, content):
-        """Импорт слов из содержимого CSV"""
-        reader = csv.DictReader(io.StringIO(content))
+        """Импорт слов из содержимого CSV: строки или текстового файла"""
+        # csv.reader отдает списки: индексы колонок определяются один раз по заголовку,
+        # вместо словаря на каждую строку, как в DictReader
+        reader = csv.reader(io.StringIO(content) if isinstance(content, str) else content)
+        header = next(reader, [])
+        col = {name: index for index, name in enumerate(header)}
         
         required_columns = [
             'source_language_code', 'target_language_code', 
@@ -42,25 +70,53 @@ class WordCSVImporter:
         ]
         
         part_of_speech_col = None
-        if 'part_of_speech' in reader.fieldnames:
-            part_of_speech_col = 'part_of_speech'
-        elif 'part_f_speech' in reader.fieldnames:
-            part_of_speech_col = 'part_f_speech'
+        if 'part_of_speech' in col:
+            part_of_speech_col = col['part_of_speech']
+        elif 'part_f_speech' in col:
+            part_of_speech_col = col['part_f_speech']
         else:
             required_columns.append('part_of_speech')
         
-        if not all(col in reader.fieldnames for col in required_columns):
-            missing_cols = [col for col in required_columns if col not in reader.fieldnames]
+        missing_cols = [name for name in required_columns if name not in col]
+        if missing_cols:
             raise CSVImportError(f"Отсутствуют обязательные колонки: {', '.join(missing_cols)}")
         
+        # Пустые строки пропускаются, как это делал DictReader
+        rows = [row for row in reader if row]
+        source_lang_col = col['source_language_code']
+        target_lang_col = col['target_language_code']
+
+        # Языки и части речи одним запросом на импорт, а не тремя на строку
+        language_codes = set()
+        part_of_speech_codes = set()
+        for row in rows:
+            for index in (source_lang_col, target_lang_col):
+                if index < len(row) and row[index]:
+                    language_codes.add(_norm_code(row[index]))
+            if part_of_speech_col is not None and part_of_speech_col < len(row) and row[part_of_speech_col]:
+                part_of_speech_codes.add(row[part_of_speech_col].strip())
+        self._lang_cache.update(Language.objects.in_bulk(language_codes - self._lang_cache.keys(), field_name='code'))
+        self._pos_cache.update(PartOfSpeech.objects.in_bulk(part_of_speech_codes - self._pos_cache.keys(), field_name='code'))
+
+        entries = []
+        for row_num, row in enumerate(rows, start=2):
+            # Ожидаемые ошибки строки возвращаются как текст, исключения остаются для неожиданных
+            try:
+                entry, error = self._process_row(row, col, row_num, part_of_speech_col)
+            except Exception as e:
+                entry, error = None, str(e)
+            if error is None:
+                entries.append(entry)
+            else:
+                self.errors.append(f"Строка {row_num}: {error}")
+                self.skipped_rows += 1
+
         with transaction.atomic():
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    self._process_row(row, row_num, part_of_speech_col)
-                except Exception as e:
-                    self.errors.append(f"Строка {row_num}: {str(e)}")
-                    self.skipped_rows += 1
-        
+            words = self._save_words(entries)
+            self._save_translations(entries, words)
+        # bulk_create не отправляет сигналы, статистику сбрасываем сами
+        invalidate_word_stats()
+
         return {
             'created_words': self.created_words,
             'created_translations': self.created_translations,
@@ -69,45 +125,43 @@ class WordCSVImporter:
             'warnings': self.warnings
         }
     
-    def _process_row(self, row, row_num, part_of_speech_col):
-        """Обработка одной строки CSV"""
-        source_lang_code = row['source_language_code'].strip().lower()
-        target_lang_code = row['target_language_code'].strip().lower()
-        word_text = row['word'].strip()
-        translation_text = row['translation'].strip()
-        transcription = row['transcription'].strip()
-        audio_url = row['audio_url'].strip()
-        part_of_speech_code = row[part_of_speech_col].strip() if part_of_speech_col else ''
-        level = row['level'].strip().upper()
+    def _process_row(self, row, col, row_num, part_of_speech_col):
+        """Разбор и проверка одной строки CSV, возвращает (запись, None) или (None, ошибка)"""
+        if len(row) < len(col):
+            # Недостающие в конце строки значения считаются пустыми
+            row = row + [''] * (len(col) - len(row))
+        source_lang_code = _norm_code(row[col['source_language_code']])
+        target_lang_code = _norm_code(row[col['target_language_code']])
+        word_text = row[col['word']].strip()
+        translation_text = row[col['translation']].strip()
+        transcription = row[col['transcription']].strip()
+        audio_url = row[col['audio_url']].strip()
+        part_of_speech_code = row[part_of_speech_col].strip() if part_of_speech_col is not None else ''
+        level = row[col['level']].strip().upper()
         
         if not all([source_lang_code, target_lang_code, word_text, translation_text, part_of_speech_code]):
-            raise ValidationError("Обязательные поля не могут быть пустыми")
+            return None, "Обязательные поля не могут быть пустыми"
         
-        try:
-            source_language = Language.objects.get(code=source_lang_code)
-        except Language.DoesNotExist:
-            raise ValidationError(f"Язык с кодом '{source_lang_code}' не найден")
+        source_language = self._lang_cache.get(source_lang_code)
+        if source_language is None:
+            return None, f"Язык с кодом '{source_lang_code}' не найден"
         
-        try:
-            target_language = Language.objects.get(code=target_lang_code)
-        except Language.DoesNotExist:
-            raise ValidationError(f"Язык с кодом '{target_lang_code}' не найден")
+        target_language = self._lang_cache.get(target_lang_code)
+        if target_language is None:
+            return None, f"Язык с кодом '{target_lang_code}' не найден"
         
-        try:
-            part_of_speech = PartOfSpeech.objects.get(code=part_of_speech_code)
-        except PartOfSpeech.DoesNotExist:
-            raise ValidationError(f"Часть речи с кодом '{part_of_speech_code}' не найдена")
+        part_of_speech = self._pos_cache.get(part_of_speech_code)
+        if part_of_speech is None:
+            return None, f"Часть речи с кодом '{part_of_speech_code}' не найдена"
         
         if level:
-            level_choices = dict(DifficultyLevel.choices)
-            if level not in level_choices:
-                level_mapping = {v.lower(): k for k, v in level_choices.items()}
+            if level not in LEVEL_CHOICES:
                 level_lower = level.lower()
-                if level_lower in level_mapping:
-                    level = level_mapping[level_lower]
+                if level_lower in LEVEL_BY_LABEL:
+                    level = LEVEL_BY_LABEL[level_lower]
                 else:
-                    for choice_key, choice_value in level_choices.items():
-                        if level_lower in choice_value.lower() or choice_value.lower() in level_lower:
+                    for choice_key, choice_value in LEVEL_LABELS:
+                        if level_lower in choice_value or choice_value in level_lower:
                             level = choice_key
                             break
                     else:
@@ -116,54 +170,209 @@ class WordCSVImporter:
         else:
             level = DifficultyLevel.BEGINNER
         
-        source_word, created = Word.objects.get_or_create(
-            word=word_text,
-            language=source_language,
-            defaults={
-                'transcription': transcription,
-                'part_of_speech': part_of_speech,
-                'difficulty_level': level,
-                'audio_url': audio_url,
-            }
-        )
+        return {
+            'source_language': source_language,
+            'target_language': target_language,
+            'word': word_text,
+            'translation': translation_text,
+            'transcription': transcription,
+            'audio_url': audio_url,
+            'part_of_speech': part_of_speech,
+            'level': level,
+        }, None
+    
+    def _fetch_words(self, keys):
+        """Загрузка слов по парам (слово, id языка) одним запросом"""
+        texts_by_language = {}
+        for word_text, language_id in keys:
+            texts_by_language.setdefault(language_id, set()).add(word_text)
         
-        if created:
-            self.created_words += 1
-        else:
-            updated = False
-            if not source_word.transcription and transcription:
-                source_word.transcription = transcription
-                updated = True
-            if not source_word.audio_url and audio_url:
-                source_word.audio_url = audio_url
-                updated = True
-            if updated:
-                source_word.save()
-        
-        target_word, created = Word.objects.get_or_create(
-            word=translation_text,
-            language=target_language,
-            defaults={
-                'part_of_speech': part_of_speech,
-                'difficulty_level': level,
-            }
-        )
+        condition = Q()
+        for language_id, texts in texts_by_language.items():
+            condition |= Q(language_id=language_id, word__in=texts)
+        if not condition:
+            return {}
+        return {(word.word, word.language_id): word for word in Word.objects.filter(condition)}
+    
+    def _save_words(self, entries):
+        """Создание новых слов и дополнение существующих пакетными запросами"""
+        keys = set()
+        for entry in entries:
+            keys.add((entry['word'], entry['source_language'].id))
+            keys.add((entry['translation'], entry['target_language'].id))
         
-        if created:
-            self.created_words += 1
+        words = self._fetch_words(keys)
+        new_words = {}
+        changed_words = {}
         
-        translation, created = WordTranslation.objects.get_or_create(
-            source_word=source_word,
-            target_word=target_word,
-            defaults={
-                'confidence': 1.0,
-                'notes': f'Импортировано из CSV (часть речи: {part_of_speech.code})'
-            }
-        )
+        for entry in entries:
+            key = (entry['word'], entry['source_language'].id)
+            source_word = words.get(key)
+            if source_word is None:
+                words[key] = new_words[key] = Word(
+                    word=entry['word'],
+                    language=entry['source_language'],
+                    transcription=entry['transcription'],
+                    part_of_speech=entry['part_of_speech'],
+                    difficulty_level=entry['level'],
+                    audio_url=entry['audio_url'],
+                )
+            else:
+                updated = False
+                if not source_word.transcription and entry['transcription']:
+                    source_word.transcription = entry['transcription']
+                    updated = True
+                if not source_word.audio_url and entry['audio_url']:
+                    source_word.audio_url = entry['audio_url']
+                    updated = True
+                if updated and key not in new_words:
+                    changed_words[key] = source_word
+            
+            key = (entry['translation'], entry['target_language'].id)
+            if key not in words:
+                words[key] = new_words[key] = Word(
+                    word=entry['translation'],
+                    language=entry['target_language'],
+                    part_of_speech=entry['part_of_speech'],
+                    difficulty_level=entry['level'],
+                )
+        
+        # Существующие слова с дополненными полями идут в тот же INSERT ... ON CONFLICT DO UPDATE.
+        # Значения уже объединены выше, поэтому заполненные поля не затираются
+        filled_words = [
+            Word(
+                word=word.word,
+                language_id=word.language_id,
+                transcription=word.transcription,
+                part_of_speech_id=word.part_of_speech_id,
+                difficulty_level=word.difficulty_level,
+                audio_url=word.audio_url,
+            )
+            for word in changed_words.values()
+        ]
+        if (new_words or filled_words) and self._copy_enabled():
+            now = timezone.now()
+            self._copy_rows(
+                Word,
+                ['word', 'language', 'transcription', 'part_of_speech', 'difficulty_level',
+                 'audio_url', 'active', 'created_at', 'updated_at'],
+                (
+                    (word.word, word.language_id, word.transcription, word.part_of_speech_id,
+                     word.difficulty_level, word.audio_url, True, now, now)
+                    for word in [*new_words.values(), *filled_words]
+                ),
+                'ON CONFLICT (word, language_id) DO UPDATE SET transcription = EXCLUDED.transcription, '
+                'audio_url = EXCLUDED.audio_url, updated_at = EXCLUDED.updated_at',
+            )
+        elif new_words or filled_words:
+            Word.objects.bulk_create(
+                [*new_words.values(), *filled_words],
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['word', 'language'],
+                update_fields=['transcription', 'audio_url', 'updated_at'],
+            )
+        self.created_words += len(new_words)
+        
+        # Первичные ключи новых слов перечитываем одним запросом
+        return self._fetch_words(keys) if new_words else words
+    
+    def _save_translations(self, entries, words):
+        """Создание переводов вместе с обратными переводами пакетными запросами"""
+        pairs = {}
+        for entry in entries:
+            source_word = words[(entry['word'], entry['source_language'].id)]
+            target_word = words[(entry['translation'], entry['target_language'].id)]
+            pairs.setdefault(
+                (source_word.id, target_word.id),
+                f"Импортировано из CSV (часть речи: {entry['part_of_speech'].code})"
+            )
+        if not pairs:
+            return
+        
+        word_ids = {word_id for pair in pairs for word_id in pair}
+        existing = {
+            (translation.source_word_id, translation.target_word_id): translation
+            for translation in WordTranslation.objects.filter(
+                source_word_id__in=word_ids, target_word_id__in=word_ids
+            )
+        }
+        known_pairs = set(existing)
+        new_translations = []
+        changed_translations = []
         
-        if created:
+        for pair, notes in pairs.items():
+            translation = existing.get(pair)
+            if translation is not None:
+                if 'Импортировано из CSV' not in translation.notes:
+                    translation.notes += f' | {notes}'
+                    changed_translations.append(translation)
+                continue
+            if pair in known_pairs:
+                # Уже создан как обратный перевод одной из предыдущих строк
+                continue
+            
+            # Оба направления строятся явно, как в WordTranslation.objects.create_bidirectional
+            for source_word_id, target_word_id in (pair, pair[::-1]):
+                if (source_word_id, target_word_id) not in known_pairs:
+                    new_translations.append(WordTranslation(
+                        source_word_id=source_word_id,
+                        target_word_id=target_word_id,
+                        confidence=1.0,
+                        notes=notes
+                    ))
+                    known_pairs.add((source_word_id, target_word_id))
             self.created_translations += 1
+        
+        if new_translations and self._copy_enabled():
+            now = timezone.now()
+            self._copy_rows(
+                WordTranslation,
+                ['source_word', 'target_word', 'confidence', 'notes', 'created_at', 'updated_at'],
+                (
+                    (translation.source_word_id, translation.target_word_id,
+                     translation.confidence, translation.notes, now, now)
+                    for translation in new_translations
+                ),
+                'ON CONFLICT DO NOTHING',
+            )
         else:
-            if 'Импортировано из CSV' not in translation.notes:
-                translation.notes += f' | Импортировано из CSV (часть речи: {part_of_speech.code})'
-                translation.save()
+            WordTranslation.objects.bulk_create(new_translations, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        
+        if changed_translations:
+            now = timezone.now()
+            for translation in changed_translations:
+                translation.updated_at = now
+            WordTranslation.objects.bulk_update(changed_translations, ['notes', 'updated_at'], batch_size=BATCH_SIZE)
+    
+    def _copy_enabled(self):
+        return self.use_copy and connection.vendor == 'postgresql'
+    
+    def _copy_rows(self, model, field_names, rows, on_conflict):
+        """Загрузка строк через COPY во временную таблицу и один INSERT ... SELECT из нее"""
+        fields = [model._meta.get_field(name) for name in field_names]
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        staging = quote(f'{model._meta.db_table}_import')
+        columns = ', '.join(quote(field.column) for field in fields)
+        definitions = ', '.join(f'{quote(field.column)} {field.db_type(connection)}' for field in fields)
+        
+        buffer = io.StringIO()
+        # Значения приводятся к виду для базы так же, как при обычном INSERT
+        csv.writer(buffer).writerows(
+            [field.get_db_prep_save(value, connection) for field, value in zip(fields, row)] for row in rows
+        )
+        buffer.seek(0)
+        # Пустая строка без кавычек в CSV для COPY означает NULL, а все колонки здесь NOT NULL
+        copy_sql = f'COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL ({columns}))'
+        
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {staging}')
+            cursor.execute(f'CREATE TEMP TABLE {staging} ({definitions}) ON COMMIT DROP')
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):
+                raw_cursor.copy_expert(copy_sql, buffer)
+            else:
+                with raw_cursor.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            cursor.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} {on_conflict}')
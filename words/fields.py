@@ -0,0 +1,35 @@
+from django import forms
+from django.db import models
+from django.db.models import lookups
+
+
+class ScaledFloatField(models.PositiveSmallIntegerField):
+    """
+    Дробное значение от 0 до 1, хранящееся в базе целым числом тысячных.
+    В Python и в API остается float, в базе занимает 2 байта вместо 8.
+    """
+    SCALE = 1000
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return value / self.SCALE
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        return float(value)
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return super().get_prep_value(round(float(value) * self.SCALE))
+
+    def formfield(self, **kwargs):
+        # Форма работает с исходной дробью, а не с целыми тысячными
+        return models.Field.formfield(self, form_class=forms.FloatField, min_value=0, max_value=1, **kwargs)
+
+
+# Целочисленные поля округляют дробную границу в gte/lt до масштабирования, здесь это не нужно
+ScaledFloatField.register_lookup(lookups.GreaterThanOrEqual)
+ScaledFloatField.register_lookup(lookups.LessThan)
@@ -27,25 +27,32 @@ class Command(BaseCommand):
         
         self.stdout.write(f'Найдено {existing_translations.count()} существующих переводов')
         
-        for translation in existing_translations:
+        # Все пары (источник, цель) одним запросом вместо проверки exists() на каждый перевод
+        pairs = set(existing_translations.values_list('source_word_id', 'target_word_id'))
+        reverse_translations = []
+        
+        # Слова и языки для вывода загружаются тем же запросом, а не отдельно на каждый перевод
+        for translation in existing_translations.select_related(
+            'source_word__language', 'target_word__language'
+        ).only(
+            'confidence', 'notes',
+            'source_word__word', 'source_word__language__code',
+            'target_word__word', 'target_word__language__code',
+        ).iterator(chunk_size=2000):
             source = translation.source_word
             target = translation.target_word
             
             # Проверяем, есть ли уже обратный перевод
-            reverse_exists = WordTranslation.objects.filter(
-                source_word=target,
-                target_word=source
-            ).exists()
+            reverse_pair = (translation.target_word_id, translation.source_word_id)
             
-            if not reverse_exists:
-                if not dry_run:
-                    # Создаем обратный перевод
-                    WordTranslation.objects.create(
-                        source_word=target,
-                        target_word=source,
-                        confidence=translation.confidence,
-                        notes=translation.notes
-                    )
+            if reverse_pair not in pairs:
+                pairs.add(reverse_pair)
+                reverse_translations.append(WordTranslation(
+                    source_word_id=translation.target_word_id,
+                    target_word_id=translation.source_word_id,
+                    confidence=translation.confidence,
+                    notes=translation.notes
+                ))
                 
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -61,6 +68,10 @@ class Command(BaseCommand):
                 )
                 skipped_count += 1
         
+        if not dry_run:
+            # Создаем обратные переводы пакетами
+            WordTranslation.objects.bulk_create(reverse_translations, batch_size=1000, ignore_conflicts=True)
+        
         if dry_run:
             self.stdout.write(
                 self.style.WARNING(
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('parts_of_speech', '0001_initial'),
+        ('words', '0005_alter_word_audio_url'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='word',
+            name='words_word_languag_ce51b9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['language', 'active', 'word'], name='word_lang_active_word_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['language', 'part_of_speech', 'difficulty_level'], name='word_lang_pos_diff_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:43
+
+import words.fields
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Round
+
+
+def scale_confidence(apps, schema_editor):
+    WordTranslation = apps.get_model('words', 'WordTranslation')
+    WordTranslation.objects.update(confidence_scaled=Round(F('confidence') * 1000))
+
+
+def unscale_confidence(apps, schema_editor):
+    WordTranslation = apps.get_model('words', 'WordTranslation')
+    WordTranslation.objects.update(confidence=F('confidence_scaled') / 1000.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('words', '0006_word_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='wordtranslation',
+            name='words_wordt_confide_a6866c_idx',
+        ),
+        migrations.AddField(
+            model_name='wordtranslation',
+            name='confidence_scaled',
+            field=words.fields.ScaledFloatField(default=1.0, help_text='Уверенность в переводе (0.0 - 1.0)'),
+        ),
+        migrations.RunPython(scale_confidence, unscale_confidence),
+        migrations.RemoveField(
+            model_name='wordtranslation',
+            name='confidence',
+        ),
+        migrations.RenameField(
+            model_name='wordtranslation',
+            old_name='confidence_scaled',
+            new_name='confidence',
+        ),
+        migrations.AddIndex(
+            model_name='wordtranslation',
+            index=models.Index(fields=['confidence'], name='words_wordt_confide_a6866c_idx'),
+        ),
+    ]
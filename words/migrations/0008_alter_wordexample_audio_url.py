@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('words', '0007_scale_translation_confidence'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='wordexample',
+            name='audio_url',
+            field=models.CharField(blank=True, help_text='URL аудиофайла с произношением примера', max_length=255),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('parts_of_speech', '0001_initial'),
+        ('words', '0008_alter_wordexample_audio_url'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='word',
+            name='words_word_part_of_7c0332_idx',
+        ),
+        migrations.AlterField(
+            model_name='word',
+            name='language',
+            field=models.ForeignKey(db_index=False, help_text='Язык слова', on_delete=django.db.models.deletion.CASCADE, related_name='words', to='languages.language'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(condition=models.Q(('active', True)), fields=['word'], name='word_active_word_idx'),
+        ),
+    ]
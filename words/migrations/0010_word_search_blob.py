@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 01:59
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# Поиск идет через search_blob__icontains, в PostgreSQL это UPPER(search_blob::text) LIKE UPPER('%...%').
+# Индекс строится по тому же выражению, иначе планировщик его не использует
+SEARCH_BLOB_INDEX = 'word_search_blob_trgm_idx'
+
+
+def create_search_blob_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {SEARCH_BLOB_INDEX} ON words_word USING gin (UPPER(search_blob::text) gin_trgm_ops)'
+    )
+
+
+def drop_search_blob_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_BLOB_INDEX}')
+
+
+class Migration(migrations.Migration):
+    # Индекс не описан в Meta.indexes: тестовая база строится по моделям без миграций,
+    # и расширения pg_trgm там нет
+
+    dependencies = [
+        ('words', '0009_trim_word_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='search_blob',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('word', models.Value(' '), 'transcription'), output_field=models.TextField()),
+        ),
+        migrations.RunPython(create_search_blob_index, drop_search_blob_index),
+    ]
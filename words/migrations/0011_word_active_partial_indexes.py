@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options'),
+        ('parts_of_speech', '0001_initial'),
+        ('words', '0010_word_search_blob'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='word',
+            name='word_lang_active_word_idx',
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(condition=models.Q(('active', True)), fields=['language', 'word'], name='word_active_lang_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(condition=models.Q(('active', True)), fields=['difficulty_level', 'word'], name='word_active_diff_idx'),
+        ),
+    ]
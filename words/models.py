@@ -1,6 +1,12 @@
+from itertools import groupby
+from operator import itemgetter
+
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat
 from languages.models import Language
 from parts_of_speech.models import PartOfSpeech
+from .fields import ScaledFloatField
 
 
 class Gender(models.TextChoices):
@@ -34,6 +40,8 @@ class Word(models.Model):
         Language,
         on_delete=models.CASCADE,
         related_name='words',
+        # Составные индексы ниже начинаются с language и заменяют отдельный индекс внешнего ключа
+        db_index=False,
         help_text="Язык слова"
     )
     transcription = models.CharField(
@@ -69,6 +77,12 @@ class Word(models.Model):
         default=True,
         help_text="Активно ли слово"
     )
+    # Слово и транскрипция в одной колонке: поиск идет одним условием по одному триграммному индексу
+    search_blob = models.GeneratedField(
+        expression=Concat('word', Value(' '), 'transcription'),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -76,10 +90,15 @@ class Word(models.Model):
         return f"{self.word} ({self.language.code})"
 
     def get_translations(self):
-        """Получить все переводы слова"""
-        return WordTranslation.objects.filter(
-            models.Q(source_word=self) | models.Q(target_word=self)
-        ).select_related('source_word__language', 'target_word__language')
+        """
+        Получить все переводы слова.
+        UNION ALL двух запросов по source_word и target_word вместо OR: результат
+        можно перебирать и считать, но нельзя дальше фильтровать.
+        """
+        related = ('source_word__language', 'target_word__language')
+        as_source = WordTranslation.objects.filter(source_word=self).select_related(*related).order_by()
+        as_target = WordTranslation.objects.filter(target_word=self).select_related(*related).order_by()
+        return as_source.union(as_target, all=True).order_by('source_word__word', 'target_word__word')
 
     def get_translations_to_language(self, language_code):
         """Получить переводы слова на указанный язык"""
@@ -95,35 +114,31 @@ class Word(models.Model):
             source_word__language__code=language_code
         ).select_related('source_word')
     
+    def iter_all_translations(self):
+        """Переводы по одному в виде пар (код языка, перевод), без сборки всего словаря в памяти"""
+        # Переводы в обе стороны одним запросом, только нужные колонки без создания моделей
+        rows = WordTranslation.objects.filter(
+            models.Q(source_word_id=self.id) | models.Q(target_word_id=self.id)
+        ).values_list(
+            'source_word_id', 'source_word__word', 'source_word__language__code',
+            'target_word_id', 'target_word__word', 'target_word__language__code',
+            'confidence', 'notes'
+        ).iterator()
+        for source_id, source_text, source_lang, target_id, target_text, target_lang, confidence, notes in rows:
+            # Берем противоположную этому слову сторону перевода
+            if target_id == self.id:
+                yield source_lang, {'word': source_text, 'id': source_id, 'confidence': confidence, 'notes': notes}
+            else:
+                yield target_lang, {'word': target_text, 'id': target_id, 'confidence': confidence, 'notes': notes}
+
     def get_all_translations_dict(self):
         """Получить все переводы в виде словаря {язык: [слова]}"""
-        translations_dict = {}
-        
-        # Получаем переводы, где это слово является источником
-        for translation in self.translations_as_source.select_related('target_word__language'):
-            lang_code = translation.target_word.language.code
-            if lang_code not in translations_dict:
-                translations_dict[lang_code] = []
-            translations_dict[lang_code].append({
-                'word': translation.target_word.word,
-                'id': translation.target_word.id,
-                'confidence': translation.confidence,
-                'notes': translation.notes
-            })
-        
-        # Получаем переводы, где это слово является целью
-        for translation in self.translations_as_target.select_related('source_word__language'):
-            lang_code = translation.source_word.language.code
-            if lang_code not in translations_dict:
-                translations_dict[lang_code] = []
-            translations_dict[lang_code].append({
-                'word': translation.source_word.word,
-                'id': translation.source_word.id,
-                'confidence': translation.confidence,
-                'notes': translation.notes
-            })
-        
-        return translations_dict
+        # Сортировка устойчивая, поэтому внутри языка сохраняется порядок из запроса
+        translations = sorted(self.iter_all_translations(), key=itemgetter(0))
+        return {
+            lang_code: [entry for _, entry in group]
+            for lang_code, group in groupby(translations, key=itemgetter(0))
+        }
 
     class Meta:
         unique_together = ['word', 'language']
@@ -132,13 +147,76 @@ class Word(models.Model):
         verbose_name_plural = "Слова"
         indexes = [
             models.Index(fields=['word']),
-            models.Index(fields=['language']),
-            models.Index(fields=['part_of_speech']),
             models.Index(fields=['active']),
             models.Index(fields=['difficulty_level']),
+            # Префикс language заменяет отдельный индекс внешнего ключа
+            models.Index(fields=['language', 'part_of_speech', 'difficulty_level'], name='word_lang_pos_diff_idx'),
+            # Списки почти всегда ограничены активными словами и упорядочены по слову.
+            # Частичные индексы меньше полных, и условие active в них уже выполнено
+            models.Index(fields=['word'], condition=models.Q(active=True), name='word_active_word_idx'),
+            models.Index(fields=['language', 'word'], condition=models.Q(active=True), name='word_active_lang_idx'),
+            models.Index(fields=['difficulty_level', 'word'], condition=models.Q(active=True), name='word_active_diff_idx'),
         ]
 
 
+class WordTranslationManager(models.Manager):
+    """Менеджер переводов с созданием пары прямой/обратный перевод"""
+
+    def create_bidirectional(self, source_word, target_word, confidence=1.0, notes='', update_existing=False):
+        """
+        Создание перевода и обратного перевода одним INSERT.
+        Существующие переводы пропускаются, а с update_existing получают новые confidence и notes.
+        Возвращает прямой перевод.
+        """
+        forward, _ = self.bulk_create_bidirectional(
+            [(source_word, target_word, confidence, notes)], update_existing=update_existing
+        )
+        if forward.pk is None:
+            # Пропущенные или обновленные строки не всегда возвращают первичный ключ
+            forward = self.get(source_word=source_word, target_word=target_word)
+        return forward
+
+    def bulk_create_bidirectional(self, pairs, update_existing=False, batch_size=None):
+        """
+        Переводы и обратные переводы для списка (источник, цель, confidence, notes) одним INSERT
+        или пакетами по batch_size строк. Сигналы модели при этом не отправляются.
+        Возвращает созданные объекты, прямой перевод каждой пары идет перед обратным.
+        """
+        translations = {}
+        for source_word, target_word, confidence, notes in pairs:
+            # Повтор пары в одном INSERT ... ON CONFLICT DO UPDATE недопустим, последняя пара побеждает
+            for source, target in ((source_word, target_word), (target_word, source_word)):
+                translations[(source.pk, target.pk)] = self.model(
+                    source_word=source, target_word=target, confidence=confidence, notes=notes
+                )
+        if update_existing:
+            options = {
+                'update_conflicts': True,
+                'unique_fields': ['source_word', 'target_word'],
+                'update_fields': ['confidence', 'notes', 'updated_at'],
+            }
+        else:
+            options = {'ignore_conflicts': True}
+        # Без batch_size все строки уходят одним INSERT, отдельная транзакция не нужна.
+        # Пакетную запись в транзакцию оборачивает вызывающий код
+        return self.bulk_create(list(translations.values()), batch_size=batch_size, **options)
+
+    def with_word_labels(self):
+        """
+        Переводы со словами и их языками, загружаются только колонки для "слово (код языка)".
+        Собственные колонки перевода загружаются все, поэтому save() на таких объектах безопасен.
+        """
+        return self.select_related('source_word__language', 'target_word__language').only(
+            'id', 'source_word_id', 'target_word_id', 'confidence', 'notes', 'created_at', 'updated_at',
+            'source_word__word', 'source_word__language__code',
+            'target_word__word', 'target_word__language__code',
+        )
+
+    def list_optimized(self):
+        """Переводы для списков: без текста заметок, у слов только текст и код языка"""
+        return self.with_word_labels().defer('notes')
+
+
 class WordTranslation(models.Model):
     """
     Модель для переводов слов между языками.
@@ -156,7 +234,7 @@ class WordTranslation(models.Model):
         related_name='translations_as_target',
         help_text="Целевое слово (перевод)"
     )
-    confidence = models.FloatField(
+    confidence = ScaledFloatField(
         default=1.0,
         help_text="Уверенность в переводе (0.0 - 1.0)"
     )
@@ -167,6 +245,8 @@ class WordTranslation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = WordTranslationManager()
+
     def __str__(self):
         return f"{self.source_word.word} ({self.source_word.language.code}) → {self.target_word.word} ({self.target_word.language.code})"
 
@@ -174,39 +254,14 @@ class WordTranslation(models.Model):
         """Валидация модели"""
         from django.core.exceptions import ValidationError
         
-        if self.source_word and self.target_word:
-            if self.source_word.language == self.target_word.language:
+        # Сравниваем id, чтобы не загружать языки слов
+        if self.source_word_id and self.target_word_id:
+            if self.source_word.language_id == self.target_word.language_id:
                 raise ValidationError("Исходное и целевое слово не могут быть на одном языке")
             
-            if self.source_word == self.target_word:
+            if self.source_word_id == self.target_word_id:
                 raise ValidationError("Исходное и целевое слово не могут быть одинаковыми")
 
-    def save(self, *args, **kwargs):
-        """Сохранение с автоматическим созданием обратного перевода"""
-        # Флаг для предотвращения бесконечной рекурсии
-        create_reverse = kwargs.pop("create_reverse", True)
-        
-        # Сначала сохраняем текущий перевод
-        super().save(*args, **kwargs)
-        
-        # Создаем обратный перевод, если его нет и если это разрешено
-        if create_reverse:
-            reverse_translation_exists = WordTranslation.objects.filter(
-                source_word=self.target_word,
-                target_word=self.source_word
-            ).exists()
-            
-            if not reverse_translation_exists:
-                # Создаем объект обратного перевода
-                reverse_translation = WordTranslation(
-                    source_word=self.target_word,
-                    target_word=self.source_word,
-                    confidence=self.confidence,
-                    notes=self.notes
-                )
-                # Сохраняем с флагом предотвращения рекурсии
-                reverse_translation.save(create_reverse=False)
-
     class Meta:
         unique_together = ['source_word', 'target_word']
         ordering = ['source_word__word', 'target_word__word']
@@ -245,7 +300,8 @@ class WordExample(models.Model):
         blank=True,
         help_text="Язык перевода примера"
     )
-    audio_url = models.URLField(
+    audio_url = models.CharField(
+        max_length=255,
         blank=True,
         help_text="URL аудиофайла с произношением примера"
     )
@@ -1,13 +1,45 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import serializers
+from .cache import invalidate_word_stats
 from .models import Word, WordTranslation, WordExample, Gender, DifficultyLevel
 from languages.serializers import LanguageSerializer
 from parts_of_speech.serializers import PartOfSpeechSimpleSerializer
 
 
+class ConfidenceField(serializers.FloatField):
+    """confidence хранится целыми тысячными, но в API остается дробью от 0 до 1"""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('min_value', 0.0)
+        kwargs.setdefault('max_value', 1.0)
+        kwargs.setdefault('required', False)
+        super().__init__(**kwargs)
+
+
+# Подписи вариантов выбора вычисляются один раз, а не заново для каждого слова
+GENDER_DISPLAY = dict(Gender.choices)
+DIFFICULTY_LEVEL_DISPLAY = dict(DifficultyLevel.choices)
+
+
+class WordDisplayFieldsMixin(serializers.Serializer):
+    """Поля gender_display и difficulty_level_display из готовых словарей подписей"""
+    gender_display = serializers.SerializerMethodField()
+    difficulty_level_display = serializers.SerializerMethodField()
+
+    def get_gender_display(self, obj):
+        return GENDER_DISPLAY.get(obj.gender, obj.gender)
+
+    def get_difficulty_level_display(self, obj):
+        return DIFFICULTY_LEVEL_DISPLAY.get(obj.difficulty_level, obj.difficulty_level)
+
+
 class WordExampleSerializer(serializers.ModelSerializer):
     """Сериализатор для примеров использования слов"""
     translation_language = LanguageSerializer(read_only=True)
     translation_language_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
+    # В модели обычная строка, формат URL проверяется только на входе API
+    audio_url = serializers.URLField(max_length=255, required=False, allow_blank=True)
 
     class Meta:
         model = WordExample
@@ -25,6 +57,7 @@ class WordTranslationSerializer(serializers.ModelSerializer):
     target_word = serializers.StringRelatedField(read_only=True)
     source_word_id = serializers.IntegerField(write_only=True, required=False)
     target_word_id = serializers.IntegerField(write_only=True, required=False)
+    confidence = ConfidenceField()
 
     class Meta:
         model = WordTranslation
@@ -35,10 +68,21 @@ class WordTranslationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class WordTranslationListSerializer(WordTranslationSerializer):
+    """Сериализатор для списка переводов без заметок"""
+
+    class Meta(WordTranslationSerializer.Meta):
+        fields = [
+            'id', 'source_word', 'target_word', 'source_word_id', 'target_word_id',
+            'confidence', 'created_at', 'updated_at'
+        ]
+
+
 class WordTranslationInlineSerializer(serializers.ModelSerializer):
     """Сериализатор для переводов слов при создании/обновлении слова"""
     target_word_data = serializers.DictField(write_only=True, required=False, help_text="Данные целевого слова для создания")
     target_word_id = serializers.IntegerField(write_only=True, required=False, help_text="ID существующего целевого слова")
+    confidence = ConfidenceField()
 
     class Meta:
         model = WordTranslation
@@ -62,7 +106,7 @@ class WordTranslationInlineSerializer(serializers.ModelSerializer):
         return data
 
 
-class WordSerializer(serializers.ModelSerializer):
+class WordSerializer(WordDisplayFieldsMixin, serializers.ModelSerializer):
     """Основной сериализатор для слов"""
     language = LanguageSerializer(read_only=True)
     language_id = serializers.IntegerField(write_only=True)
@@ -72,8 +116,6 @@ class WordSerializer(serializers.ModelSerializer):
     translations_as_source = WordTranslationSerializer(many=True, read_only=True)
     translations_as_target = WordTranslationSerializer(many=True, read_only=True)
     all_translations = serializers.SerializerMethodField()
-    gender_display = serializers.CharField(source='get_gender_display', read_only=True)
-    difficulty_level_display = serializers.CharField(source='get_difficulty_level_display', read_only=True)
 
     class Meta:
         model = Word
@@ -86,9 +128,34 @@ class WordSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    # Поля перевода, которые выводит WordTranslationSerializer
+    TRANSLATION_FIELDS = ('id', 'source_word_id', 'target_word_id', 'confidence', 'notes', 'created_at', 'updated_at')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Подгрузка примеров и переводов для всего списка слов, у связанных слов только слово и код языка"""
+        return queryset.select_related('language', 'part_of_speech').prefetch_related(
+            Prefetch('examples', queryset=WordExample.objects.select_related('translation_language')),
+            Prefetch(
+                'translations_as_source',
+                queryset=WordTranslation.objects.select_related('target_word__language').only(
+                    *cls.TRANSLATION_FIELDS, 'target_word__word', 'target_word__language__code'
+                )
+            ),
+            Prefetch(
+                'translations_as_target',
+                queryset=WordTranslation.objects.select_related('source_word__language').only(
+                    *cls.TRANSLATION_FIELDS, 'source_word__word', 'source_word__language__code'
+                )
+            )
+        )
+
     def get_all_translations(self, obj):
-        """Получить все переводы слова в удобном формате"""
-        return obj.get_all_translations_dict()
+        """Получить все переводы слова в удобном формате, один раз на слово за запрос"""
+        cache = self.context.setdefault('_translations_cache', {})
+        if obj.id not in cache:
+            cache[obj.id] = obj.get_all_translations_dict()
+        return cache[obj.id]
 
 
 class WordCreateUpdateSerializer(serializers.ModelSerializer):
@@ -110,15 +177,16 @@ class WordCreateUpdateSerializer(serializers.ModelSerializer):
         examples_data = validated_data.pop('examples', [])
         translations_data = validated_data.pop('translations', [])
 
-        word = Word.objects.create(**validated_data)
+        with transaction.atomic():
+            word = Word.objects.create(**validated_data)
 
-        # Создаем примеры
-        for example_data in examples_data:
-            WordExample.objects.create(word=word, **example_data)
+            # Создаем примеры одним INSERT
+            WordExample.objects.bulk_create([WordExample(word=word, **example_data) for example_data in examples_data])
 
-        # Создаем переводы
-        for translation_data in translations_data:
-            self._create_translation(word, translation_data)
+            # Создаем переводы
+            self._create_translations(word, translations_data)
+        # Примеры и новые целевые слова созданы через bulk_create без сигналов
+        invalidate_word_stats()
 
         return word
 
@@ -127,71 +195,68 @@ class WordCreateUpdateSerializer(serializers.ModelSerializer):
         examples_data = validated_data.pop('examples', [])
         translations_data = validated_data.pop('translations', [])
 
-        # Обновляем основные поля
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        with transaction.atomic():
+            # Обновляем основные поля
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
 
-        # Обновляем примеры
-        if examples_data:
-            # Удаляем существующие примеры
-            instance.examples.all().delete()
+            # Обновляем примеры
+            if examples_data:
+                # Удаляем существующие примеры
+                instance.examples.all().delete()
 
-            # Создаем новые примеры
-            for example_data in examples_data:
-                WordExample.objects.create(word=instance, **example_data)
+                # Создаем новые примеры одним INSERT
+                WordExample.objects.bulk_create([WordExample(word=instance, **example_data) for example_data in examples_data])
 
-        # Обновляем переводы
-        if translations_data:
-            # Удаляем существующие переводы где это слово является источником
-            instance.translations_as_source.all().delete()
+            # Обновляем переводы
+            if translations_data:
+                # Удаляем существующие переводы где это слово является источником
+                instance.translations_as_source.all().delete()
 
-            # Создаем новые переводы
-            for translation_data in translations_data:
-                self._create_translation(instance, translation_data)
+                # Создаем новые переводы
+                self._create_translations(instance, translations_data)
+        invalidate_word_stats()
 
         return instance
 
-    def _create_translation(self, source_word, translation_data):
-        """Создание перевода для слова с автоматическим созданием обратного перевода"""
-        target_word_data = translation_data.get('target_word_data')
-        target_word_id = translation_data.get('target_word_id')
-        confidence = translation_data.get('confidence', 1.0)
-        notes = translation_data.get('notes', '')
+    def _get_target_words(self, translations_data):
+        """Существующие целевые слова всех переводов одним запросом"""
+        ids = [data['target_word_id'] for data in translations_data if data.get('target_word_id')]
+        return Word.objects.in_bulk(ids) if ids else {}
 
-        if target_word_data:
-            # Создаем новое целевое слово
-            target_word = Word.objects.create(**target_word_data)
-        else:
-            # Используем существующее слово
-            try:
-                target_word = Word.objects.get(id=target_word_id)
-            except Word.DoesNotExist:
-                raise serializers.ValidationError(f"Слово с ID {target_word_id} не найдено")
-
-        # Проверяем, что языки разные
-        if source_word.language == target_word.language:
-            raise serializers.ValidationError("Исходное и целевое слово не могут быть на одном языке")
+    def _create_translations(self, source_word, translations_data):
+        """Создание переводов слова вместе с обратными переводами пакетными запросами"""
+        target_words = self._get_target_words(translations_data)
 
-        # Создаем прямой перевод (если не существует)
-        forward_translation, created = WordTranslation.objects.get_or_create(
-            source_word=source_word,
-            target_word=target_word,
-            defaults={
-                'confidence': confidence,
-                'notes': notes
-            }
-        )
+        # Новые целевые слова создаются одним INSERT
+        new_words = [Word(**data['target_word_data']) for data in translations_data if data.get('target_word_data')]
+        Word.objects.bulk_create(new_words)
+        new_words = iter(new_words)
 
-        # Создаем обратный перевод (если не существует)
-        backward_translation, created = WordTranslation.objects.get_or_create(
-            source_word=target_word,
-            target_word=source_word,
-            defaults={
-                'confidence': confidence,
-                'notes': notes
-            }
-        )
+        pairs = []
+        for translation_data in translations_data:
+            if translation_data.get('target_word_data'):
+                target_word = next(new_words)
+            else:
+                # Используем существующее слово
+                target_word_id = translation_data.get('target_word_id')
+                target_word = target_words.get(target_word_id)
+                if target_word is None:
+                    raise serializers.ValidationError(f"Слово с ID {target_word_id} не найдено")
+
+            # Проверяем, что языки разные, сравнивая id без загрузки самих языков
+            if source_word.language_id == target_word.language_id:
+                raise serializers.ValidationError("Исходное и целевое слово не могут быть на одном языке")
+
+            pairs.append((
+                source_word, target_word,
+                translation_data.get('confidence', 1.0), translation_data.get('notes', '')
+            ))
+
+        # Прямые и обратные переводы одним INSERT ... ON CONFLICT DO UPDATE
+        if pairs:
+            WordTranslation.objects.bulk_create_bidirectional(pairs, update_existing=True)
 
 
 class WordSimpleSerializer(serializers.ModelSerializer):
@@ -203,66 +268,118 @@ class WordSimpleSerializer(serializers.ModelSerializer):
         model = Word
         fields = ['id', 'word', 'language_code', 'transcription', 'part_of_speech_code', 'gender']
 
+    # Колонки в порядке Meta.fields
+    VALUES_COLUMNS = ('id', 'word', 'language__code', 'transcription', 'part_of_speech__code', 'gender')
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        """Строки-кортежи только с нужными колонками, без создания моделей"""
+        return queryset.values_list(*cls.VALUES_COLUMNS)
+
+    @classmethod
+    def rows_to_data(cls, rows):
+        """Те же словари, что дал бы сериализатор, но без обхода полей для каждой строки"""
+        return [dict(zip(cls.Meta.fields, row)) for row in rows]
+
+
+class WordTranslationBulkCreateSerializer(serializers.ListSerializer):
+    """Пакетное создание переводов: слова загружаются одним запросом, переводы пишутся пакетами"""
+    BATCH_SIZE = 500
+
+    def to_internal_value(self, data):
+        # Все слова списка одним запросом, проверка каждого перевода берет их из контекста
+        if isinstance(data, list):
+            word_ids = set()
+            for item in data:
+                if isinstance(item, dict):
+                    for key in ('source_word_id', 'target_word_id'):
+                        try:
+                            word_ids.add(int(item.get(key)))
+                        except (TypeError, ValueError):
+                            pass
+            words = Word.objects.in_bulk(word_ids)
+            self.context.setdefault('_words_cache', {}).update(
+                {word_id: words.get(word_id) for word_id in word_ids}
+            )
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """Создание переводов и обратных переводов, уже существующие пропускаются"""
+        words = self.context['_words_cache']
+        pairs = [
+            (
+                words[data['source_word_id']], words[data['target_word_id']],
+                data.get('confidence', 1.0), data.get('notes', '')
+            )
+            for data in validated_data
+        ]
+        requested = {(data['source_word_id'], data['target_word_id']) for data in validated_data}
+        with transaction.atomic():
+            translations = WordTranslation.objects.bulk_create_bidirectional(pairs, batch_size=self.BATCH_SIZE)
+        return [t for t in translations if (t.source_word_id, t.target_word_id) in requested]
+
 
 class WordTranslationCreateSerializer(serializers.ModelSerializer):
     """Сериализатор для создания переводов слов с автоматическим созданием обратного перевода"""
+    # Явные поля: *_id без объявления ModelSerializer делает полями только для чтения.
+    # source_word_id можно не передавать, если исходное слово пришло в context['source_word']
+    source_word_id = serializers.IntegerField(required=False)
+    target_word_id = serializers.IntegerField()
+    confidence = ConfidenceField()
 
     class Meta:
         model = WordTranslation
         fields = ['source_word_id', 'target_word_id', 'confidence', 'notes']
+        list_serializer_class = WordTranslationBulkCreateSerializer
+
+    def _get_word(self, word_id):
+        """Слово по id, один раз на запрос; None, если слова нет"""
+        words = self.context.setdefault('_words_cache', {})
+        if word_id not in words:
+            words[word_id] = Word.objects.filter(id=word_id).first()
+        return words[word_id]
 
     def validate(self, data):
         """Валидация данных перевода"""
+        source_word = self.context.get('source_word')
+        if source_word is not None:
+            data['source_word_id'] = source_word.id
+            self.context.setdefault('_words_cache', {})[source_word.id] = source_word
+        elif 'source_word_id' not in data:
+            raise serializers.ValidationError(
+                {'source_word_id': self.fields['source_word_id'].error_messages['required']}
+            )
+
         source_word_id = data.get('source_word_id')
         target_word_id = data.get('target_word_id')
 
         if source_word_id == target_word_id:
             raise serializers.ValidationError("Исходное и целевое слово не могут быть одинаковыми")
 
-        try:
-            source_word = Word.objects.get(id=source_word_id)
-            target_word = Word.objects.get(id=target_word_id)
-
-            if source_word.language == target_word.language:
-                raise serializers.ValidationError("Исходное и целевое слово не могут быть на одном языке")
-
-        except Word.DoesNotExist:
+        source_word = self._get_word(source_word_id)
+        target_word = self._get_word(target_word_id)
+        if source_word is None or target_word is None:
             raise serializers.ValidationError("Одно из слов не существует")
 
+        if source_word.language_id == target_word.language_id:
+            raise serializers.ValidationError("Исходное и целевое слово не могут быть на одном языке")
+
         return data
 
     def create(self, validated_data):
         """Создание перевода с автоматическим созданием обратного перевода"""
-        source_word_id = validated_data['source_word_id']
-        target_word_id = validated_data['target_word_id']
         confidence = validated_data.get('confidence', 1.0)
         notes = validated_data.get('notes', '')
 
-        source_word = Word.objects.get(id=source_word_id)
-        target_word = Word.objects.get(id=target_word_id)
+        # Слова уже загружены при валидации
+        source_word = self._get_word(validated_data['source_word_id'])
+        target_word = self._get_word(validated_data['target_word_id'])
 
-        # Создаем прямой перевод (если не существует)
-        forward_translation, created = WordTranslation.objects.get_or_create(
-            source_word=source_word,
-            target_word=target_word,
-            defaults={
-                'confidence': confidence,
-                'notes': notes
-            }
-        )
-
-        # Создаем обратный перевод (если не существует)
-        backward_translation, created = WordTranslation.objects.get_or_create(
-            source_word=target_word,
-            target_word=source_word,
-            defaults={
-                'confidence': confidence,
-                'notes': notes
-            }
+        # Прямой и обратный переводы одним INSERT ... ON CONFLICT DO UPDATE
+        return WordTranslation.objects.create_bidirectional(
+            source_word, target_word, confidence, notes, update_existing=True
         )
 
-        return forward_translation
-
 
 class WordSearchSerializer(serializers.Serializer):
     """Сериализатор для поиска слов"""
@@ -284,13 +401,11 @@ class WordStatsSerializer(serializers.Serializer):
     words_with_examples = serializers.IntegerField()
 
 
-class WordRandomSerializer(serializers.ModelSerializer):
+class WordRandomSerializer(WordDisplayFieldsMixin, serializers.ModelSerializer):
     """Сериализатор для случайных слов с полной информацией и переводом"""
     language = LanguageSerializer(read_only=True)
     part_of_speech = serializers.SerializerMethodField()
     examples = WordExampleSerializer(many=True, read_only=True)
-    gender_display = serializers.CharField(source='get_gender_display', read_only=True)
-    difficulty_level_display = serializers.CharField(source='get_difficulty_level_display', read_only=True)
     translation = serializers.SerializerMethodField()
 
     class Meta:
@@ -301,14 +416,46 @@ class WordRandomSerializer(serializers.ModelSerializer):
             'audio_url', 'active', 'examples', 'translation', 'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset, target_language):
+        """Подгрузка связей и перевода на target_language для всего списка слов сразу"""
+        # Те же условия, по которым random отбирает слова: перевод на нужный язык в активное слово
+        translations = WordTranslation.objects.filter(
+            target_word__language__code=target_language,
+            target_word__active=True
+        ).select_related(
+            'target_word__language',
+            'target_word__part_of_speech'
+        ).prefetch_related(
+            Prefetch(
+                'target_word__examples',
+                queryset=WordExample.objects.filter(active=True).select_related('translation_language'),
+                to_attr='active_examples'
+            )
+        )
+        return queryset.select_related('language', 'part_of_speech').prefetch_related(
+            Prefetch('examples', queryset=WordExample.objects.select_related('translation_language')),
+            Prefetch('translations_as_source', queryset=translations, to_attr='_prefetched_translation')
+        )
+
+    def _part_of_speech_labels(self, part_of_speech, language_code):
+        """Название и сокращение части речи, запрашиваются один раз на запрос для пары (часть речи, язык)"""
+        cache = self.context.setdefault('_pos_cache', {})
+        key = (part_of_speech.id, language_code)
+        if key not in cache:
+            cache[key] = {
+                'name': part_of_speech.get_translation(language_code),
+                'abbreviation': part_of_speech.get_abbreviation_translation(language_code)
+            }
+        return cache[key]
+
     def get_part_of_speech(self, obj):
         """Получить часть речи с названием на языке слова"""
         if obj.part_of_speech:
             return {
                 'id': obj.part_of_speech.id,
                 'code': obj.part_of_speech.code,
-                'name': obj.part_of_speech.get_translation(obj.language.code),
-                'abbreviation': obj.part_of_speech.get_abbreviation_translation(obj.language.code)
+                **self._part_of_speech_labels(obj.part_of_speech, obj.language.code)
             }
         return None
 
@@ -318,19 +465,26 @@ class WordRandomSerializer(serializers.ModelSerializer):
         if not target_language:
             return None
 
-        # Ищем перевод на указанный язык
-        translation = WordTranslation.objects.filter(
-            source_word=obj,
-            target_word__language__code=target_language
-        ).select_related(
-            'target_word__language',
-            'target_word__part_of_speech'
-        ).prefetch_related(
-            'target_word__examples'
-        ).first()
+        prefetched = getattr(obj, '_prefetched_translation', None)
+        if prefetched is not None:
+            # Перевод уже подгружен через setup_eager_loading
+            translation = prefetched[0] if prefetched else None
+        else:
+            # Ищем перевод на указанный язык
+            translation = WordTranslation.objects.filter(
+                source_word=obj,
+                target_word__language__code=target_language,
+                target_word__active=True
+            ).select_related(
+                'target_word__language',
+                'target_word__part_of_speech'
+            ).first()
 
         if translation:
             target_word = translation.target_word
+            examples = getattr(target_word, 'active_examples', None)
+            if examples is None:
+                examples = target_word.examples.filter(active=True)
             return {
                 'id': target_word.id,
                 'word': target_word.word,
@@ -339,16 +493,15 @@ class WordRandomSerializer(serializers.ModelSerializer):
                 'part_of_speech': {
                     'id': target_word.part_of_speech.id,
                     'code': target_word.part_of_speech.code,
-                    'name': target_word.part_of_speech.get_translation(target_word.language.code),
-                    'abbreviation': target_word.part_of_speech.get_abbreviation_translation(target_word.language.code)
+                    **self._part_of_speech_labels(target_word.part_of_speech, target_word.language.code)
                 },
                 'gender': target_word.gender,
-                'gender_display': target_word.get_gender_display(),
+                'gender_display': self.get_gender_display(target_word),
                 'difficulty_level': target_word.difficulty_level,
-                'difficulty_level_display': target_word.get_difficulty_level_display(),
+                'difficulty_level_display': self.get_difficulty_level_display(target_word),
                 'audio_url': target_word.audio_url,
                 'active': target_word.active,
-                'examples': WordExampleSerializer(target_word.examples.filter(active=True), many=True).data,
+                'examples': WordExampleSerializer(examples, many=True).data,
                 'confidence': translation.confidence,
                 'notes': translation.notes,
                 'created_at': target_word.created_at,
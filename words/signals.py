@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import invalidate_word_stats
+from .models import Word, WordExample
+
+
+@receiver(post_save, sender=Word)
+@receiver(post_delete, sender=Word)
+@receiver(post_save, sender=WordExample)
+@receiver(post_delete, sender=WordExample)
+def word_stats_changed(sender, **kwargs):
+    """
+    Сброс статистики по словам при изменении слова или примера.
+    bulk_create и update() сигналов не отправляют, там сброс вызывается явно
+    """
+    invalidate_word_stats()
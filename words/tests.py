@@ -1,41 +1,50 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
 from rest_framework import status
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
 from django.core.exceptions import ValidationError
 from languages.models import Language
 from parts_of_speech.models import PartOfSpeech
-from .models import Word, WordTranslation, WordExample, Gender
+from .csv_import import CSVImportError, WordCSVImporter
+from .models import Word, WordTranslation, WordExample, Gender, DifficultyLevel
+from .serializers import WordCreateUpdateSerializer, WordExampleSerializer, WordSerializer, WordSimpleSerializer
+from .views import WordTranslationViewSet
 
 
 class WordModelTest(TestCase):
     """Тесты для модели Word"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Создаем языки
-        self.english = Language.objects.create(
-            code='en',
-            name_english='English',
-            name_native='English'
-        )
-        self.russian = Language.objects.create(
-            code='ru',
-            name_english='Russian',
-            name_native='Русский'
-        )
+        cls.english, cls.russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
         
         # Создаем часть речи
-        self.noun = PartOfSpeech.objects.create(
+        cls.noun = PartOfSpeech.objects.create(
             code='noun',
             description='A word used to identify any of a class of people, places, or things'
         )
         
         # Создаем слово
-        self.word = Word.objects.create(
+        cls.word = Word.objects.create(
             word='house',
-            language=self.english,
+            language=cls.english,
             transcription='/haʊs/',
-            part_of_speech=self.noun,
+            part_of_speech=cls.noun,
             gender=Gender.NEUTER,
             audio_url='https://example.com/house.mp3'
         )
@@ -91,46 +100,146 @@ class WordModelTest(TestCase):
         translations_from_en = russian_word.get_translations_from_language('en')
         self.assertEqual(translations_from_en.count(), 1)
 
+    def test_get_all_translations_dict_single_query(self):
+        """Тест словаря переводов в обе стороны одним запросом"""
+        german = Language.objects.create(code='de', name_english='German', name_native='Deutsch')
+        haus = Word.objects.create(word='Haus', language=german, part_of_speech=self.noun)
+        russian_word = Word.objects.create(word='дом', language=self.russian, part_of_speech=self.noun)
+        WordTranslation.objects.create(source_word=self.word, target_word=haus)
+        WordTranslation.objects.create(source_word=russian_word, target_word=self.word, confidence=0.8)
+
+        with self.assertNumQueries(1):
+            translations = self.word.get_all_translations_dict()
+
+        self.assertEqual(translations, {
+            'de': [{'word': 'Haus', 'id': haus.id, 'confidence': 1.0, 'notes': ''}],
+            'ru': [{'word': 'дом', 'id': russian_word.id, 'confidence': 0.8, 'notes': ''}],
+        })
+
+    def test_create_serializer_inserts_examples_at_once(self):
+        """Тест создания примеров слова одним INSERT"""
+        validated_data = {
+            'word': 'table',
+            'language_id': self.english.id,
+            'part_of_speech_id': self.noun.id,
+            'examples': [{'example_text': f'Table {i}.', 'translation_language_id': self.russian.id} for i in range(3)],
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            word = WordCreateUpdateSerializer().create(validated_data)
+
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "words_wordexample"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(word.examples.filter(translation_language=self.russian).count(), 3)
+
+    def test_create_serializer_resolves_target_words_at_once(self):
+        """Тест загрузки существующих целевых слов переводов одним запросом"""
+        targets = [
+            Word.objects.create(word=text, language=self.russian, part_of_speech=self.noun)
+            for text in ('дом', 'здание', 'жилище')
+        ]
+        validated_data = {
+            'word': 'home',
+            'language_id': self.english.id,
+            'part_of_speech_id': self.noun.id,
+            'translations': [{'target_word_id': target.id} for target in targets],
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            word = WordCreateUpdateSerializer().create(validated_data)
+
+        selects = [q for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+        self.assertEqual(set(word.translations_as_source.values_list('target_word', flat=True)), {t.id for t in targets})
+
+    def test_create_serializer_inserts_translations_at_once(self):
+        """Тест создания новых целевых слов и всех переводов пакетными INSERT"""
+        target = Word.objects.create(word='дом', language=self.russian, part_of_speech=self.noun)
+        validated_data = {
+            'word': 'home',
+            'language_id': self.english.id,
+            'part_of_speech_id': self.noun.id,
+            'translations': [
+                {'target_word_id': target.id, 'confidence': 0.5},
+                {'target_word_data': {'word': 'жилище', 'language_id': self.russian.id, 'part_of_speech_id': self.noun.id}},
+                {'target_word_data': {'word': 'очаг', 'language_id': self.russian.id, 'part_of_speech_id': self.noun.id}},
+            ],
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            word = WordCreateUpdateSerializer().create(validated_data)
+
+        inserts = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len([sql for sql in inserts if sql.startswith('INSERT INTO "words_wordtranslation"')]), 1)
+        self.assertEqual(len([sql for sql in inserts if sql.startswith('INSERT INTO "words_word"')]), 2)
+        self.assertEqual(word.translations_as_source.count(), 3)
+        self.assertEqual(word.translations_as_target.count(), 3)
+        self.assertEqual(WordTranslation.objects.get(source_word=target, target_word=word).confidence, 0.5)
+
+    def test_serializer_builds_translations_once_per_word(self):
+        """Тест того, что повторное слово в ответе не запрашивает переводы заново"""
+        with mock.patch.object(Word, 'get_all_translations_dict', autospec=True, return_value={}) as build:
+            data = WordSerializer([self.word, self.word], many=True).data
+
+        build.assert_called_once_with(self.word)
+        self.assertEqual(data[1]['all_translations'], {})
+
+    def test_example_audio_url_validated_by_serializer_only(self):
+        """Тест проверки формата audio_url примера на входе API"""
+        serializer = WordExampleSerializer(data={'example_text': 'A house.', 'audio_url': 'not a url'})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('audio_url', serializer.errors)
+
+        WordExample.objects.bulk_create([WordExample(word=self.word, example_text='A house.', audio_url='/audio/house.mp3')])
+        self.assertEqual(self.word.examples.get().audio_url, '/audio/house.mp3')
+
+    def test_get_translations_covers_both_directions(self):
+        """Тест переводов, где слово является источником и целью, одним запросом"""
+        dom = Word.objects.create(word='дом', language=self.russian, part_of_speech=self.noun)
+        zdanie = Word.objects.create(word='здание', language=self.russian, part_of_speech=self.noun)
+        WordTranslation.objects.create(source_word=self.word, target_word=zdanie)
+        WordTranslation.objects.create(source_word=dom, target_word=self.word)
+
+        with self.assertNumQueries(1):
+            translations = [str(translation) for translation in self.word.get_translations()]
+
+        self.assertEqual(translations, ['house (en) → здание (ru)', 'дом (ru) → house (en)'])
+
 
 class WordTranslationModelTest(TestCase):
     """Тесты для модели WordTranslation"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Создаем языки
-        self.english = Language.objects.create(
-            code='en',
-            name_english='English',
-            name_native='English'
-        )
-        self.russian = Language.objects.create(
-            code='ru',
-            name_english='Russian',
-            name_native='Русский'
-        )
+        cls.english, cls.russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
         
         # Создаем часть речи
-        self.noun = PartOfSpeech.objects.create(
+        cls.noun = PartOfSpeech.objects.create(
             code='noun',
             description='A word used to identify any of a class of people, places, or things'
         )
         
         # Создаем слова
-        self.english_word = Word.objects.create(
+        cls.english_word = Word.objects.create(
             word='cat',
-            language=self.english,
-            part_of_speech=self.noun
+            language=cls.english,
+            part_of_speech=cls.noun
         )
-        self.russian_word = Word.objects.create(
+        cls.russian_word = Word.objects.create(
             word='кот',
-            language=self.russian,
-            part_of_speech=self.noun,
+            language=cls.russian,
+            part_of_speech=cls.noun,
             gender=Gender.MASCULINE
         )
         
         # Создаем перевод
-        self.translation = WordTranslation.objects.create(
-            source_word=self.english_word,
-            target_word=self.russian_word,
+        cls.translation = WordTranslation.objects.create(
+            source_word=cls.english_word,
+            target_word=cls.russian_word,
             confidence=0.95,
             notes='Common translation'
         )
@@ -143,6 +252,16 @@ class WordTranslationModelTest(TestCase):
         self.assertEqual(self.translation.notes, 'Common translation')
         self.assertIsNotNone(self.translation.created_at)
     
+    def test_confidence_stored_as_thousandths(self):
+        """Тест хранения уверенности целыми тысячными при работе с дробью"""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT confidence FROM words_wordtranslation WHERE id = %s', [self.translation.id])
+            self.assertEqual(cursor.fetchone()[0], 950)
+        self.translation.refresh_from_db()
+        self.assertEqual(self.translation.confidence, 0.95)
+        self.assertTrue(WordTranslation.objects.filter(confidence__gte=0.9, confidence__lt=0.96).exists())
+        self.assertFalse(WordTranslation.objects.filter(confidence__gte=0.951).exists())
+
     def test_translation_str_representation(self):
         """Тест строкового представления перевода"""
         expected = f"{self.english_word.word} ({self.english_word.language.code}) → {self.russian_word.word} ({self.russian_word.language.code})"
@@ -174,41 +293,99 @@ class WordTranslationModelTest(TestCase):
         with self.assertRaises(ValidationError):
             translation.clean()
 
+        # Проверка сравнивает id и не загружает языки
+        translation = WordTranslation(source_word=self.english_word, target_word=self.russian_word)
+        with self.assertNumQueries(0):
+            translation.clean()
+
+    def test_list_view_skips_notes(self):
+        """Тест списка переводов без колонки заметок"""
+        # Маршрут words/tr/ перекрывается детальным маршрутом слов, поэтому вызываем представление напрямую
+        view = WordTranslationViewSet.as_view({'get': 'list'})
+        with CaptureQueriesContext(connection) as queries:
+            response = view(APIRequestFactory().get('/api/v1/words/tr/'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['source_word'], 'cat (en)')
+        self.assertNotIn('notes', response.data['results'][0])
+        self.assertFalse(any('"notes"' in q['sql'] for q in queries.captured_queries))
+
+    def test_detail_view_loads_only_word_labels(self):
+        """Тест перевода одним запросом без частей речи и лишних колонок слов"""
+        view = WordTranslationViewSet.as_view({'get': 'retrieve'})
+        with CaptureQueriesContext(connection) as queries:
+            response = view(APIRequestFactory().get('/'), pk=self.translation.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['target_word'], 'кот (ru)')
+        self.assertEqual(response.data['notes'], 'Common translation')
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertNotIn('parts_of_speech', queries.captured_queries[0]['sql'])
+        self.assertNotIn('"transcription"', queries.captured_queries[0]['sql'])
+
+    def test_create_bidirectional_upserts_both_directions(self):
+        """Тест создания и обновления прямого и обратного перевода одним запросом"""
+        dog = Word.objects.create(word='dog', language=self.english, part_of_speech=self.noun)
+        sobaka = Word.objects.create(word='собака', language=self.russian, part_of_speech=self.noun)
+
+        with self.assertNumQueries(1):
+            forward = WordTranslation.objects.create_bidirectional(dog, sobaka, 0.7, 'first', update_existing=True)
+        self.assertEqual((forward.source_word, forward.target_word), (dog, sobaka))
+        self.assertIsNotNone(forward.pk)
+
+        WordTranslation.objects.create_bidirectional(dog, sobaka, 0.9, 'second', update_existing=True)
+        self.assertEqual(
+            set(WordTranslation.objects.filter(source_word__in=[dog, sobaka]).values_list('confidence', 'notes')),
+            {(0.9, 'second')}
+        )
+        self.assertEqual(WordTranslation.objects.filter(source_word__in=[dog, sobaka]).count(), 2)
+
+    def test_save_does_not_create_reverse_but_admin_does(self):
+        """Тест того, что обратный перевод создает менеджер, а не save()"""
+        self.assertFalse(WordTranslation.objects.filter(source_word=self.russian_word).exists())
+
+        dog = Word.objects.create(word='dog', language=self.english, part_of_speech=self.noun)
+        sobaka = Word.objects.create(word='собака', language=self.russian, part_of_speech=self.noun)
+        self.client.force_login(get_user_model().objects.create_superuser(email='admin@example.com', password='password123'))
+        self.client.post(reverse('admin:words_wordtranslation_add'), {
+            'source_word': dog.id, 'target_word': sobaka.id, 'confidence': 0.6, 'notes': 'admin'
+        })
+
+        self.assertEqual(
+            set(WordTranslation.objects.filter(notes='admin').values_list('source_word', 'target_word')),
+            {(dog.id, sobaka.id), (sobaka.id, dog.id)}
+        )
+
 
 class WordExampleModelTest(TestCase):
     """Тесты для модели WordExample"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Создаем язык и часть речи
-        self.english = Language.objects.create(
-            code='en',
-            name_english='English',
-            name_native='English'
-        )
-        self.russian = Language.objects.create(
-            code='ru',
-            name_english='Russian',
-            name_native='Русский'
-        )
+        cls.english, cls.russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
         
-        self.verb = PartOfSpeech.objects.create(
+        cls.verb = PartOfSpeech.objects.create(
             code='verb',
             description='A word used to describe an action, state, or occurrence'
         )
         
         # Создаем слово
-        self.word = Word.objects.create(
+        cls.word = Word.objects.create(
             word='run',
-            language=self.english,
-            part_of_speech=self.verb
+            language=cls.english,
+            part_of_speech=cls.verb
         )
         
         # Создаем пример
-        self.example = WordExample.objects.create(
-            word=self.word,
+        cls.example = WordExample.objects.create(
+            word=cls.word,
             example_text='I run every morning.',
             translation='Я бегаю каждое утро.',
-            translation_language=self.russian,
+            translation_language=cls.russian,
             audio_url='https://example.com/run_example.mp3'
         )
     
@@ -231,30 +408,28 @@ class WordAPITest(APITestCase):
     """Тесты для API слов"""
     
     def setUp(self):
+        cache.clear()
+
+    @classmethod
+    def setUpTestData(cls):
         # Создаем языки
-        self.english = Language.objects.create(
-            code='en',
-            name_english='English',
-            name_native='English'
-        )
-        self.russian = Language.objects.create(
-            code='ru',
-            name_english='Russian',
-            name_native='Русский'
-        )
+        cls.english, cls.russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
         
         # Создаем часть речи
-        self.noun = PartOfSpeech.objects.create(
+        cls.noun = PartOfSpeech.objects.create(
             code='noun',
             description='A word used to identify any of a class of people, places, or things'
         )
         
         # Создаем слово
-        self.word = Word.objects.create(
+        cls.word = Word.objects.create(
             word='book',
-            language=self.english,
+            language=cls.english,
             transcription='/bʊk/',
-            part_of_speech=self.noun,
+            part_of_speech=cls.noun,
             audio_url='https://example.com/book.mp3'
         )
     
@@ -283,6 +458,20 @@ class WordAPITest(APITestCase):
         self.assertEqual(response.data['word'], 'table')
         self.assertTrue(Word.objects.filter(word='table').exists())
     
+    def test_simple_list_loads_only_serialized_columns(self):
+        """Тест упрощенного списка слов одним запросом без лишних колонок"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('word-simple'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0],
+            WordSimpleSerializer(Word.objects.get(pk=response.data['results'][0]['id'])).data
+        )
+        # COUNT для пагинации и сама страница
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertNotIn('audio_url', queries.captured_queries[1]['sql'])
+
     def test_get_word_detail(self):
         """Тест получения детальной информации о слове"""
         url = reverse('word-detail', kwargs={'pk': self.word.pk})
@@ -292,7 +481,78 @@ class WordAPITest(APITestCase):
         self.assertEqual(response.data['word'], 'book')
         self.assertIn('language', response.data)
         self.assertIn('part_of_speech', response.data)
+        self.assertEqual((response.data['gender_display'], response.data['difficulty_level_display']), (None, 'A1'))
     
+    def test_word_detail_loads_translations_without_extra_queries(self):
+        """Тест того, что переводы слова в обе стороны не запрашиваются по одному"""
+        url = reverse('word-detail', kwargs={'pk': self.word.id})
+
+        def detail_queries(translations_count):
+            for i in range(WordTranslation.objects.count() // 2, translations_count):
+                target = Word.objects.create(word=f'книга{i}', language=self.russian, part_of_speech=self.noun)
+                WordTranslation.objects.create_bidirectional(self.word, target)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(len(response.data['translations_as_source']), translations_count)
+            self.assertEqual(response.data['translations_as_target'][0]['source_word'], 'книга0 (ru)')
+            self.assertEqual(response.data['translations_as_target'][0]['target_word'], 'book (en)')
+            return len(queries.captured_queries)
+
+        single_translation_queries = detail_queries(1)
+        self.assertEqual(detail_queries(3), single_translation_queries)
+
+    def test_add_translation(self):
+        """Тест добавления перевода к слову вместе с обратным"""
+        target = Word.objects.create(word='книга', language=self.russian, part_of_speech=self.noun)
+        self.client.force_authenticate(get_user_model().objects.create_user(email='editor@example.com', password='password123'))
+
+        response = self.client.post(
+            reverse('word-add-translation', kwargs={'pk': self.word.id}),
+            {'target_word_id': target.id, 'confidence': 0.9}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(WordTranslation.objects.filter(source_word=target, target_word=self.word).exists())
+
+    def test_add_translation_takes_source_word_from_url(self):
+        """Тест: исходное слово берется из URL, source_word_id в теле запроса игнорируется"""
+        target = Word.objects.create(word='книга', language=self.russian, part_of_speech=self.noun)
+        self.client.force_authenticate(get_user_model().objects.create_user(email='editor@example.com', password='password123'))
+
+        response = self.client.post(
+            reverse('word-add-translation', kwargs={'pk': self.word.id}),
+            {'source_word_id': target.id, 'target_word_id': target.id}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['source_word_id'], self.word.id)
+
+    def test_bulk_translations_validate_and_insert_at_once(self):
+        """Тест пакетного добавления переводов: слова одним запросом, переводы одним INSERT"""
+        targets = [
+            Word.objects.create(word=text, language=self.russian, part_of_speech=self.noun)
+            for text in ('книга', 'книжка', 'том')
+        ]
+        WordTranslation.objects.create(source_word=self.word, target_word=targets[0], confidence=0.4)
+        self.client.force_authenticate(get_user_model().objects.create_user(email='editor@example.com', password='password123'))
+        data = [{'source_word_id': self.word.id, 'target_word_id': target.id, 'confidence': 0.8} for target in targets]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('word-bulk-translations'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        sql = [q['sql'] for q in queries.captured_queries]
+        self.assertEqual(len([q for q in sql if q.startswith('SELECT') and 'FROM "words_word"' in q]), 1)
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT') and '"words_wordtranslation"' in q]), 1)
+        self.assertEqual(self.word.translations_as_source.count(), 3)
+        self.assertEqual(self.word.translations_as_target.count(), 3)
+        # Существующий перевод не перезаписывается
+        self.assertEqual(WordTranslation.objects.get(source_word=self.word, target_word=targets[0]).confidence, 0.4)
+
+        invalid = [{'source_word_id': self.word.id, 'target_word_id': self.word.id}]
+        response = self.client.post(reverse('word-bulk-translations'), invalid, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_get_active_words(self):
         """Тест получения только активных слов"""
         # Создаем неактивное слово
@@ -308,8 +568,20 @@ class WordAPITest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Должно быть только одно активное слово
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['word'], 'book')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['word'], 'book')
+
+    def test_by_difficulty_is_paginated(self):
+        """Тест постраничного вывода слов по уровню сложности"""
+        for i in range(25):
+            Word.objects.create(word=f'word{i:02d}', language=self.english, part_of_speech=self.noun)
+
+        response = self.client.get(reverse('word-by-difficulty'), {'difficulty_level': self.word.difficulty_level})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 26)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertEqual(response.data['results'][0]['word'], 'book')
     
     def test_word_search(self):
         """Тест поиска слов"""
@@ -322,9 +594,107 @@ class WordAPITest(APITestCase):
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['word'], 'book')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['word'], 'book')
+
+    def test_word_search_matches_word_or_transcription_in_one_condition(self):
+        """Тест поиска по слову и транскрипции через одну колонку search_blob"""
+        Word.objects.create(word='pen', transcription='/pen/', language=self.english, part_of_speech=self.noun)
+        self.client.force_authenticate(get_user_model().objects.create_user(email='reader@example.com', password='password123'))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('word-search'), {'query': 'bʊ'}, format='json')
+        self.assertEqual([word['word'] for word in response.data['results']], ['book'])
+        self.assertFalse(any('"transcription" LIKE' in q['sql'] for q in queries.captured_queries))
+
+        response = self.client.get(reverse('word-list'), {'search': 'pe'})
+        self.assertEqual([word['word'] for word in response.data['results']], ['pen'])
+
+    def test_word_search_is_paginated(self):
+        """Тест постраничного вывода результатов поиска"""
+        for i in range(25):
+            Word.objects.create(word=f'book{i:02d}', language=self.english, part_of_speech=self.noun)
+        self.client.force_authenticate(get_user_model().objects.create_user(email='reader@example.com', password='password123'))
+
+        response = self.client.post(reverse('word-search'), {'query': 'book'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 26)
+        self.assertEqual([word['word'] for word in response.data['results'][:2]], ['book', 'book00'])
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNotNone(response.data['next'])
     
+    def test_random_words_load_translations_for_the_whole_page(self):
+        """Тест того, что переводы, примеры и названия частей речи не запрашиваются на каждое слово"""
+        for text, translation_text in [('book', 'книга'), ('pen', 'ручка'), ('cup', 'чашка')]:
+            source = self.word if text == 'book' else Word.objects.create(
+                word=text, language=self.english, part_of_speech=self.noun
+            )
+            target = Word.objects.create(word=translation_text, language=self.russian, part_of_speech=self.noun)
+            WordTranslation.objects.create(source_word=source, target_word=target)
+            WordExample.objects.create(word=target, example_text=f'{translation_text}.', active=True)
+            WordExample.objects.create(word=target, example_text=f'{translation_text}?', active=False)
+
+        def related_queries(count):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse('word-random'), {'from': 'en', 'to': 'ru', 'count': count})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['words']), count)
+            for word in response.data['words']:
+                self.assertEqual(len(word['translation']['examples']), 1)
+            tables = ('words_wordtranslation', 'words_wordexample', 'parts_of_speech_partofspeechtranslation')
+            return [q for q in queries.captured_queries if any(table in q['sql'] for table in tables)]
+
+        self.assertEqual(len(related_queries(3)), len(related_queries(1)))
+
+    def test_random_words_sampled_without_sorting(self):
+        """Тест случайной выборки без сортировки всех слов по random() и без DISTINCT"""
+        for text, translation_text in [('pen', 'ручка'), ('cup', 'чашка')]:
+            source = Word.objects.create(word=text, language=self.english, part_of_speech=self.noun)
+            for suffix in ('', 'ка'):
+                target = Word.objects.create(word=translation_text + suffix, language=self.russian, part_of_speech=self.noun)
+                WordTranslation.objects.create(source_word=source, target_word=target)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('word-random'), {'from': 'en', 'to': 'ru', 'count': 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_available'], 2)
+        self.assertEqual(sorted(word['word'] for word in response.data['words']), ['cup', 'pen'])
+        for query in queries.captured_queries:
+            self.assertNotIn('RANDOM()', query['sql'].upper())
+            self.assertNotIn('DISTINCT', query['sql'].upper())
+
+    def test_random_words_skip_inactive_translations(self):
+        """Тест того, что в ответ попадает только перевод в активное слово"""
+        inactive = Word.objects.create(word='фолиант', language=self.russian, part_of_speech=self.noun, active=False)
+        active = Word.objects.create(word='книга', language=self.russian, part_of_speech=self.noun)
+        WordTranslation.objects.create(source_word=self.word, target_word=inactive)
+        WordTranslation.objects.create(source_word=self.word, target_word=active)
+
+        response = self.client.get(reverse('word-random'), {'from': 'en', 'to': 'ru'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['words'][0]['translation']['word'], 'книга')
+        # Даты перевода не проходят через DateTimeField, но выдаются в том же формате с 'Z'
+        rendered = json.loads(response.content)['words'][0]['translation']
+        self.assertTrue(rendered['created_at'].endswith('Z'))
+
+    def test_random_words_filter_languages_by_cached_id(self):
+        """Тест фильтра по языкам через id из кэша; неизвестный язык дает 404, как язык без слов"""
+        target = Word.objects.create(word='книга', language=self.russian, part_of_speech=self.noun)
+        WordTranslation.objects.create(source_word=self.word, target_word=target)
+        self.client.get(reverse('word-random'), {'from': 'en', 'to': 'ru'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('word-random'), {'from': 'en', 'to': 'ru'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('languages_language', queries.captured_queries[0]['sql'])
+
+        response = self.client.get(reverse('word-random'), {'from': 'en', 'to': 'xx'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('Не найдено активных слов', response.data['error'])
+
     def test_word_stats(self):
         """Тест получения статистики слов"""
         url = reverse('word-stats')
@@ -337,3 +707,176 @@ class WordAPITest(APITestCase):
         self.assertIn('words_by_part_of_speech', response.data)
         self.assertEqual(response.data['total_words'], 1)
         self.assertEqual(response.data['active_words'], 1)
+
+    def test_word_stats_counts_in_one_query(self):
+        """Тест подсчета скалярной статистики одним запросом"""
+        Word.objects.create(word='pen', language=self.english, part_of_speech=self.noun, active=False)
+        for text in ('Book one.', 'Book two.'):
+            WordExample.objects.create(word=self.word, example_text=text)
+
+        with self.assertNumQueries(4) as queries:
+            response = self.client.get(reverse('word-stats'))
+        self.assertFalse(any('name_english' in q['sql'] for q in queries.captured_queries))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_words'], 2)
+        self.assertEqual(response.data['active_words'], 1)
+        self.assertEqual(response.data['words_with_examples'], 1)
+        self.assertEqual(response.data['words_by_language'], {'en': 2})
+
+    def test_word_stats_cached_until_words_change(self):
+        """Тест повторной статистики из кэша и ее сброса при изменении примеров"""
+        url = reverse('word-stats')
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data['words_with_examples'], 0)
+        self.assertIn('max-age=60', response['Cache-Control'])
+
+        WordExample.objects.create(word=self.word, example_text='A book.')
+        response = self.client.get(url)
+        self.assertEqual(response.data['words_with_examples'], 1)
+
+
+class WordCSVImporterTest(TestCase):
+    """Тесты для импорта слов из CSV"""
+
+    HEADER = 'source_language_code,target_language_code,word,translation,transcription,audio_url,part_of_speech,level\n'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.english, cls.russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
+        cls.noun = PartOfSpeech.objects.create(code='noun')
+
+    def test_import_creates_words_and_translations(self):
+        """Тест создания слов, переводов и обратных переводов"""
+        content = self.HEADER + (
+            'en,ru,house,дом,/haʊs/,,noun,A2\n'
+            'en,ru,cat,кошка,,,noun,\n'
+            'ru,en,дом,house,,,noun,A2\n'
+            'en,de,dog,Hund,,,noun,A1\n'
+            'en,ru,,пусто,,,noun,A1\n'
+        )
+        result = WordCSVImporter().import_from_content(content)
+
+        self.assertEqual(result['created_words'], 4)
+        self.assertEqual(result['created_translations'], 2)
+        self.assertEqual(result['skipped_rows'], 2)
+        self.assertEqual(result['errors'], [
+            "Строка 5: Язык с кодом 'de' не найден",
+            "Строка 6: Обязательные поля не могут быть пустыми",
+        ])
+        house = Word.objects.get(word='house', language=self.english)
+        self.assertEqual((house.transcription, house.difficulty_level), ('/haʊs/', DifficultyLevel.ELEMENTARY))
+        self.assertEqual(WordTranslation.objects.count(), 4)
+        self.assertTrue(WordTranslation.objects.filter(source_word__word='кошка', target_word__word='cat').exists())
+
+    def test_import_fills_missing_fields_of_existing_words(self):
+        """Тест дополнения существующих слов и заметок существующих переводов"""
+        house = Word.objects.create(word='house', language=self.english, part_of_speech=self.noun)
+        dom = Word.objects.create(word='дом', language=self.russian, part_of_speech=self.noun)
+        WordTranslation.objects.create(source_word=house, target_word=dom, notes='вручную')
+
+        result = WordCSVImporter().import_from_content(
+            self.HEADER + 'en,ru,house,дом,/haʊs/,https://example.com/house.mp3,noun,A1\n'
+        )
+
+        self.assertEqual((result['created_words'], result['created_translations']), (0, 0))
+        house.refresh_from_db()
+        self.assertEqual((house.transcription, house.audio_url), ('/haʊs/', 'https://example.com/house.mp3'))
+        translation = WordTranslation.objects.get(source_word=house, target_word=dom)
+        self.assertEqual(translation.notes, 'вручную | Импортировано из CSV (часть речи: noun)')
+
+    def test_import_from_uploaded_file(self):
+        """Тест импорта из загруженного файла и ошибки кодировки"""
+        content = (self.HEADER + 'en,ru,house,дом,,,noun,A1\n').encode('utf-8')
+        result = WordCSVImporter().import_from_file(SimpleUploadedFile('words.csv', content))
+        self.assertEqual(result['created_words'], 2)
+
+        with self.assertRaises(CSVImportError):
+            WordCSVImporter().import_from_file(SimpleUploadedFile('words.csv', content.decode('utf-8').encode('cp1251')))
+
+    def test_import_validates_header_and_short_rows(self):
+        """Тест проверки заголовка, пустых и коротких строк"""
+        with self.assertRaisesMessage(CSVImportError, 'level'):
+            WordCSVImporter().import_from_content(self.HEADER.replace(',level', ''))
+
+        content = self.HEADER.replace('part_of_speech', 'part_f_speech') + '\nen,ru,house,дом,,,noun\nen,ru,cat\n'
+        result = WordCSVImporter().import_from_content(content)
+        self.assertEqual(result['created_words'], 2)
+        self.assertEqual(result['errors'], ["Строка 3: Обязательные поля не могут быть пустыми"])
+
+    def test_admin_import_summarizes_long_error_lists(self):
+        """Тест сводного сообщения админки вместо сообщения на каждую ошибку"""
+        admin_user = get_user_model().objects.create_superuser(email='admin@example.com', password='password123')
+        self.client.force_login(admin_user)
+        rows = ''.join(f'en,xx,word{i},слово{i},,,noun,A1\n' for i in range(7))
+        upload = SimpleUploadedFile('words.csv', (self.HEADER + rows).encode('utf-8'))
+
+        response = self.client.post(reverse('admin:words_word_import_csv'), {'csv_file': upload})
+
+        errors = [m.message for m in get_messages(response.wsgi_request) if m.level_tag == 'error']
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith('Ошибок: 7, первые 5: '))
+
+    def test_copy_import_falls_back_to_bulk_insert_outside_postgresql(self):
+        """Тест того, что use_copy не ломает импорт на других СУБД"""
+        result = WordCSVImporter(use_copy=True).import_from_content(self.HEADER + 'en,ru,house,дом,,,noun,A1\n')
+        self.assertEqual((result['created_words'], WordTranslation.objects.count()), (2, 2))
+
+    def test_import_query_count_does_not_grow_with_rows(self):
+        """Тест того, что число запросов не зависит от числа строк"""
+        with CaptureQueriesContext(connection) as single:
+            WordCSVImporter().import_from_content(self.HEADER + 'en,ru,one,один,,,noun,A1\n')
+        rows = ''.join(f'en,ru,word{i},слово{i},,,noun,A1\n' for i in range(10))
+        with CaptureQueriesContext(connection) as many:
+            WordCSVImporter().import_from_content(self.HEADER + rows)
+
+        self.assertEqual(len(many.captured_queries), len(single.captured_queries))
+
+
+class CreateReverseTranslationsCommandTest(TestCase):
+    """Тесты для команды create_reverse_translations"""
+
+    @classmethod
+    def setUpTestData(cls):
+        english, russian = Language.objects.bulk_create([
+            Language(code='en', name_english='English', name_native='English'),
+            Language(code='ru', name_english='Russian', name_native='Русский'),
+        ])
+        noun = PartOfSpeech.objects.create(code='noun')
+        cls.words = {
+            text: Word.objects.create(word=text, language=language, part_of_speech=noun)
+            for text, language in [('cat', english), ('кошка', russian), ('dog', english), ('собака', russian)]
+        }
+        # Переводы без обратных, как после импорта в обход save()
+        WordTranslation.objects.bulk_create([
+            WordTranslation(source_word=cls.words['cat'], target_word=cls.words['кошка'], notes='cat'),
+            WordTranslation(source_word=cls.words['dog'], target_word=cls.words['собака']),
+            WordTranslation(source_word=cls.words['собака'], target_word=cls.words['dog']),
+        ])
+
+    def test_creates_only_missing_reverse_translations(self):
+        """Тест создания недостающих обратных переводов"""
+        call_command('create_reverse_translations', stdout=StringIO())
+
+        self.assertEqual(WordTranslation.objects.count(), 4)
+        reverse = WordTranslation.objects.get(source_word=self.words['кошка'], target_word=self.words['cat'])
+        self.assertEqual(reverse.notes, 'cat')
+
+    def test_dry_run_does_not_write(self):
+        """Тест режима предварительного просмотра"""
+        call_command('create_reverse_translations', '--dry-run', stdout=StringIO())
+
+        self.assertEqual(WordTranslation.objects.count(), 3)
+
+    def test_query_count_does_not_grow_with_translations(self):
+        """Тест того, что слова и языки не загружаются по одному"""
+        with CaptureQueriesContext(connection) as ctx:
+            call_command('create_reverse_translations', '--dry-run', stdout=StringIO())
+
+        self.assertEqual(len(ctx.captured_queries), 3)
@@ -1,15 +1,21 @@
+import random
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Exists, OuterRef
+from django.utils.cache import patch_cache_control
 from config.permissions import ReadOnlyForAllPermission
+from languages.cache import get_language_ids
+from .cache import get_word_stats, set_word_stats
 from .models import Word, WordTranslation, WordExample
 from .serializers import (
     WordSerializer,
     WordCreateUpdateSerializer,
     WordTranslationSerializer,
+    WordTranslationListSerializer,
     WordTranslationCreateSerializer,
     WordExampleSerializer,
     WordSimpleSerializer,
@@ -34,7 +40,8 @@ class WordViewSet(viewsets.ModelViewSet):
     permission_classes = [ReadOnlyForAllPermission]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['language', 'part_of_speech', 'gender', 'difficulty_level', 'active']
-    search_fields = ['word', 'transcription']
+    # Слово и транскрипция, одна колонка с одним триграммным индексом
+    search_fields = ['search_blob']
     ordering_fields = ['word', 'created_at']
     ordering = ['word']
     
@@ -46,24 +53,43 @@ class WordViewSet(viewsets.ModelViewSet):
             return WordSimpleSerializer
         return WordSerializer
     
+    # Действия, которые выводят слова через WordSerializer вместе с примерами и переводами
+    EAGER_LOADING_ACTIONS = ('list', 'retrieve', 'active', 'by_difficulty', 'search')
+
     def get_queryset(self):
-        """Оптимизированный queryset с prefetch_related"""
-        return Word.objects.select_related(
-            'language', 'part_of_speech'
-        ).prefetch_related(
-            'examples__translation_language',
-            'translations_as_source__target_word__language',
-            'translations_as_target__source_word__language'
-        ).all()
+        """Queryset с prefetch примеров и переводов только для действий, которые их выводят"""
+        # Часть речи выводится только как id и code, описание не загружается
+        queryset = Word.objects.select_related('language', 'part_of_speech').defer(
+            'part_of_speech__description', 'part_of_speech__enabled',
+            'part_of_speech__created_at', 'part_of_speech__updated_at'
+        )
+        if self.action in self.EAGER_LOADING_ACTIONS:
+            queryset = WordSerializer.setup_eager_loading(queryset)
+        return queryset
+    
+    def _paginated_response(self, queryset):
+        """
+        Ответ постранично, как у list: сериализуются и подгружают связи только слова текущей страницы.
+        """
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def simple(self, request):
         """
         Возвращает упрощенный список слов (только основные поля).
         """
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # Без prefetch переводов и примеров из get_queryset: упрощенному списку они не нужны.
+        # Поля плоские, поэтому строки берутся через values_list, а не через сериализатор
+        queryset = WordSimpleSerializer.values_queryset(self.filter_queryset(Word.objects.all()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(WordSimpleSerializer.rows_to_data(page))
+        return Response(WordSimpleSerializer.rows_to_data(queryset))
     
     @action(detail=True, methods=['get'])
     def translations(self, request, pk=None):
@@ -81,10 +107,19 @@ class WordViewSet(viewsets.ModelViewSet):
         Добавляет новый перевод для слова.
         """
         source_word = self.get_object()
-        data = request.data.copy()
-        data['source_word_id'] = source_word.id
-        
-        serializer = WordTranslationCreateSerializer(data=data)
+        serializer = WordTranslationCreateSerializer(data=request.data, context={'source_word': source_word})
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    @action(detail=False, methods=['post'])
+    def bulk_translations(self, request):
+        """
+        Добавляет список переводов одним запросом.
+        Обратные переводы создаются автоматически, уже существующие переводы пропускаются.
+        """
+        serializer = WordTranslationCreateSerializer(data=request.data, many=True)
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -118,9 +153,8 @@ class WordViewSet(viewsets.ModelViewSet):
         """
         Возвращает только активные слова.
         """
-        queryset = self.get_queryset().filter(active=True)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = self.get_queryset().filter(active=True).order_by('word')
+        return self._paginated_response(queryset)
     
     @action(detail=False, methods=['get'])
     def by_difficulty(self, request):
@@ -138,9 +172,8 @@ class WordViewSet(viewsets.ModelViewSet):
         queryset = self.get_queryset().filter(
             difficulty_level=difficulty_level,
             active=True
-        )
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        ).order_by('word')
+        return self._paginated_response(queryset)
     
     @action(detail=False, methods=['post'])
     def search(self, request):
@@ -154,17 +187,17 @@ class WordViewSet(viewsets.ModelViewSet):
         data = serializer.validated_data
         queryset = self.get_queryset()
         
-        # Поиск по тексту
+        # Поиск по слову и транскрипции одним условием, в PostgreSQL по триграммному индексу search_blob
         query = data.get('query')
         if query:
-            queryset = queryset.filter(
-                Q(word__icontains=query) | Q(transcription__icontains=query)
-            )
+            queryset = queryset.filter(search_blob__icontains=query)
         
         # Фильтр по языку
         language = data.get('language')
         if language:
-            queryset = queryset.filter(language__code=language)
+            # id языка из кэша, без JOIN с таблицей языков
+            language_id = get_language_ids().get(language)
+            queryset = queryset.filter(language_id=language_id) if language_id else queryset.none()
         
         # Фильтр по части речи
         part_of_speech = data.get('part_of_speech')
@@ -180,20 +213,29 @@ class WordViewSet(viewsets.ModelViewSet):
         if data.get('active_only', True):
             queryset = queryset.filter(active=True)
         
-        serializer = WordSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return self._paginated_response(queryset.order_by('word'))
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """
         Возвращает статистику по словам.
         """
-        total_words = Word.objects.count()
-        active_words = Word.objects.filter(active=True).count()
+        stats_data = get_word_stats()
+        if stats_data is not None:
+            return self._stats_response(stats_data)
+
+        # Скалярные счетчики одним запросом. Наличие примеров проверяется через EXISTS,
+        # чтобы JOIN с примерами не размножал строки для остальных счетчиков
+        counts = Word.objects.aggregate(
+            total_words=Count('id'),
+            active_words=Count('id', filter=Q(active=True)),
+            words_with_audio=Count('id', filter=~Q(audio_url='')),
+            words_with_examples=Count('id', filter=Q(Exists(WordExample.objects.filter(word=OuterRef('pk'))))),
+        )
         
-        # Статистика по языкам
+        # Статистика по языкам, группировка только по коду: название в ответ не попадает
         words_by_language = dict(
-            Word.objects.values('language__code', 'language__name_english')
+            Word.objects.values('language__code')
             .annotate(count=Count('id'))
             .values_list('language__code', 'count')
         )
@@ -212,21 +254,22 @@ class WordViewSet(viewsets.ModelViewSet):
             .values_list('difficulty_level', 'count')
         )
         
-        words_with_audio = Word.objects.exclude(audio_url='').count()
-        words_with_examples = Word.objects.filter(examples__isnull=False).distinct().count()
-        
         stats_data = {
-            'total_words': total_words,
-            'active_words': active_words,
+            **counts,
             'words_by_language': words_by_language,
             'words_by_part_of_speech': words_by_part_of_speech,
             'words_by_difficulty_level': words_by_difficulty_level,
-            'words_with_audio': words_with_audio,
-            'words_with_examples': words_with_examples,
         }
         
-        serializer = WordStatsSerializer(stats_data)
-        return Response(serializer.data)
+        stats_data = WordStatsSerializer(stats_data).data
+        set_word_stats(stats_data)
+        return self._stats_response(stats_data)
+
+    def _stats_response(self, stats_data):
+        response = Response(stats_data)
+        # Статистика меняется редко, браузеры и прокси могут отдавать ее сами
+        patch_cache_control(response, public=True, max_age=60)
+        return response
     
     @action(detail=False, methods=['get'])
     def random(self, request):
@@ -270,24 +313,34 @@ class WordViewSet(viewsets.ModelViewSet):
         elif count < 1:
             count = 1
         
-        # Строим базовый queryset
-        queryset = Word.objects.filter(
-            language__code=source_language,
-            active=True
-        ).select_related('language', 'part_of_speech')
-        
-        # Фильтруем по уровню сложности если указан
-        if difficulty_level:
-            queryset = queryset.filter(difficulty_level=difficulty_level)
-        
-        # Фильтруем только те слова, у которых есть переводы на целевой язык
-        queryset = queryset.filter(
-            translations_as_source__target_word__language__code=target_language,
-            translations_as_source__target_word__active=True
-        ).distinct()
-        
+        # id языков из кэша, чтобы фильтры не соединялись с таблицей языков.
+        # Неизвестный код языка дает тот же пустой результат и 404, что и язык без слов
+        language_ids = get_language_ids()
+        source_language_id = language_ids.get(source_language)
+        target_language_id = language_ids.get(target_language)
+        if source_language_id is None or target_language_id is None:
+            word_ids = []
+        else:
+            # Строим базовый queryset
+            queryset = Word.objects.filter(language_id=source_language_id, active=True)
+
+            # Фильтруем по уровню сложности если указан
+            if difficulty_level:
+                queryset = queryset.filter(difficulty_level=difficulty_level)
+
+            # Фильтруем только те слова, у которых есть переводы на целевой язык.
+            # EXISTS вместо JOIN не размножает строки, поэтому DISTINCT не нужен
+            queryset = queryset.filter(Exists(WordTranslation.objects.filter(
+                source_word=OuterRef('pk'),
+                target_word__language_id=target_language_id,
+                target_word__active=True
+            )))
+
+            # Список id служит и для проверки, есть ли слова, и для случайной выборки
+            word_ids = list(queryset.values_list('id', flat=True))
+
         # Проверяем, есть ли слова
-        total_words = queryset.count()
+        total_words = len(word_ids)
         if total_words == 0:
             return Response(
                 {
@@ -298,8 +351,12 @@ class WordViewSet(viewsets.ModelViewSet):
             )
         
         # Получаем случайные слова
-        # Используем order_by('?') для случайной выборки
-        random_words = queryset.order_by('?')[:count]
+        # id выбираются в Python, чтобы база не сортировала все подходящие строки по random()
+        chosen_ids = random.sample(word_ids, min(count, total_words))
+        words_by_id = WordRandomSerializer.setup_eager_loading(
+            Word.objects.all(), target_language
+        ).in_bulk(chosen_ids)
+        random_words = [words_by_id[word_id] for word_id in chosen_ids]
         
         # Сериализуем с контекстом для получения переводов
         serializer = WordRandomSerializer(
@@ -339,15 +396,17 @@ class WordTranslationViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Оптимизированный queryset с select_related"""
-        return WordTranslation.objects.select_related(
-            'source_word__language', 'target_word__language',
-            'source_word__part_of_speech', 'target_word__part_of_speech'
-        ).all()
+        if self.action == 'list':
+            return WordTranslation.objects.list_optimized()
+        # Сериализатор выводит слова как "слово (код языка)", части речи не нужны
+        return WordTranslation.objects.with_word_labels()
     
     def get_serializer_class(self):
         """Выбор сериализатора в зависимости от действия"""
         if self.action == 'create':
             return WordTranslationCreateSerializer
+        elif self.action == 'list':
+            return WordTranslationListSerializer
         return WordTranslationSerializer
 
 
@@ -371,6 +430,5 @@ class WordExampleViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Оптимизированный queryset с select_related"""
-        return WordExample.objects.select_related(
-            'word__language', 'translation_language'
-        ).all()
+        # Слово примера сериализатор не выводит, подгружается только язык перевода
+        return WordExample.objects.select_related('translation_language')